@@ -0,0 +1,83 @@
+"""Benchmark of the Monte Carlo tournament forecast.
+
+It simulates a half played round robin in one process and split between
+the processes of a pool (warmed up beforehand, as in a running server).
+
+Usage:
+    python -m benchmarks.forecast [--teams 64] [--simulations 100000] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from tournament_matchmaker.core.forecast.monte_carlo import TournamentState, simulate, simulate_parallel
+
+
+def make_state(teams: int, played_ratio: float, seed: int = 0) -> TournamentState:
+    """Function generating a round robin with a part of the matches played.
+
+    Args:
+        teams (int): The number of teams.
+        played_ratio (float): The part of the played matches.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        TournamentState: The tournament.
+    """
+    rng = np.random.default_rng(seed)
+    first, second = np.triu_indices(teams, 1)
+    played = rng.random(len(first)) < played_ratio
+    winners = np.where(rng.random(played.sum()) < 0.5, first[played], second[played])
+
+    return TournamentState(
+        wins=np.bincount(winners, minlength=teams),
+        tiebreak=np.arange(teams)[::-1].copy(),
+        rating=rng.normal(1500.0, 150.0, teams),
+        team1=first[~played],
+        team2=second[~played],
+    )
+
+
+async def run_parallel(state: TournamentState, simulations: int, workers: int) -> float:
+    """Function timing the simulations split between the processes of a warm pool."""
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        await simulate_parallel(executor, state, workers, workers)
+
+        start = time.perf_counter()
+        await simulate_parallel(executor, state, simulations, workers)
+        return time.perf_counter() - start
+    finally:
+        executor.shutdown()
+
+
+def main() -> None:
+    """Function running the benchmark and printing simulated matches/second."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.forecast")
+    parser.add_argument("--teams", type=int, default=64)
+    parser.add_argument("--played", type=float, default=0.5)
+    parser.add_argument("--simulations", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    state = make_state(args.teams, args.played)
+    matches = args.simulations * len(state.team1)
+
+    start = time.perf_counter()
+    simulate(state, args.simulations)
+    serial = time.perf_counter() - start
+
+    parallel = asyncio.run(run_parallel(state, args.simulations, args.workers))
+
+    print(f"{args.teams} teams, {len(state.team1):,} remaining matches, {args.simulations:,} simulations")
+    print(f"one process: {serial:.2f} s ({matches / serial:,.0f} matches/s)")
+    print(f"{args.workers} processes: {parallel:.2f} s ({matches / parallel:,.0f} matches/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark of the matchmaking queue.
+
+It fills the queue with players of random ranks, a part of whom leave
+before being matched, and reports the operations per second with the
+queue depth, showing that they do not depend on it.
+
+Usage:
+    python -m benchmarks.matchmaking_queue [--players 200000] [--ranks 20] [--team-size 5]
+"""
+
+import argparse
+import random
+import time
+
+from tournament_matchmaker.core.matchmaking.queue import MatchmakingQueue
+
+
+def main() -> None:
+    """Function running the benchmark and printing operations/second."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.matchmaking_queue")
+    parser.add_argument("--players", type=int, default=200_000)
+    parser.add_argument("--ranks", type=int, default=20)
+    parser.add_argument("--team-size", type=int, default=5)
+    parser.add_argument("--leave-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    ranks = [f"rank {i}" for i in range(args.ranks)]
+    queue = MatchmakingQueue(team_size=args.team_size)
+
+    # A queue of tens of thousands of players waiting in the background.
+    backlog = MatchmakingQueue(team_size=10 ** 9)
+    for player_id in range(args.players):
+        backlog.enqueue(player_id, rng.choice(ranks))
+
+    for name, subject in (("empty queue", queue), ("full queue", backlog)):
+        offset = 10 * args.players
+        teams = 0
+        start = time.perf_counter()
+        for player_id in range(offset, offset + args.players):
+            if subject.enqueue(player_id, rng.choice(ranks)):
+                teams += 1
+            if rng.random() < args.leave_ratio:
+                subject.remove(player_id - rng.randrange(1, 100))
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {args.players:,} enqueues in {elapsed:.2f} s "
+              f"({args.players / elapsed:,.0f}/s), {teams:,} teams, {len(subject):,} queued")
+
+
+if __name__ == "__main__":
+    main()
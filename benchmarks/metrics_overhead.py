@@ -0,0 +1,112 @@
+"""Benchmark of the overhead of the metrics instrumentation.
+
+It times a histogram observation, the recording of a query as done by
+the database for every call of a repository method, and a request to
+a trivial ASGI app with and without the metrics middleware.
+
+Usage:
+    python -m benchmarks.metrics_overhead [--iterations 200000] [--requests 50000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Callable
+
+from tournament_matchmaker.api.metrics import MetricsMiddleware
+from tournament_matchmaker.db import database
+from tournament_matchmaker.metrics import MetricsRegistry
+
+
+class BenchmarkRepository:
+    """A repository stand-in, named so that its queries are labeled by method."""
+
+    def get_by_id(self, iterations: int) -> float:
+        """The method recording a query, as the database does, many times.
+
+        Args:
+            iterations (int): The number of recorded queries.
+
+        Returns:
+            float: The time of all recordings in seconds.
+        """
+        start = time.perf_counter()
+        for _ in range(iterations):
+            database._observe(sys._getframe(), "fetch_one", time.perf_counter(), 1)
+
+        return time.perf_counter() - start
+
+
+async def endpoint(_scope: dict, _receive: Callable, send: Callable) -> None:
+    """A trivial ASGI app sending an empty response."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def time_requests(app: Callable, requests: int) -> float:
+    """Function calling the ASGI app directly, without a server.
+
+    Args:
+        app (Callable): The ASGI app.
+        requests (int): The number of requests.
+
+    Returns:
+        float: The time of all requests in seconds.
+    """
+
+    class Route:
+        path = "/benchmark/{id}"
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    async def send(_message: dict) -> None:
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app({"type": "http", "method": "GET", "route": Route}, receive, send)
+
+    return time.perf_counter() - start
+
+
+def per_op(total: float, count: int) -> float:
+    """Function converting the time of all operations to nanoseconds per operation."""
+    return total / count * 1e9
+
+
+def main() -> None:
+    """Function running the benchmark and printing the cost per operation."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.metrics_overhead")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=50_000)
+    args = parser.parse_args()
+
+    histogram = MetricsRegistry().histogram("benchmark_seconds", "Benchmark.", ("label",))
+    child = histogram.labels("value")
+    start = time.perf_counter()
+    for i in range(args.iterations):
+        child.observe(i * 1e-6)
+    observe = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(args.iterations):
+        histogram.labels("value").observe(i * 1e-6)
+    labeled = time.perf_counter() - start
+
+    query = BenchmarkRepository().get_by_id(args.iterations)
+
+    bare = asyncio.run(time_requests(endpoint, args.requests))
+    measured = asyncio.run(time_requests(MetricsMiddleware(endpoint, MetricsRegistry()), args.requests))
+
+    print(f"histogram observe: {per_op(observe, args.iterations):,.0f} ns")
+    print(f"labels + observe: {per_op(labeled, args.iterations):,.0f} ns")
+    print(f"query recording: {per_op(query, args.iterations):,.0f} ns")
+    print(f"request: {per_op(bare, args.requests):,.0f} ns bare, "
+          f"{per_op(measured, args.requests):,.0f} ns with middleware "
+          f"(+{per_op(measured - bare, args.requests):,.0f} ns)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark of the Elo rating engine.
+
+It replays a synthetic match history with the vectorized engine and,
+for comparison, a part of it with a plain Python loop rating one match
+at a time.
+
+Usage:
+    python -m benchmarks.rating_engine [--matches 2000000] [--teams 20000] [--days 1500]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tournament_matchmaker.core.rating.elo import (
+    INITIAL_RATING,
+    K_FACTOR,
+    SCALE,
+    MatchHistory,
+    compute_elo,
+)
+
+
+def make_history(matches: int, teams: int, days: int, seed: int = 0) -> MatchHistory:
+    """Function generating random played matches of distinct teams.
+
+    Args:
+        matches (int): The number of matches.
+        teams (int): The number of teams.
+        days (int): The number of match days.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        MatchHistory: The matches as arrays.
+    """
+    rng = np.random.default_rng(seed)
+    team1 = rng.integers(0, teams, matches)
+    team2 = (team1 + rng.integers(1, teams, matches)) % teams
+
+    return MatchHistory(
+        # The repository loads the history sorted by day.
+        match_day=np.sort(rng.integers(0, days, matches)),
+        team1_id=team1,
+        team2_id=team2,
+        team1_score=rng.integers(0, 5, matches),
+        team2_score=rng.integers(0, 5, matches),
+    )
+
+
+def python_elo(history: MatchHistory) -> dict:
+    """The baseline: ratings updated by a Python loop, one match at a time."""
+    ratings: dict = {}
+    order = sorted(range(len(history.match_day)), key=history.match_day.__getitem__)
+
+    for i in order:
+        home, away = int(history.team1_id[i]), int(history.team2_id[i])
+        home_rating = ratings.get(home, INITIAL_RATING)
+        away_rating = ratings.get(away, INITIAL_RATING)
+        diff = int(history.team1_score[i]) - int(history.team2_score[i])
+        score = 1.0 if diff > 0 else 0.5 if diff == 0 else 0.0
+        change = K_FACTOR * (score - 1.0 / (1.0 + 10.0 ** ((away_rating - home_rating) / SCALE)))
+        ratings[home] = home_rating + change
+        ratings[away] = away_rating - change
+
+    return ratings
+
+
+def main() -> None:
+    """Function running the benchmark and printing matches/second."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.rating_engine")
+    parser.add_argument("--matches", type=int, default=2_000_000)
+    parser.add_argument("--teams", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=1_500)
+    parser.add_argument("--baseline-matches", type=int, default=200_000)
+    args = parser.parse_args()
+
+    history = make_history(args.matches, args.teams, args.days)
+
+    start = time.perf_counter()
+    ratings = compute_elo(history)
+    vectorized = time.perf_counter() - start
+
+    baseline = MatchHistory(*(column[:args.baseline_matches] for column in history))
+    start = time.perf_counter()
+    python_elo(baseline)
+    looped = time.perf_counter() - start
+
+    print(f"vectorized: {args.matches:,} matches, {len(ratings.team_id):,} teams, "
+          f"{args.days:,} days in {vectorized:.2f} s ({args.matches / vectorized:,.0f} matches/s)")
+    print(f"python loop: {len(baseline.match_day):,} matches in {looped:.2f} s "
+          f"({len(baseline.match_day) / looped:,.0f} matches/s)")
+
+
+if __name__ == "__main__":
+    main()
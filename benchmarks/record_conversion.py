@@ -0,0 +1,141 @@
+"""Benchmark of converting DB records into domain models.
+
+It compares, for every domain type, the former conversion (copying the
+`databases` record into a dict, `.get` per field and keyword validation,
+then validating the response again) with the current one (raw record
+values validated by a precompiled `TypeAdapter`, serialized directly).
+
+Usage:
+    python -m benchmarks.record_conversion [--rows 50000]
+"""
+
+import argparse
+import datetime
+import time
+from typing import Any, Callable, List, Type
+
+from databases.backends.common.records import Record, create_column_maps
+from databases.backends.postgres import PostgresBackend
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Table, select
+
+from tournament_matchmaker.core.domains.match import Match
+from tournament_matchmaker.core.domains.player import Player
+from tournament_matchmaker.core.domains.team import Team
+from tournament_matchmaker.core.domains.tournament import Tournament
+from tournament_matchmaker.core.domains.tournament_team import TournamentTeam
+from tournament_matchmaker.db import (
+    match_table,
+    player_table,
+    team_table,
+    tournament_table,
+    tournament_team_table,
+)
+
+
+class FakeRow:
+    """A class imitating an asyncpg record (index and key access)."""
+
+    __slots__ = ("_values", "_index")
+
+    def __init__(self, values: dict) -> None:
+        self._values = tuple(values.values())
+        self._index = {key: i for i, key in enumerate(values)}
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._values[key if isinstance(key, int) else self._index[key]]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def keys(self) -> Any:
+        return self._index.keys()
+
+    def items(self) -> Any:
+        return zip(self._index, self._values)
+
+
+def make_records(table: Table, values: Callable[[int], dict], rows: int) -> List[Record]:
+    """A function building `databases` records the way its backend does.
+
+    Args:
+        table (Table): The table the records are read from.
+        values (Callable[[int], dict]): The factory of the row values.
+        rows (int): The number of records.
+
+    Returns:
+        List[Record]: The records.
+    """
+    dialect = PostgresBackend("postgresql://localhost/bench")._dialect
+    compiled = select(table).compile(dialect=dialect)
+    result_columns = compiled._result_columns
+    column_maps = create_column_maps(result_columns)
+
+    return [
+        Record(FakeRow(values(i)), result_columns, dialect, column_maps)
+        for i in range(rows)
+    ]
+
+
+def legacy_convert(model: Type[BaseModel], records: List[Record]) -> List[BaseModel]:
+    """The former conversion: dict copy, `.get` per field, keyword validation."""
+    converted = []
+    for record in records:
+        record_dict = dict(record)
+        converted.append(model(**{name: record_dict.get(name) for name in model.model_fields}))
+    return converted
+
+
+def legacy_respond(adapter: TypeAdapter, items: List[BaseModel]) -> bytes:
+    """The former response: dump, validate against `response_model`, serialize."""
+    return adapter.dump_json(adapter.validate_python([item.model_dump() for item in items]))
+
+
+def rate(rows: int, func: Callable[[], Any], repeat: int = 3) -> float:
+    """A function measuring the best throughput of a few runs in rows/s."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+CASES = [
+    (Team, team_table, lambda i: {"id": i, "name": f"team {i}"}),
+    (Player, player_table, lambda i: {"id": i, "name": f"player {i}", "rank": "gold", "team_id": i // 5 or None}),
+    (Tournament, tournament_table, lambda i: {
+        "id": i, "name": f"tournament {i}", "date": datetime.date(2024, 1, 1),
+        "max_teams_count": 16, "preffered_rank": "gold",
+        "teams_count": 16, "format": "round_robin",
+    }),
+    (Match, match_table, lambda i: {
+        "id": i, "tournament_id": i // 100, "team1_id": i % 97, "team2_id": i % 89,
+        "team1_score": 1, "team2_score": 0, "match_date": datetime.date(2024, 1, 1), "round": 1,
+    }),
+    (TournamentTeam, tournament_team_table, lambda i: {"tournament_id": i // 16, "team_id": i}),
+]
+
+
+def main() -> None:
+    """Function running the benchmark and printing rows/second per domain type."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.record_conversion")
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"{'model':<16}{'convert before':>16}{'convert after':>16}{'respond before':>16}{'respond after':>16}")
+    for model, table, values in CASES:
+        records = make_records(table, values, args.rows)
+        adapter = TypeAdapter(List[model])  # type: ignore
+        items = model.from_records(records)  # type: ignore
+        results = [
+            rate(args.rows, lambda: legacy_convert(model, records)),
+            rate(args.rows, lambda: model.from_records(records)),  # type: ignore
+            rate(args.rows, lambda: legacy_respond(adapter, items)),
+            rate(args.rows, lambda: adapter.dump_json(items)),
+        ]
+        print(f"{model.__name__:<16}" + "".join(f"{int(result):>16,}" for result in results))
+
+
+if __name__ == "__main__":
+    main()
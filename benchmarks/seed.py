@@ -0,0 +1,293 @@
+"""Generator of synthetic tournament data for benchmarks.
+
+It fills a throwaway database with teams, their players, round robin
+tournaments with registered teams and their fixtures, a part of which
+is played, and tournaments still recruiting. Every table is filled with
+a few bulk inserts of whole arrays, the triggers keep the team counts
+and the standings up to date as for any other insert.
+
+Usage:
+    python -m benchmarks.seed --reset [--teams 2000] [--players-per-team 5]
+        [--tournaments 100] [--open-tournaments 20] [--teams-per-tournament 16]
+        [--played-ratio 0.5] [--seed 0]
+"""
+
+import argparse
+import asyncio
+import datetime
+import time
+from typing import Any, NamedTuple, Sequence
+
+import numpy as np
+
+from tournament_matchmaker.core.formats.round_robin import circle_round
+from tournament_matchmaker.db import database, init_db
+
+RANKS = ("bronze", "silver", "gold", "platinum", "diamond")
+FIRST_DATE = datetime.date(2025, 1, 1)
+
+# The tables filled by the generator, truncated by `--reset`, the
+# children first.
+TABLES = (
+    "player",
+    "match",
+    "standings",
+    "bracket",
+    "tournament_team",
+    "team_rating",
+    "job",
+    "tournament",
+    "team",
+)
+
+
+class SeedConfig(NamedTuple):
+    """A class representing the sizes of the generated data."""
+    teams: int = 2_000
+    players_per_team: int = 5
+    tournaments: int = 100
+    open_tournaments: int = 20
+    teams_per_tournament: int = 16
+    played_ratio: float = 0.5
+    seed: int = 0
+
+
+class SeedSummary(NamedTuple):
+    """A class representing the ids of the generated data."""
+    team_ids: list[int]
+    tournament_ids: list[int]
+    open_tournament_ids: list[int]
+    players: int
+    matches: int
+
+
+async def insert_rows(
+        connection: Any,
+        table: str,
+        columns: dict[str, tuple[str, Sequence[Any]]],
+        returning: bool = False,
+) -> list[int]:
+    """Function inserting many rows with one statement of arrays.
+
+    Args:
+        connection (Any): The asyncpg connection.
+        table (str): The name of the table.
+        columns (dict[str, tuple[str, Sequence[Any]]]): The SQL type and
+            the values of every column by its name.
+        returning (bool, optional): Whether to return the ids of the rows.
+            Defaults to False.
+
+    Returns:
+        list[int]: The ids of the rows in the order of the values, if returned.
+    """
+    arrays = ", ".join(f"${i}::{sql_type}[]" for i, (sql_type, _) in enumerate(columns.values(), 1))
+    query = f"INSERT INTO {table} ({', '.join(columns)}) SELECT * FROM unnest({arrays})"
+    values = [list(column) for _, column in columns.values()]
+
+    if not returning:
+        await connection.execute(query, *values)
+        return []
+
+    # The ids are drawn from the sequence in the order of the values.
+    rows = await connection.fetch(f"{query} RETURNING id", *values)
+    return sorted(row["id"] for row in rows)
+
+
+async def reset(connection: Any) -> None:
+    """Function removing all generated data.
+
+    Args:
+        connection (Any): The asyncpg connection.
+    """
+    await connection.execute(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE")
+
+
+async def seed(connection: Any, config: SeedConfig) -> SeedSummary:
+    """Function generating the data in one transaction.
+
+    Args:
+        connection (Any): The asyncpg connection.
+        config (SeedConfig): The sizes of the data.
+
+    Returns:
+        SeedSummary: The ids of the generated teams and tournaments.
+    """
+    rng = np.random.default_rng(config.seed)
+    per_tournament = min(config.teams_per_tournament, config.teams)
+    tournaments = config.tournaments + config.open_tournaments
+
+    async with connection.transaction():
+        team_ids = await insert_rows(connection, "team", {
+            "name": ("text", [f"team {i}" for i in range(config.teams)]),
+        }, returning=True)
+
+        players = config.teams * config.players_per_team
+        await insert_rows(connection, "player", {
+            "name": ("text", [f"player {i}" for i in range(players)]),
+            "rank": ("text", [RANKS[i] for i in rng.integers(0, len(RANKS), players)]),
+            "team_id": ("int", np.repeat(team_ids, config.players_per_team).tolist()),
+        })
+
+        tournament_dates = [
+            FIRST_DATE + datetime.timedelta(days=int(day))
+            for day in rng.integers(0, 365, tournaments)
+        ]
+        tournament_ids = await insert_rows(connection, "tournament", {
+            "name": ("text", [f"tournament {i}" for i in range(tournaments)]),
+            "date": ("date", tournament_dates),
+            "max_teams_count": ("int", [per_tournament] * tournaments),
+            "preffered_rank": ("text", [RANKS[i] for i in rng.integers(0, len(RANKS), tournaments)]),
+        }, returning=True)
+        dates = dict(zip(tournament_ids, tournament_dates))
+
+        entries = {
+            tournament_id: rng.choice(team_ids, per_tournament, replace=False).tolist()
+            for tournament_id in tournament_ids
+        }
+        await insert_rows(connection, "tournament_team", {
+            "tournament_id": ("int", [t for t, teams in entries.items() for _ in teams]),
+            "team_id": ("int", [team for teams in entries.values() for team in teams]),
+        })
+
+        matches = _fixtures(rng, entries, dates, tournament_ids[:config.tournaments], config.played_ratio)
+        await insert_rows(connection, "match", {
+            column: (sql_type, [match[i] for match in matches])
+            for i, (column, sql_type) in enumerate((
+                ("tournament_id", "int"),
+                ("team1_id", "int"),
+                ("team2_id", "int"),
+                ("team1_score", "int"),
+                ("team2_score", "int"),
+                ("match_date", "date"),
+                ("round", "int"),
+            ))
+        })
+
+    return SeedSummary(
+        team_ids=team_ids,
+        tournament_ids=tournament_ids[:config.tournaments],
+        open_tournament_ids=tournament_ids[config.tournaments:],
+        players=players,
+        matches=len(matches),
+    )
+
+
+def _fixtures(
+        rng: np.random.Generator,
+        entries: dict[int, list[int]],
+        dates: dict[int, datetime.date],
+        tournament_ids: Sequence[int],
+        played_ratio: float,
+) -> list[tuple]:
+    """A private function generating the round robin matches of the tournaments.
+
+    The first rounds are played, the others are scheduled (0:0) a week apart.
+
+    Args:
+        rng (np.random.Generator): The random generator.
+        entries (dict[int, list[int]]): The teams by tournament ids.
+        dates (dict[int, datetime.date]): The dates of the tournaments.
+        tournament_ids (Sequence[int]): The ids of the tournaments with matches.
+        played_ratio (float): The part of the rounds which are played.
+
+    Returns:
+        list[tuple]: The column values of the matches.
+    """
+    matches = []
+    for tournament_id in tournament_ids:
+        teams = entries[tournament_id]
+        rounds = len(teams) - 1 + len(teams) % 2
+        played = int(rounds * played_ratio)
+
+        for round_index in range(rounds):
+            match_date = dates[tournament_id] + datetime.timedelta(weeks=round_index)
+            for home, away in circle_round(teams, round_index):
+                if round_index < played:
+                    # 0:0 marks a scheduled match, so played ones score.
+                    score1, score2 = (int(score) for score in rng.integers(0, 5, 2))
+                    score1 = score1 or int(not score2)
+                else:
+                    score1 = score2 = 0
+                matches.append((tournament_id, home, away, score1, score2, match_date, round_index + 1))
+
+    return matches
+
+
+async def generate(config: SeedConfig, clear: bool = False) -> SeedSummary:
+    """Function migrating the database and generating the data.
+
+    Args:
+        config (SeedConfig): The sizes of the data.
+        clear (bool, optional): Whether to remove all data first.
+            Defaults to False.
+
+    Returns:
+        SeedSummary: The ids of the generated teams and tournaments.
+    """
+    async with database.connection() as connection:
+        if clear:
+            await reset(connection.raw_connection)
+        return await seed(connection.raw_connection, config)
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Function adding the options of the generated data sizes to the parser.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser of the command line.
+    """
+    defaults = SeedConfig()
+    parser.add_argument("--teams", type=int, default=defaults.teams)
+    parser.add_argument("--players-per-team", type=int, default=defaults.players_per_team)
+    parser.add_argument("--tournaments", type=int, default=defaults.tournaments)
+    parser.add_argument("--open-tournaments", type=int, default=defaults.open_tournaments)
+    parser.add_argument("--teams-per-tournament", type=int, default=defaults.teams_per_tournament)
+    parser.add_argument("--played-ratio", type=float, default=defaults.played_ratio)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def config_from_args(args: argparse.Namespace) -> SeedConfig:
+    """Function reading the data sizes from the parsed command line.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        SeedConfig: The sizes of the data.
+    """
+    return SeedConfig(**{field: getattr(args, field) for field in SeedConfig._fields})
+
+
+async def run(config: SeedConfig, clear: bool) -> None:
+    """Function generating the data and printing its size and time.
+
+    Args:
+        config (SeedConfig): The sizes of the data.
+        clear (bool): Whether to remove all data first.
+    """
+    await init_db(retries=1)
+    try:
+        start = time.perf_counter()
+        summary = await generate(config, clear)
+        elapsed = time.perf_counter() - start
+    finally:
+        await database.disconnect()
+
+    print(f"{len(summary.team_ids):,} teams, {summary.players:,} players, "
+          f"{len(summary.tournament_ids) + len(summary.open_tournament_ids):,} tournaments, "
+          f"{summary.matches:,} matches in {elapsed:.2f} s")
+
+
+def main() -> None:
+    """Function parsing the command line and generating the data."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.seed")
+    parser.add_argument("--reset", action="store_true",
+                        help="remove all data first, only for a throwaway database")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    asyncio.run(run(config_from_args(args), args.reset))
+
+
+if __name__ == "__main__":
+    main()
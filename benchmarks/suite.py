@@ -0,0 +1,258 @@
+"""Benchmark suite of the key API paths over generated data.
+
+It resets the database, seeds it (see `benchmarks.seed`) and sends
+requests to the app in the process, through its ASGI interface, so no
+server or network takes part in the results. Every scenario reports
+latency percentiles, throughput and response statuses, all of them are
+written to a JSON file, which can be passed as `--baseline` to a later
+run to compare commits.
+
+Only for a throwaway database, all its data is removed.
+
+Usage:
+    python -m benchmarks.suite --reset [--requests 200] [--registrations 400]
+        [--concurrency 32] [--output benchmark.json] [--baseline previous.json]
+        [seed options, see benchmarks.seed]
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import subprocess
+import time
+from collections import Counter
+from itertools import cycle, islice
+from typing import Awaitable, Callable, Iterable
+
+import httpx
+import numpy as np
+
+from benchmarks.seed import add_config_arguments, config_from_args, generate
+from tournament_matchmaker.main import app, lifespan
+
+LISTINGS = ("team", "player", "tournament", "match", "tournament_team")
+
+Request = Callable[[httpx.AsyncClient], Awaitable[httpx.Response]]
+
+
+async def measure(
+        client: httpx.AsyncClient,
+        requests: Iterable[Request],
+        concurrency: int = 1,
+) -> dict:
+    """Function sending the requests by concurrent clients and timing them.
+
+    Args:
+        client (httpx.AsyncClient): The client of the app.
+        requests (Iterable[Request]): The functions sending a request each.
+        concurrency (int, optional): The number of requests in flight.
+            Defaults to 1.
+
+    Returns:
+        dict: The latency percentiles in milliseconds, the throughput and
+            the number of responses by status.
+    """
+    pending = iter(list(requests))
+    latencies: list[float] = []
+    statuses: Counter[int] = Counter()
+
+    async def worker() -> None:
+        for request in pending:
+            start = time.perf_counter()
+            response = await request(client)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    milliseconds = np.array(latencies) * 1000
+    p50, p95, p99 = np.percentile(milliseconds, (50, 95, 99)) if latencies else (0.0, 0.0, 0.0)
+
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "total_s": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(float(milliseconds.mean()), 3) if latencies else 0.0,
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(milliseconds.max()), 3) if latencies else 0.0,
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+def get(path: str) -> Request:
+    """Function making the request of the path.
+
+    Args:
+        path (str): The path of the GET request.
+
+    Returns:
+        Request: The function sending the request.
+    """
+    return lambda client: client.get(path)
+
+
+def post(path: str, body: dict | None = None) -> Request:
+    """Function making the request of the path with the JSON body.
+
+    Args:
+        path (str): The path of the POST request.
+        body (dict | None, optional): The body. Defaults to None.
+
+    Returns:
+        Request: The function sending the request.
+    """
+    return lambda client: client.post(path, json=body)
+
+
+async def registration(client: httpx.AsyncClient, team_ids: list[int], concurrency: int) -> dict:
+    """Function registering teams concurrently to a tournament of half their number.
+
+    Half of the registrations are refused (409), the number of the
+    registered teams is checked against the capacity afterwards.
+
+    Args:
+        client (httpx.AsyncClient): The client of the app.
+        team_ids (list[int]): The ids of the registered teams.
+        concurrency (int): The number of registrations in flight.
+
+    Returns:
+        dict: The results of `measure`, with the capacity and the
+            number of the registered teams.
+    """
+    capacity = len(team_ids) // 2
+    tournament = (await client.post("/tournament/create", json={
+        "name": "registration benchmark",
+        "date": datetime.date.today().isoformat(),
+        "max_teams_count": capacity,
+        "preffered_rank": "gold",
+    })).json()
+
+    result = await measure(client, (
+        post("/tournament_team/create", {"tournament_id": tournament["id"], "team_id": team_id})
+        for team_id in team_ids
+    ), concurrency)
+    registered = len((await client.get(f"/tournament_team/all/tournament_id/{tournament['id']}")).json())
+
+    return {**result, "capacity": capacity, "registered": registered}
+
+
+async def run_suite(args: argparse.Namespace) -> dict:
+    """Function seeding the database and timing every scenario.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        dict: The results of the scenarios by name, with the run details.
+    """
+    config = config_from_args(args)
+    results: dict[str, dict] = {}
+
+    async with lifespan(app):
+        start = time.perf_counter()
+        summary = await generate(config, clear=True)
+        seed_time = time.perf_counter() - start
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            results["end_recruiting"] = await measure(client, (
+                post(f"/tournament/end_recruiting/{tournament_id}")
+                for tournament_id in summary.open_tournament_ids
+            ))
+            results["get_winner"] = await measure(client, (
+                get(f"/tournament/get_winner/{tournament_id}")
+                for tournament_id in islice(cycle(summary.tournament_ids), args.requests)
+            ))
+            results["raport_summary"] = await measure(
+                client, [get("/raport/summary")] * args.requests,
+            )
+            for listing in LISTINGS:
+                results[f"{listing}_all"] = await measure(
+                    client, [get(f"/{listing}/all")] * args.requests,
+                )
+            results["registration"] = await registration(
+                client, summary.team_ids[:args.registrations], args.concurrency,
+            )
+
+    return {
+        "commit": _commit(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "seed": {**config._asdict(), "time_s": round(seed_time, 3), "matches": summary.matches},
+        "results": results,
+    }
+
+
+def compare(results: dict, baseline: dict) -> Iterable[str]:
+    """Function comparing the median latencies with the ones of a previous run.
+
+    Args:
+        results (dict): The results of this run.
+        baseline (dict): The results of the previous run.
+
+    Yields:
+        str: The line of every scenario of both runs.
+    """
+    yield f"compared with {baseline.get('commit') or 'baseline'}:"
+    for name, result in results["results"].items():
+        if previous := baseline["results"].get(name):
+            change = (result["p50_ms"] / previous["p50_ms"] - 1) * 100 if previous["p50_ms"] else 0.0
+            yield f"  {name}: p50 {previous['p50_ms']:.3f} -> {result['p50_ms']:.3f} ms ({change:+.1f}%)"
+
+
+def _commit() -> str | None:
+    """A private function getting the commit of the working tree, if any.
+
+    Returns:
+        str | None: The abbreviated hash of HEAD, None outside of git.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Function running the suite, printing and saving its results."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("--reset", action="store_true",
+                        help="confirm that all data of the database may be removed")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--registrations", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    if not args.reset:
+        parser.error("the suite removes all data of the database, confirm it with --reset")
+
+    results = asyncio.run(run_suite(args))
+
+    for name, result in results["results"].items():
+        print(f"{name}: {result['requests']} requests, p50 {result['p50_ms']:.3f} ms, "
+              f"p99 {result['p99_ms']:.3f} ms, {result['throughput_rps']:,.1f} req/s")
+
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            for line in compare(results, json.load(file)):
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark of the Swiss-system pairing.
+
+It plays a whole Swiss tournament with random results, pairing every
+round from the matches of the previous ones, checks that no two teams
+met twice and reports the pairing time per round, compared with the
+number of matches a full round robin would create.
+
+Usage:
+    python -m benchmarks.swiss_pairing [--teams 1024]
+"""
+
+import argparse
+import datetime
+import random
+import time
+
+from tournament_matchmaker.core.domains.match import Match
+from tournament_matchmaker.core.formats.swiss import SwissFormat
+
+
+def main() -> None:
+    """Function running the benchmark and printing the time of every round."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.swiss_pairing")
+    parser.add_argument("--teams", type=int, default=1024)
+    parser.add_argument("--rounds", type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    swiss = SwissFormat(rounds=args.rounds)
+    team_ids = list(range(1, args.teams + 1))
+    matches: list[Match] = []
+    met: set[frozenset] = set()
+    total = 0.0
+
+    for round_number in range(1, swiss.rounds(args.teams) + 1):
+        start = time.perf_counter()
+        pairings = swiss.next_round(team_ids, matches)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+
+        for pairing in pairings:
+            pair = frozenset(pairing)
+            assert pair not in met, f"rematch {sorted(pair)} in round {round_number}"
+            met.add(pair)
+            score1, score2 = rng.choice([(1, 0), (0, 1), (2, 1), (1, 2), (1, 1)])
+            matches.append(Match(
+                id=len(matches) + 1,
+                tournament_id=1,
+                team1_id=pairing.team1_id,
+                team2_id=pairing.team2_id,
+                team1_score=score1,
+                team2_score=score2,
+                match_date=datetime.date(2026, 1, 1),
+                round=round_number,
+            ))
+
+        print(f"round {round_number}: {len(pairings):,} matches paired in {elapsed * 1000:.1f} ms")
+
+    print(f"swiss: {args.teams:,} teams, {len(matches):,} matches, pairing {total * 1000:.1f} ms in total, "
+          f"no rematches (round robin: {args.teams * (args.teams - 1) // 2:,} matches)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""A module providing conditional GET handling with entity tags."""
+
+from fastapi import Response
+
+
+def etag_matches(if_none_match: str | None, etag: str, wildcard: bool = True) -> bool:
+    """Function checking whether the client already has the tagged data.
+
+    The tags are compared weakly, as `If-None-Match` requires.
+
+    Args:
+        if_none_match (str | None): The `If-None-Match` request header.
+        etag (str): The current entity tag.
+        wildcard (bool, optional): Whether `*` matches, False if the data
+            may not exist. Defaults to True.
+
+    Returns:
+        bool: Whether the data of the client is up to date.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return wildcard
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in if_none_match.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    """Function building the response telling the client data is up to date.
+
+    Args:
+        etag (str): The current entity tag.
+
+    Returns:
+        Response: The empty 304 response.
+    """
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,32 @@
+"""A module containing helpers for endpoints submitting background jobs."""
+
+from fastapi import HTTPException, Response
+
+from tournament_matchmaker.api.responses import json_response
+from tournament_matchmaker.core.domains.job import JobIn
+from tournament_matchmaker.core.services.i_job_service import IJobService
+
+
+async def submit_job(service: IJobService, data: JobIn) -> Response:
+    """A function queuing the job and pointing the client to its state.
+
+    Args:
+        service (IJobService): The job service.
+        data (JobIn): The work of the job.
+
+    Raises:
+        HTTPException: 503 if the queue of the jobs is full.
+
+    Returns:
+        Response: 202 with the queued job, `Location` telling where to poll it.
+    """
+
+    try:
+        job = await service.submit(data)
+    except ValueError:
+        raise HTTPException(status_code=503, detail="Job queue is full")
+
+    response = json_response(job, status_code=202)
+    response.headers["Location"] = f"/jobs/{job.id}"
+
+    return response
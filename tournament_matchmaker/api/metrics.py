@@ -0,0 +1,67 @@
+"""A module containing the middleware measuring request latency."""
+
+import time
+from typing import Any, Awaitable, Callable
+
+from tournament_matchmaker.metrics import MetricsRegistry, registry
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+
+
+class MetricsMiddleware:
+    """A class representing the ASGI middleware timing requests by route.
+
+    Requests are labeled by the path template of the matched route, so
+    the number of histograms is bounded by the number of endpoints. It
+    is a plain ASGI middleware, which, unlike `BaseHTTPMiddleware`, adds
+    no tasks or memory streams to a request.
+    """
+
+    def __init__(self, app: Callable, metrics: MetricsRegistry = registry) -> None:
+        """The initializer of the `metrics middleware`.
+
+        Args:
+            app (Callable): The wrapped ASGI app.
+            metrics (MetricsRegistry, optional): The registry of the
+                histograms. Defaults to the registry of the worker.
+        """
+        self.app = app
+        self._requests = metrics.histogram(
+            "http_request_duration_seconds",
+            "Time of handling requests by route.",
+            ("method", "route", "status"),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the request and recording its time.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The function receiving messages.
+            send (Send): The function sending messages.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope.
+            route = scope.get("route")
+            self._requests.labels(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            ).observe(time.perf_counter() - start)
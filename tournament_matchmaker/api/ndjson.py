@@ -0,0 +1,45 @@
+"""A module containing helpers for streaming NDJSON responses."""
+
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+NDJSON_BATCH_SIZE = 500
+
+
+async def _serialize(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """A generator serializing models to NDJSON lines in batches.
+
+    Args:
+        items (AsyncIterator[BaseModel]): The models to serialize.
+
+    Yields:
+        bytes: Chunks of up to `NDJSON_BATCH_SIZE` lines.
+    """
+
+    batch = []
+
+    async for item in items:
+        batch.append(item.model_dump_json())
+
+        if len(batch) >= NDJSON_BATCH_SIZE:
+            yield ("\n".join(batch) + "\n").encode()
+            batch.clear()
+
+    if batch:
+        yield ("\n".join(batch) + "\n").encode()
+
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """A function preparing a streaming NDJSON response.
+
+    Args:
+        items (AsyncIterator[BaseModel]): The models to stream.
+
+    Returns:
+        StreamingResponse: The response serializing models while they are fetched.
+    """
+
+    return StreamingResponse(_serialize(items), media_type=NDJSON_MEDIA_TYPE)
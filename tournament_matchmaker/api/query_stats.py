@@ -0,0 +1,148 @@
+"""A module containing the middleware counting the queries of requests."""
+
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Literal, Mapping
+
+from tournament_matchmaker.db import QueryStats, request_queries
+
+logger = logging.getLogger(__name__)
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict]]
+Send = Callable[[dict], Awaitable[None]]
+BudgetMode = Literal["off", "warn", "fail"]
+
+
+class QueryBudgetExceeded(Exception):
+    """An exception raised in the fail mode by requests over their query budget."""
+
+
+class QueryStatsMiddleware:
+    """A class representing the ASGI middleware counting the queries of requests.
+
+    The number and the total time of the queries are sent in the
+    `Server-Timing` header and logged as a JSON line with the route.
+    Routes running more queries than their budget, or the same
+    repository method many times (likely N+1), are warned about. In the
+    fail mode, meant for tests, a route over its budget raises after its
+    response, so the test client fails the test.
+    """
+
+    def __init__(
+            self,
+            app: Callable,
+            budget: int = 10,
+            budgets: Mapping[str, int] | None = None,
+            mode: BudgetMode = "warn",
+            repeat_threshold: int = 5,
+    ) -> None:
+        """The initializer of the `query stats middleware`.
+
+        Args:
+            app (Callable): The wrapped ASGI app.
+            budget (int, optional): The maximal number of queries of a
+                request. Defaults to 10.
+            budgets (Mapping[str, int] | None, optional): The budgets of
+                routes by path template, overriding `budget`. Defaults to None.
+            mode (BudgetMode, optional): What to do with requests over
+                budget. Defaults to "warn".
+            repeat_threshold (int, optional): The number of queries of one
+                repository method reported as N+1. Defaults to 5.
+        """
+        self.app = app
+        self._budget = budget
+        self._budgets = dict(budgets or {})
+        self._mode = mode
+        self._repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """A method handling the request and reporting its queries.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The function receiving messages.
+            send (Send): The function sending messages.
+
+        Raises:
+            QueryBudgetExceeded: In the fail mode, if the request ran more
+                queries than the budget of its route.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        stats = QueryStats()
+        token = request_queries.set(stats)
+        status = 500
+
+        async def send_with_timing(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", ()))
+                headers.append((b"server-timing", _server_timing(stats, time.perf_counter() - start)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_queries.reset(token)
+
+        self._report(scope, status, stats, time.perf_counter() - start)
+
+    def _report(self, scope: Scope, status: int, stats: QueryStats, duration: float) -> None:
+        """A private method logging the queries of the request, checking its budget.
+
+        Args:
+            scope (Scope): The connection scope.
+            status (int): The status of the response.
+            stats (QueryStats): The queries of the request.
+            duration (float): The time of the request in seconds.
+
+        Raises:
+            QueryBudgetExceeded: In the fail mode, if the request is over budget.
+        """
+        route = getattr(scope.get("route"), "path", "unmatched")
+        budget = self._budgets.get(route, self._budget)
+        repeated = stats.repeated(self._repeat_threshold)
+        line = json.dumps({
+            "method": scope["method"],
+            "route": route,
+            "status": status,
+            "queries": stats.count,
+            "db_ms": round(stats.time * 1000, 3),
+            "duration_ms": round(duration * 1000, 3),
+            "budget": budget,
+            "repeated": repeated,
+        })
+
+        over_budget = stats.count > budget
+        if self._mode == "off" or not (over_budget or repeated):
+            logger.info(line)
+            return
+
+        logger.warning(line)
+        if over_budget and self._mode == "fail":
+            raise QueryBudgetExceeded(
+                f"{scope['method']} {route} ran {stats.count} queries, the budget is {budget}"
+            )
+
+
+def _server_timing(stats: QueryStats, elapsed: float) -> bytes:
+    """A private function formatting the `Server-Timing` header.
+
+    Args:
+        stats (QueryStats): The queries run until the response started.
+        elapsed (float): The time until the response started in seconds.
+
+    Returns:
+        bytes: The header value with the database and the total time.
+    """
+    return (
+        f'db;dur={stats.time * 1000:.3f};desc="{stats.count} queries", '
+        f"app;dur={elapsed * 1000:.3f}"
+    ).encode("latin-1")
@@ -0,0 +1,29 @@
+"""A module containing helpers for building responses."""
+
+from fastapi import Response
+from pydantic import BaseModel
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(content: BaseModel, status_code: int = 200) -> Response:
+    """A function serializing a trusted model directly into a JSON response.
+
+    FastAPI validates whatever an endpoint returns against its
+    `response_model` once more before serializing it. Models built by the
+    repositories from our own database are valid already, so returning
+    a ready response skips that second validation.
+
+    Args:
+        content (BaseModel): The model to serialize.
+        status_code (int, optional): The response status. Defaults to 200.
+
+    Returns:
+        Response: The response with the serialized model.
+    """
+
+    return Response(
+        content=content.model_dump_json(),
+        media_type=JSON_MEDIA_TYPE,
+        status_code=status_code,
+    )
@@ -0,0 +1,75 @@
+"""A module containing background job endpoints."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException, Response
+
+from tournament_matchmaker.api.jobs import submit_job
+from tournament_matchmaker.container import Container
+from tournament_matchmaker.core.domains.job import ImportIn, Job, JobIn
+from tournament_matchmaker.core.services.i_job_service import IJobService
+
+router = APIRouter()
+
+
+@router.post("/import", response_model=Job, status_code=202)
+@inject
+async def import_teams(
+        data: ImportIn,
+        service: IJobService = Depends(Provide[Container.job_service]),
+) -> Response:
+    """An endpoint for importing teams with their players in the background.
+
+    Args:
+        data (ImportIn): The teams with their players.
+        service (IJobService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 503 if the queue of the jobs is full.
+
+    Returns:
+        Response: The queued job.
+    """
+
+    return await submit_job(service, JobIn(kind="import", params=data.model_dump()))
+
+
+@router.get("/stats", response_model=dict, status_code=200)
+@inject
+async def get_job_stats(
+        service: IJobService = Depends(Provide[Container.job_service]),
+) -> dict:
+    """An endpoint for getting the throughput of the job workers of this process.
+
+    Args:
+        service (IJobService, optional): The injected service dependency.
+
+    Returns:
+        dict: The workers, queued jobs and run times by job kind.
+    """
+
+    return service.get_stats()
+
+
+@router.get("/{job_id}", response_model=Job, status_code=200)
+@inject
+async def get_job_by_id(
+        job_id: int,
+        service: IJobService = Depends(Provide[Container.job_service]),
+) -> Job:
+    """An endpoint for polling the status and progress of the job.
+
+    Args:
+        job_id (int): The id of the job.
+        service (IJobService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if job does not exist.
+
+    Returns:
+        Job: The job details, with the result once finished.
+    """
+
+    if job := await service.get_by_id(job_id):
+        return job
+
+    raise HTTPException(status_code=404, detail="Job not found")
@@ -1,18 +1,71 @@
 """A module containing match endpoints."""
 
+import asyncio
+import datetime
 from typing import Iterable
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
+from tournament_matchmaker.api.etag import etag_matches, not_modified
+from tournament_matchmaker.api.ndjson import ndjson_response
+from tournament_matchmaker.api.responses import json_response
 from tournament_matchmaker.container import Container
+from tournament_matchmaker.core.domains.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
 from tournament_matchmaker.core.domains.match import Match, MatchIn
+from tournament_matchmaker.core.domains.tournament import Tournament
+from tournament_matchmaker.core.services.i_fixture_service import IFixtureService
 from tournament_matchmaker.core.services.i_match_service import IMatchService
 from tournament_matchmaker.core.services.i_team_service import ITeamService
 from tournament_matchmaker.core.services.i_tournament_service import ITournamentService
+from tournament_matchmaker.core.services.i_version_service import IVersionService
 
 router = APIRouter()
 
 
+async def _validate_references(
+        match: MatchIn,
+        tournament_service: ITournamentService,
+        team_service: ITeamService,
+) -> Tournament:
+    """A private function checking the tournament and teams of the match exist.
+
+    The tournament and both teams are looked up concurrently, the teams
+    with a single batch query.
+
+    Args:
+        match (MatchIn): The match data.
+        tournament_service (ITournamentService): The tournament service.
+        team_service (ITeamService): The team service.
+
+    Raises:
+        HTTPException: 404 if tournament does not exist.
+        HTTPException: 404 if team_1 does not exist.
+        HTTPException: 404 if team_2 does not exist.
+
+    Returns:
+        Tournament: The tournament of the match.
+    """
+
+    tournament, teams = await asyncio.gather(
+        tournament_service.get_by_id(match.tournament_id),
+        team_service.get_by_ids((match.team1_id, match.team2_id)),
+    )
+    team_ids = {team.id for team in teams}
+
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Given tournament not found")
+
+    if match.team1_id not in team_ids:
+        raise HTTPException(status_code=404, detail="Given team1 not found")
+
+    if match.team2_id not in team_ids:
+        raise HTTPException(status_code=404, detail="Given team2 not found")
+
+    return tournament
+
+
 @router.post("/create", response_model=Match, status_code=201)
 @inject
 async def create_match(
@@ -37,37 +90,103 @@ async def create_match(
         HTTPException: 404 if team_1 does not exist.
         HTTPException: 404 if team_2 does not exist.
     """
-    if not await tournament_service.get_by_id(match.tournament_id):
-        raise HTTPException(status_code=404, detail="Given tournament not found")
 
-    if not await team_service.get_by_id(match.team1_id):
-        raise HTTPException(status_code=404, detail="Given team1 not found")
-
-    if not await team_service.get_by_id(match.team2_id):
-        raise HTTPException(status_code=404, detail="Given team2 not found")
+    await _validate_references(match, tournament_service, team_service)
 
     new_match = await match_service.add_match(match)
 
     return new_match.model_dump() if new_match else {}
 
 
-@router.get("/all", response_model=Iterable[Match], status_code=200)
+@router.get("/all", response_model=Page[Match], status_code=200)
 @inject
 async def get_all_matches(
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
+        if_none_match: str | None = Header(default=None),
         service: IMatchService = Depends(Provide[Container.match_service]),
-) -> Iterable:
-    """An endpoint for getting all matches.
+        version_service: IVersionService = Depends(Provide[Container.version_service]),
+) -> Response:
+    """An endpoint for getting all matches page by page.
 
     Args:
+        limit (int, optional): The maximal number of matches on the page.
+        after (str | None, optional): The cursor returned with the previous page.
+        if_none_match (str | None, optional): The tags of the client's copies.
         service (IMatchService, optional): The injected service dependency.
+        version_service (IVersionService, optional): The injected version service dependency.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
 
     Returns:
-        Iterable: The match attributes collection.
+        Response: The match attributes collection with the cursor of the next page,
+            304 if not modified.
     """
 
-    matches = await service.get_all()
+    etag = await version_service.get_etag(("match",))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
 
-    return matches
+    try:
+        page = await service.get_page(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    response = json_response(page)
+    response.headers["ETag"] = etag
+
+    return response
+
+
+@router.get("/date/{match_date}", response_model=Page[Match], status_code=200)
+@inject
+async def get_matches_by_date(
+        match_date: datetime.date,
+        tournament_id: int | None = None,
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
+        service: IMatchService = Depends(Provide[Container.match_service]),
+) -> Response:
+    """An endpoint for getting matches played on the date page by page, e.g. today's matches.
+
+    Args:
+        match_date (datetime.date): The date of the matches.
+        tournament_id (int | None, optional): The id of the tournament to narrow the matches to.
+        limit (int, optional): The maximal number of matches on the page.
+        after (str | None, optional): The cursor returned with the previous page.
+        service (IMatchService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        Response: The matches of the date with the cursor of the next page.
+    """
+
+    try:
+        page = await service.get_page_by_date(match_date, limit, after, tournament_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return json_response(page)
+
+
+@router.get("/export.ndjson", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_matches(
+        service: IMatchService = Depends(Provide[Container.match_service]),
+) -> StreamingResponse:
+    """An endpoint for exporting all matches as newline delimited JSON.
+
+    Args:
+        service (IMatchService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The match attributes, one JSON document per line.
+    """
+
+    return ndjson_response(service.iterate_all())
 
 
 @router.get("/{match_id}",response_model=Match,status_code=200,)
@@ -100,46 +219,47 @@ async def get_match_by_id(
 async def update_match(
         match_id: int,
         updated_match: MatchIn,
-        match_service: IMatchService = Depends(Provide[Container.match_service]),
         tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
         team_service: ITeamService = Depends(Provide[Container.team_service]),
+        fixture_service: IFixtureService = Depends(Provide[Container.fixture_service]),
 ) -> dict:
     """An endpoint for updating match data.
 
+    The result of a bracket match moves its teams on in the same
+    transaction, creating the next matches which got both teams.
+
     Args:
         match_id (int): The id of the match.
         updated_match (MatchIn): The updated match details.
-        match_service (IMatchService, optional): The injected match service dependency.
         tournament_service (ITournamentService, optional): The injected tournament service dependency.
         team_service (ITeamService, optional): The injected team service dependency.
+        fixture_service (IFixtureService, optional): The injected fixture service dependency.
 
     Raises:
         HTTPException: 404 if match does not exist.
         HTTPException: 404 if tournament does not exist.
         HTTPException: 404 if team_1 does not exist.
         HTTPException: 404 if team_2 does not exist.
+        HTTPException: 409 if the match has decided its bracket node
+            and its teams or score would change.
 
     Returns:
         dict: The updated match details.
     """
 
+    tournament = await _validate_references(updated_match, tournament_service, team_service)
 
-
-    if await match_service.get_by_id(match_id=match_id):
-        if not await tournament_service.get_by_id(updated_match.tournament_id):
-            raise HTTPException(status_code=404, detail="Given tournament not found")
-
-        if not await team_service.get_by_id(updated_match.team1_id):
-            raise HTTPException(status_code=404, detail="Given team1 not found")
-
-        if not await team_service.get_by_id(updated_match.team2_id):
-            raise HTTPException(status_code=404, detail="Given team2 not found")
-
-        await match_service.update_match(
+    try:
+        match = await fixture_service.update_match(
             match_id=match_id,
             data=updated_match,
+            tournament=tournament,
         )
-        return {**updated_match.model_dump(), "id": match_id}
+    except ValueError:
+        raise HTTPException(status_code=409, detail="Match has decided its bracket node")
+
+    if match:
+        return match.model_dump()
 
     raise HTTPException(status_code=404, detail="Match not found")
 
@@ -160,9 +280,7 @@ async def delete_match(
         HTTPException: 404 if match does not exist.
     """
 
-    if await service.get_by_id(match_id=match_id):
-        await service.delete_match(match_id)
-
+    if await service.delete_match(match_id):
         return
 
     raise HTTPException(status_code=404, detail="Match not found")
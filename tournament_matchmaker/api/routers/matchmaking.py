@@ -0,0 +1,86 @@
+"""A module containing matchmaking endpoints."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from tournament_matchmaker.container import Container
+from tournament_matchmaker.core.domains.matchmaking import QueueTicket
+from tournament_matchmaker.core.services.i_matchmaking_service import IMatchmakingService
+from tournament_matchmaker.core.services.i_player_service import IPlayerService
+
+router = APIRouter()
+
+
+@router.post("/queue/{player_id}", response_model=QueueTicket, status_code=200)
+@inject
+async def enqueue_player(
+        player_id: int,
+        matchmaking_service: IMatchmakingService = Depends(Provide[Container.matchmaking_service]),
+        player_service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> QueueTicket:
+    """An endpoint for queuing a solo player for a team of its rank.
+
+    Args:
+        player_id (int): The id of the player.
+        matchmaking_service (IMatchmakingService, optional): The injected matchmaking service dependency.
+        player_service (IPlayerService, optional): The injected player service dependency.
+
+    Raises:
+        HTTPException: 404 if player does not exist.
+        HTTPException: 409 if player already has a team.
+        HTTPException: 409 if player is already queued.
+
+    Returns:
+        QueueTicket: The state of the player, with its new team if it was matched.
+    """
+
+    player = await player_service.get_by_id(player_id)
+    if not player:
+        raise HTTPException(status_code=404, detail="Player not found")
+
+    if player.team_id is not None:
+        raise HTTPException(status_code=409, detail="Player already has a team")
+
+    try:
+        return await matchmaking_service.enqueue(player)
+    except ValueError:
+        raise HTTPException(status_code=409, detail="Player already queued")
+
+
+@router.delete("/queue/{player_id}", status_code=204)
+@inject
+async def leave_queue(
+        player_id: int,
+        service: IMatchmakingService = Depends(Provide[Container.matchmaking_service]),
+) -> None:
+    """An endpoint for removing a player from the queue.
+
+    Args:
+        player_id (int): The id of the player.
+        service (IMatchmakingService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if player is not queued.
+    """
+
+    if service.leave(player_id):
+        return
+
+    raise HTTPException(status_code=404, detail="Player not queued")
+
+
+@router.get("/stats", response_model=dict, status_code=200)
+@inject
+async def get_queue_stats(
+        service: IMatchmakingService = Depends(Provide[Container.matchmaking_service]),
+) -> dict:
+    """An endpoint for getting the queue depth and the time-to-match statistics.
+
+    Args:
+        service (IMatchmakingService, optional): The injected service dependency.
+
+    Returns:
+        dict: The statistics of the queue of this worker.
+    """
+
+    return service.get_stats()
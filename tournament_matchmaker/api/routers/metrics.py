@@ -0,0 +1,18 @@
+"""A module containing the metrics endpoint."""
+
+from fastapi import APIRouter, Response
+
+from tournament_matchmaker.metrics import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+
+@router.get("", response_class=Response, status_code=200)
+async def get_metrics() -> Response:
+    """An endpoint for scraping the metrics of the worker.
+
+    Returns:
+        Response: The metrics in the Prometheus text format.
+    """
+
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
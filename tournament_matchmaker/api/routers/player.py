@@ -2,9 +2,13 @@
 
 from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
+from tournament_matchmaker.api.ndjson import ndjson_response
+from tournament_matchmaker.api.responses import json_response
 from tournament_matchmaker.container import Container
+from tournament_matchmaker.core.domains.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
 from tournament_matchmaker.core.domains.player import Player, PlayerIn
 from tournament_matchmaker.core.services.i_player_service import IPlayerService
 from tournament_matchmaker.core.services.i_team_service import ITeamService
@@ -47,23 +51,50 @@ async def create_player(
     return new_player.model_dump() if new_player else {}
 
 
-@router.get("/all", response_model=Iterable[Player], status_code=200)
+@router.get("/all", response_model=Page[Player], status_code=200)
 @inject
 async def get_all_players(
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
         service: IPlayerService = Depends(Provide[Container.player_service]),
-) -> Iterable:
-    """An endpoint for getting all players.
+) -> Response:
+    """An endpoint for getting all players page by page.
 
     Args:
+        limit (int, optional): The maximal number of players on the page.
+        after (str | None, optional): The cursor returned with the previous page.
         service (IPlayerService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
     Returns:
-        Iterable: The player attributes collection.
+        Response: The player attributes collection with the cursor of the next page.
     """
 
-    players = await service.get_all()
+    try:
+        page = await service.get_page(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return players
+    return json_response(page)
+
+
+@router.get("/export.ndjson", response_class=StreamingResponse, status_code=200)
+@inject
+async def export_players(
+        service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> StreamingResponse:
+    """An endpoint for exporting all players as newline delimited JSON.
+
+    Args:
+        service (IPlayerService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The player attributes, one JSON document per line.
+    """
+
+    return ndjson_response(service.iterate_all())
 
 
 @router.get("/{player_id}",response_model=Player,status_code=200,)
@@ -138,14 +169,14 @@ async def update_player(
         dict: The updated player details.
     """
 
-    if await player_service.get_by_id(player_id=player_id):
-        if not await team_service.get_by_id(updated_player.team_id):
-            raise HTTPException(status_code=404, detail="Given Team not found")
-        await player_service.update_player(
-            player_id=player_id,
-            data=updated_player,
-        )
-        return {**updated_player.model_dump(), "id": player_id}
+    if not await team_service.get_by_id(updated_player.team_id):
+        raise HTTPException(status_code=404, detail="Given Team not found")
+
+    if player := await player_service.update_player(
+        player_id=player_id,
+        data=updated_player,
+    ):
+        return player.model_dump()
 
     raise HTTPException(status_code=404, detail="Player not found")
 
@@ -166,9 +197,7 @@ async def delete_player(
         HTTPException: 404 if player does not exist.
     """
 
-    if await service.get_by_id(player_id=player_id):
-        await service.delete_player(player_id)
-
+    if await service.delete_player(player_id):
         return
 
     raise HTTPException(status_code=404, detail="Player not found")
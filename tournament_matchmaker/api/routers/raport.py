@@ -1,14 +1,15 @@
-from tournament_matchmaker.api.routers import tournament as tournament_router
-from tournament_matchmaker.core.services.i_tournament_service import ITournamentService
-from tournament_matchmaker.core.services.i_player_service import IPlayerService
+from tournament_matchmaker.core.services.i_raport_service import IRaportService
 from tournament_matchmaker.core.services.i_team_service import ITeamService
-from tournament_matchmaker.core.services.i_match_service import IMatchService
+from tournament_matchmaker.core.services.i_tournament_service import ITournamentService
 from tournament_matchmaker.core.services.i_tournament_team_service import ITournamentTeamService
+from tournament_matchmaker.core.services.i_version_service import IVersionService
 
 
 from dependency_injector.wiring import inject, Provide
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+
+from tournament_matchmaker.api.etag import etag_matches, not_modified
 
 from tournament_matchmaker.container import Container
 
@@ -17,51 +18,95 @@ router = APIRouter()
 @router.get(path="/summary", response_model=dict, status_code=200)
 @inject
 async def generate_summary(
-        tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
-        player_service: IPlayerService = Depends(Provide[Container.player_service]),
-        team_service: ITeamService = Depends(Provide[Container.team_service]),
-        match_service: IMatchService = Depends(Provide[Container.match_service])
+        approximate: bool = False,
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
 ) -> dict:
     """An endpoint for generating report.
 
+    Args:
+        approximate (bool, optional): Whether to return the fast planner
+            estimates instead of exact counts. Defaults to False.
+        raport_service (IRaportService): The injected raport service dependency.
+
     Returns:
         dict: The summary of the whole system.
     """
-    return {
-        "total_tournaments": len(await tournament_service.get_all()),
-        "total_players": len(await player_service.get_all()),
-        "total_teams": len(await team_service.get_all()),
-        "total_matches": len(await match_service.get_all()),
-    }
+    return await raport_service.get_summary(approximate)
+
+@router.get(path="/pool", response_model=dict, status_code=200)
+@inject
+async def get_pool_stats(
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
+) -> dict:
+    """An endpoint for getting statistics of the database connection pool.
+
+    Args:
+        raport_service (IRaportService): The injected raport service dependency.
+
+    Returns:
+        dict: The pool limits, usage and acquisition wait times.
+    """
+    return raport_service.get_pool_stats()
+
+@router.get(path="/cache", response_model=dict, status_code=200)
+@inject
+async def get_cache_stats(
+        raport_service: IRaportService = Depends(Provide[Container.raport_service]),
+) -> dict:
+    """An endpoint for getting hit and miss statistics of the entity caches.
+
+    Args:
+        raport_service (IRaportService): The injected raport service dependency.
+
+    Returns:
+        dict: The statistics of every cache by entity type.
+    """
+    return raport_service.get_cache_stats()
 
 @router.get(path="/summary/{tournament_id}", response_model=dict, status_code=200)
 @inject
 async def generate_tournament_summary(
         tournament_id: int,
+        response: Response,
+        if_none_match: str | None = Header(default=None),
         tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
-        tournament_team_service: ITournamentTeamService = Depends(Provide[Container.tournament_team_service])
-) -> dict:
+        tournament_team_service: ITournamentTeamService = Depends(Provide[Container.tournament_team_service]),
+        team_service: ITeamService = Depends(Provide[Container.team_service]),
+        version_service: IVersionService = Depends(Provide[Container.version_service]),
+) -> dict | Response:
     """An endpoint for generating tournament summary.
 
     Args:
         tournament_id (int): The id of the tournament.
-
+        response (Response): The response getting the `ETag` header.
+        if_none_match (str | None, optional): The tags of the client's copies.
         tournament_service (ITournamentService): The injected tournament service dependency.
         tournament_team_service (ITournamentTeamService): The injected tournament_team service dependency.
+        team_service (ITeamService): The injected team service dependency.
+        version_service (IVersionService): The injected version service dependency.
 
     Raises:
         HTTPException: 404 if team does not exist.
 
     Returns:
-        dict: The summary of the selected tournament
+        dict | Response: The summary of the selected tournament, 304 if not modified.
     """
-    tournament = await tournament_service.get_by_id(tournament_id)
+    # The tag names the tournament and a delete changes the version, so
+    # a matching tag proves the tournament exists without fetching it.
+    etag = await version_service.get_etag(
+        ("tournament", "tournament_team", "team", "match"),
+        resource=f"summary-{tournament_id}",
+    )
+    if etag_matches(if_none_match, etag, wildcard=False):
+        return not_modified(etag)
 
-    if tournament:
-        return {
-            "tournament_name": tournament.name,
-            "number_of_participating_teams": len(await tournament_team_service.get_all_by_tournament_id(tournament_id)),
-            "winner_team": await tournament_router.get_winner(tournament_id)
-        }
+    tournament = await tournament_service.get_by_id(tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
 
-    raise HTTPException(status_code=404, detail="Tournament not found")
+    response.headers["ETag"] = etag
+    return {
+        "tournament_name": tournament.name,
+        "number_of_participating_teams": len(await tournament_team_service.get_all_by_tournament_id(tournament_id)),
+        "winner_team": await team_service.get_tournament_winner(tournament_id) or {},
+    }
@@ -0,0 +1,68 @@
+"""A module containing rating endpoints."""
+
+from typing import Iterable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, Query, Response
+
+from tournament_matchmaker.api.jobs import submit_job
+from tournament_matchmaker.container import Container
+from tournament_matchmaker.core.domains.job import Job, JobIn
+from tournament_matchmaker.core.domains.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from tournament_matchmaker.core.domains.rating import TeamRating
+from tournament_matchmaker.core.services.i_job_service import IJobService
+from tournament_matchmaker.core.services.i_rating_service import IRatingService
+
+router = APIRouter()
+
+
+@router.get("/leaderboard", response_model=Iterable[TeamRating], status_code=200)
+@inject
+async def get_leaderboard(
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        service: IRatingService = Depends(Provide[Container.rating_service]),
+) -> Iterable[TeamRating]:
+    """An endpoint for getting the best rated teams.
+
+    Args:
+        limit (int, optional): The maximal number of teams.
+        service (IRatingService, optional): The injected service dependency.
+
+    Returns:
+        Iterable[TeamRating]: The ratings, the best first.
+    """
+
+    return await service.get_leaderboard(limit)
+
+
+@router.post(
+    "/recompute",
+    response_model=dict,
+    status_code=200,
+    responses={202: {"model": Job, "description": "The job recomputing the ratings"}},
+)
+@inject
+async def recompute_ratings(
+        background: bool = False,
+        service: IRatingService = Depends(Provide[Container.rating_service]),
+        job_service: IJobService = Depends(Provide[Container.job_service]),
+) -> dict | Response:
+    """An endpoint for recomputing ratings of all teams from the match history.
+
+    Args:
+        background (bool, optional): Whether to recompute the ratings by a job.
+        service (IRatingService, optional): The injected service dependency.
+        job_service (IJobService, optional): The injected job service dependency.
+
+    Raises:
+        HTTPException: 503 if the queue of the jobs is full.
+
+    Returns:
+        dict | Response: The number of rated teams, 202 with the job if
+            run in the background.
+    """
+
+    if background:
+        return await submit_job(job_service, JobIn(kind="recompute_ratings"))
+
+    return {"rated_teams": await service.recompute()}
@@ -1,11 +1,17 @@
 """A module containing team endpoints."""
 
-from typing import Iterable
+import asyncio
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
+from tournament_matchmaker.api.responses import json_response
 from tournament_matchmaker.container import Container
+from tournament_matchmaker.core.domains.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from tournament_matchmaker.core.domains.rating import TeamRating
+from tournament_matchmaker.core.rating.elo import INITIAL_RATING
 from tournament_matchmaker.core.domains.team import Team, TeamIn
+from tournament_matchmaker.core.services.i_rating_service import IRatingService
 from tournament_matchmaker.core.services.i_team_service import ITeamService
 
 router = APIRouter()
@@ -32,23 +38,33 @@ async def create_team(
     return new_team.model_dump() if new_team else {}
 
 
-@router.get("/all", response_model=Iterable[Team], status_code=200)
+@router.get("/all", response_model=Page[Team], status_code=200)
 @inject
 async def get_all_teams(
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
         service: ITeamService = Depends(Provide[Container.team_service]),
-) -> Iterable:
-    """An endpoint for getting all teams.
+) -> Response:
+    """An endpoint for getting all teams page by page.
 
     Args:
+        limit (int, optional): The maximal number of teams on the page.
+        after (str | None, optional): The cursor returned with the previous page.
         service (ITeamService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
     Returns:
-        Iterable[Team]: The team attributes collection.
+        Response: The team attributes collection with the cursor of the next page.
     """
 
-    teams = await service.get_all()
+    try:
+        page = await service.get_page(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return teams
+    return json_response(page)
 
 
 @router.get("/{team_id}",response_model=Team,status_code=200,)
@@ -73,6 +89,38 @@ async def get_team_by_id(
     raise HTTPException(status_code=404, detail="Team not found")
 
 
+@router.get("/{team_id}/rating", response_model=TeamRating, status_code=200)
+@inject
+async def get_team_rating(
+        team_id: int,
+        team_service: ITeamService = Depends(Provide[Container.team_service]),
+        rating_service: IRatingService = Depends(Provide[Container.rating_service]),
+) -> TeamRating:
+    """An endpoint for getting the Elo rating of the team.
+
+    Args:
+        team_id (int): The id of the team.
+        team_service (ITeamService, optional): The injected team service dependency.
+        rating_service (IRatingService, optional): The injected rating service dependency.
+
+    Returns:
+        TeamRating: The rating of the team, the initial one if it was not rated.
+
+    Raises:
+        HTTPException: 404 if team does not exist.
+    """
+
+    team, rating = await asyncio.gather(
+        team_service.get_by_id(team_id),
+        rating_service.get_by_team_id(team_id),
+    )
+
+    if not team:
+        raise HTTPException(status_code=404, detail="Team not found")
+
+    return rating or TeamRating(team_id=team_id, rating=INITIAL_RATING, matches=0)
+
+
 @router.put("/{team_id}", response_model=Team, status_code=201)
 @inject
 async def update_team(
@@ -94,12 +142,11 @@ async def update_team(
         dict: The updated team details.
     """
 
-    if await service.get_by_id(team_id=team_id):
-        await service.update_team(
-            team_id=team_id,
-            data=updated_team,
-        )
-        return {**updated_team.model_dump(), "id": team_id}
+    if team := await service.update_team(
+        team_id=team_id,
+        data=updated_team,
+    ):
+        return team.model_dump()
 
     raise HTTPException(status_code=404, detail="Team not found")
 
@@ -120,9 +167,7 @@ async def delete_team(
         HTTPException: 404 if team does not exist.
     """
 
-    if await service.get_by_id(team_id=team_id):
-        await service.delete_team(team_id)
-
+    if await service.delete_team(team_id):
         return
 
     raise HTTPException(status_code=404, detail="Team not found")
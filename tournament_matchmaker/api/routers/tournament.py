@@ -1,19 +1,30 @@
 """A module containing tournament endpoints."""
-from datetime import datetime
-from itertools import combinations
-
+import asyncio
+from datetime import date, datetime
 from typing import Iterable
+
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
+from tournament_matchmaker.api.etag import etag_matches, not_modified
+from tournament_matchmaker.api.jobs import submit_job
+from tournament_matchmaker.api.responses import json_response
 from tournament_matchmaker.container import Container
-from tournament_matchmaker.core.domains.match import MatchIn
+from tournament_matchmaker.core.domains.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from tournament_matchmaker.core.domains.bracket import BracketView
+from tournament_matchmaker.core.domains.forecast import Forecast
+from tournament_matchmaker.core.domains.job import Job, JobIn
+from tournament_matchmaker.core.domains.match import Match
+from tournament_matchmaker.core.domains.standing import Standing
 from tournament_matchmaker.core.domains.team import Team
 from tournament_matchmaker.core.domains.tournament import Tournament, TournamentIn
-from tournament_matchmaker.core.services.i_match_service import IMatchService
+from tournament_matchmaker.core.services.i_fixture_service import IFixtureService
+from tournament_matchmaker.core.services.i_forecast_service import IForecastService
+from tournament_matchmaker.core.services.i_job_service import IJobService
+from tournament_matchmaker.core.services.i_standings_service import IStandingsService
 from tournament_matchmaker.core.services.i_tournament_service import ITournamentService
-from tournament_matchmaker.core.services.i_tournament_team_service import ITournamentTeamService
 from tournament_matchmaker.core.services.i_team_service import ITeamService
+from tournament_matchmaker.core.services.i_version_service import IVersionService
 
 router = APIRouter()
 
@@ -39,49 +50,105 @@ async def create_tournament(
     return new_tournament.model_dump() if new_tournament else {}
 
 
-@router.get("/all", response_model=Iterable[Tournament], status_code=200)
+@router.get("/all", response_model=Page[Tournament], status_code=200)
 @inject
 async def get_all_tournaments(
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
         service: ITournamentService = Depends(Provide[Container.tournament_service]),
-) -> Iterable:
-    """An endpoint for getting all tournaments.
+) -> Response:
+    """An endpoint for getting all tournaments page by page.
 
     Args:
+        limit (int, optional): The maximal number of tournaments on the page.
+        after (str | None, optional): The cursor returned with the previous page.
         service (ITournamentService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
     Returns:
-        Iterable: The tournament attributes collection.
+        Response: The tournament attributes collection with the cursor of the next page.
     """
 
-    tournaments = await service.get_all()
+    try:
+        page = await service.get_page(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return tournaments
+    return json_response(page)
 
 
 @router.get("/{tournament_id}",response_model=Tournament,status_code=200,)
 @inject
 async def get_tournament_by_id(
         tournament_id: int,
+        response: Response,
+        if_none_match: str | None = Header(default=None),
         service: ITournamentService = Depends(Provide[Container.tournament_service]),
-) -> dict | None:
+        version_service: IVersionService = Depends(Provide[Container.version_service]),
+) -> dict | Response | None:
     """An endpoint for getting tournament by id.
 
     Args:
         tournament_id (int): The id of the tournament.
+        response (Response): The response getting the `ETag` header.
+        if_none_match (str | None, optional): The tags of the client's copies.
         service (ITournamentService, optional): The injected service dependency.
+        version_service (IVersionService, optional): The injected version service dependency.
 
     Returns:
-        dict | None: The tournament details.
+        dict | Response | None: The tournament details, 304 if not modified.
 
     Raises:
         HTTPException: 404 if tournament does not exist.
 
     """
 
-    if tournament := await service.get_by_id(tournament_id):
-        return tournament
+    # The tag names the tournament and a delete changes the version, so
+    # a matching tag proves the tournament exists without fetching it.
+    etag = await version_service.get_etag(("tournament",), resource=f"tournament-{tournament_id}")
+    if etag_matches(if_none_match, etag, wildcard=False):
+        return not_modified(etag)
 
-    raise HTTPException(status_code=404, detail="Tournament not found")
+    tournament = await service.get_by_id(tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    response.headers["ETag"] = etag
+    return tournament
+
+
+@router.get("/{tournament_id}/standings", response_model=Iterable[Standing], status_code=200)
+@inject
+async def get_tournament_standings(
+        tournament_id: int,
+        tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
+        standings_service: IStandingsService = Depends(Provide[Container.standings_service]),
+) -> Iterable[Standing]:
+    """An endpoint for getting standings of the tournament, best team first.
+
+    Args:
+        tournament_id (int): The id of the tournament.
+        tournament_service (ITournamentService, optional): The injected tournament service dependency.
+        standings_service (IStandingsService, optional): The injected standings service dependency.
+
+    Returns:
+        Iterable[Standing]: The standings of teams which played in the tournament.
+
+    Raises:
+        HTTPException: 404 if tournament does not exist.
+    """
+
+    tournament, standings = await asyncio.gather(
+        tournament_service.get_by_id(tournament_id),
+        standings_service.get_by_tournament_id(tournament_id),
+    )
+
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    return standings
 
 
 @router.put("/{tournament_id}", response_model=Tournament, status_code=201)
@@ -100,17 +167,20 @@ async def update_tournament(
 
     Raises:
         HTTPException: 404 if tournament does not exist.
+        HTTPException: 409 if the format would change after its matches.
 
     Returns:
         dict: The updated tournament details.
     """
 
-    if await service.get_by_id(tournament_id=tournament_id):
-        await service.update_tournament(
-            tournament_id=tournament_id,
-            data=updated_tournament,
-        )
-        return {**updated_tournament.model_dump(), "id": tournament_id}
+    if tournament := await service.update_tournament(
+        tournament_id=tournament_id,
+        data=updated_tournament,
+    ):
+        return tournament.model_dump()
+
+    if await service.get_by_id(tournament_id):
+        raise HTTPException(status_code=409, detail="Tournament has matches, its format cannot change")
 
     raise HTTPException(status_code=404, detail="Tournament not found")
 
@@ -131,54 +201,188 @@ async def delete_tournament(
         HTTPException: 404 if tournament does not exist.
     """
 
-    if await service.get_by_id(tournament_id=tournament_id):
-        await service.delete_tournament(tournament_id)
-
+    if await service.delete_tournament(tournament_id):
         return
 
     raise HTTPException(status_code=404, detail="Tournament not found")
 
-@router.post("/end_recruiting/{tournament_id}", status_code=204)
+@router.post(
+    "/end_recruiting/{tournament_id}",
+    response_model=None,
+    status_code=204,
+    responses={202: {"model": Job, "description": "The job generating the round"}},
+)
 @inject
 async def end_recruiting(
         tournament_id: int,
+        background: bool = False,
         tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
-        tournament_team_service: ITournamentTeamService = Depends(Provide[Container.tournament_team_service]),
-        match_service: IMatchService = Depends(Provide[Container.match_service]),
-) -> None:
+        fixture_service: IFixtureService = Depends(Provide[Container.fixture_service]),
+        job_service: IJobService = Depends(Provide[Container.job_service]),
+) -> Response | None:
     """An endpoint for ending recruitment for the tournament.
 
+    The first round is generated by the format of the tournament, the
+    first pairings for round robin and Swiss, the seeded bracket for
+    elimination. In the background the round is generated by a job,
+    polled at `/jobs/{id}`.
+
+    Args:
+        tournament_id (int): The id of the tournament.
+        background (bool, optional): Whether to generate the round by a job.
+        tournament_service (ITournamentService): The injected tournament service dependency.
+        fixture_service (IFixtureService): The injected fixture service dependency.
+        job_service (IJobService): The injected job service dependency.
+
+    Raises:
+        HTTPException: 404 if tournament does not exist.
+        HTTPException: 503 if the queue of the jobs is full.
+
+    Returns:
+        Response | None: 202 with the job if run in the background.
+    """
+    tournament = await tournament_service.get_by_id(tournament_id)
+
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    if background:
+        return await submit_job(
+            job_service,
+            JobIn(kind="end_recruiting", params={"tournament_id": tournament_id}),
+        )
+
+    await fixture_service.start(tournament)
+
+
+@router.post("/{tournament_id}/next_round", response_model=Iterable[Match], status_code=201)
+@inject
+async def next_round(
+        tournament_id: int,
+        tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
+        fixture_service: IFixtureService = Depends(Provide[Container.fixture_service]),
+) -> Iterable[Match]:
+    """An endpoint for generating the next round of the tournament from its results.
+
+    Args:
+        tournament_id (int): The id of the tournament.
+        tournament_service (ITournamentService): The injected tournament service dependency.
+        fixture_service (IFixtureService): The injected fixture service dependency.
+
+    Raises:
+        HTTPException: 404 if tournament does not exist.
+        HTTPException: 409 if the latest round is not finished.
+        HTTPException: 409 if there are no more rounds.
+
+    Returns:
+        Iterable[Match]: The matches of the new round.
+    """
+    tournament = await tournament_service.get_by_id(tournament_id)
+
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    try:
+        matches = await fixture_service.next_round(tournament)
+    except ValueError:
+        raise HTTPException(status_code=409, detail="Round not finished")
+
+    if not matches:
+        raise HTTPException(status_code=409, detail="No more rounds")
+
+    return matches
+
+@router.post("/{tournament_id}/schedule", response_model=Iterable[Match], status_code=201)
+@inject
+async def schedule_rounds(
+        tournament_id: int,
+        until: date,
+        tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
+        fixture_service: IFixtureService = Depends(Provide[Container.fixture_service]),
+) -> Iterable[Match]:
+    """An endpoint for generating the missing rounds of the tournament up to the date.
+
     Args:
         tournament_id (int): The id of the tournament.
+        until (date): The date of the last round to generate.
         tournament_service (ITournamentService): The injected tournament service dependency.
-        tournament_team_service (ITournamentTeamService): The injected tournament team service dependency.
-        match_service (IMatchService): The injected match service dependency.
+        fixture_service (IFixtureService): The injected fixture service dependency.
+
+    Raises:
+        HTTPException: 404 if tournament does not exist.
+        HTTPException: 409 if the rounds of the format depend on results.
 
+    Returns:
+        Iterable[Match]: The matches of the new rounds.
     """
     tournament = await tournament_service.get_by_id(tournament_id)
-    tournament_teams = await tournament_team_service.get_all_by_tournament_id(tournament.id)
-    team_ids = [
-        team.team_id for team in tournament_teams
-    ]
-
-    unique_combinations = combinations(team_ids, 2)
-
-    for combination in unique_combinations:
-        await match_service.add_match(MatchIn(
-            tournament_id=tournament.id,
-            team1_id=combination[0],
-            team2_id=combination[1],
-            team1_score=0,
-            team2_score=0,
-            match_date=tournament.date,
-        ))
+
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    try:
+        return await fixture_service.schedule(tournament, until)
+    except ValueError:
+        raise HTTPException(status_code=409, detail="Rounds depend on results")
+
+
+@router.get("/{tournament_id}/forecast", response_model=Forecast, status_code=200)
+@inject
+async def get_forecast(
+        tournament_id: int,
+        tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
+        forecast_service: IForecastService = Depends(Provide[Container.forecast_service]),
+) -> Forecast:
+    """An endpoint for getting the chances of the teams to win the tournament.
+
+    Args:
+        tournament_id (int): The id of the tournament.
+        tournament_service (ITournamentService): The injected tournament service dependency.
+        forecast_service (IForecastService): The injected forecast service dependency.
+
+    Raises:
+        HTTPException: 404 if tournament does not exist.
+
+    Returns:
+        Forecast: The simulated chances, the most likely winner first.
+    """
+    tournament = await tournament_service.get_by_id(tournament_id)
+
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    return await forecast_service.get_forecast(tournament)
+
+
+@router.get("/{tournament_id}/bracket", response_model=BracketView, status_code=200)
+@inject
+async def get_bracket(
+        tournament_id: int,
+        service: IFixtureService = Depends(Provide[Container.fixture_service]),
+) -> BracketView:
+    """An endpoint for getting the bracket of an elimination tournament.
+
+    Args:
+        tournament_id (int): The id of the tournament.
+        service (IFixtureService): The injected fixture service dependency.
+
+    Raises:
+        HTTPException: 404 if the tournament has no bracket.
+
+    Returns:
+        BracketView: The matches of the bracket, with the champion once decided.
+    """
+
+    if bracket := await service.get_bracket(tournament_id):
+        return bracket
+
+    raise HTTPException(status_code=404, detail="Bracket not found")
 
 @router.get("/get_winner/{tournament_id}", response_model=Team | dict, status_code=200)
 @inject
 async def get_winner(
         tournament_id: int,
         team_service: ITeamService = Depends(Provide[Container.team_service]),
-        match_service: IMatchService = Depends(Provide[Container.match_service]),
         tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
 
 ) -> Team | dict:
@@ -187,7 +391,6 @@ async def get_winner(
     Args:
         tournament_id (int): The id of the tournament.
         team_service (ITeamService): The injected team service dependency.
-        match_service (IMatchService): The injected match service dependency.
         tournament_service (ITournamentService): The injected tournament service dependency.
 
     Returns:
@@ -200,24 +403,6 @@ async def get_winner(
     if not await tournament_service.get_by_id(tournament_id):
         raise HTTPException(status_code=404, detail="Tournament not found")
 
-    matches = await match_service.get_by_tournament_id(tournament_id)
-
-    if len(matches) == 0:
-        return {}
-
-    winners = {}
-
-    for match in matches:
-        winner_id = match.get_winner_team_id()
-
-        if winner_id not in winners:
-            winners[winner_id] = 0
-        else:
-            winners[winner_id] += 1
-
-    total_winner_id = max(winners, key=winners.get)
-
-    team = await team_service.get_by_id(total_winner_id)
+    team = await team_service.get_tournament_winner(tournament_id)
 
     return team if team else {}
-
@@ -1,11 +1,15 @@
 """A module containing tournament_team endpoints."""
 
+import asyncio
 from typing import Iterable
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
+from tournament_matchmaker.api.responses import json_response
 from tournament_matchmaker.container import Container
+from tournament_matchmaker.core.domains.page import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
 from tournament_matchmaker.core.domains.tournament_team import TournamentTeam, TournamentTeamIn
+from tournament_matchmaker.core.services.i_match_service import IMatchService
 from tournament_matchmaker.core.services.i_team_service import ITeamService
 from tournament_matchmaker.core.services.i_tournament_team_service import ITournamentTeamService
 from tournament_matchmaker.core.services.i_tournament_service import ITournamentService
@@ -20,6 +24,7 @@ async def create_tournament_team(
         tournament_team_service: ITournamentTeamService = Depends(Provide[Container.tournament_team_service]),
         tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
         team_service: ITeamService = Depends(Provide[Container.team_service]),
+        match_service: IMatchService = Depends(Provide[Container.match_service]),
 ) -> dict:
     """An endpoint for adding new tournament_team.
 
@@ -28,51 +33,75 @@ async def create_tournament_team(
         tournament_team_service (ITournamentTeamService, optional): The injected tournament_team service dependency.
         tournament_service (ITournamentService, optional): The injected tournament service dependency.
         team_service (ITeamService, optional): The injected team service dependency.
+        match_service (IMatchService, optional): The injected match service dependency.
 
     Returns:
         dict: The new tournament_team attributes.
 
     Raises:
         HTTPException: 409 if the Tournament is full.
+        HTTPException: 409 if the Team is already registered.
+        HTTPException: 409 if the Tournament has started.
         HTTPException: 404 if the Tournament is not found.
         HTTPException: 404 if the Team is not found.
     """
 
-    tournament = await tournament_service.get_by_id(tournament_team.tournament_id)
+    if new_tournament_team := await tournament_team_service.add_tournament_team(tournament_team):
+        return new_tournament_team.model_dump()
+
+    # The registration is a single conditional statement, the reason of
+    # a rejection is looked up only when it did not succeed.
+    tournament, team, registered, started = await asyncio.gather(
+        tournament_service.get_by_id(tournament_team.tournament_id),
+        team_service.get_by_id(tournament_team.team_id),
+        tournament_team_service.get_by_tournament_id_team_id(
+            tournament_team.tournament_id,
+            tournament_team.team_id,
+        ),
+        match_service.has_matches((tournament_team.tournament_id,)),
+    )
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
-    if not await team_service.get_by_id(tournament_team.team_id):
+    if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    teams = await tournament_team_service.get_all_by_tournament_id(tournament.id)
+    if registered:
+        raise HTTPException(status_code=409, detail="Team already registered")
 
-    if len(teams) >= tournament.max_teams_count:
-        raise HTTPException(status_code=409, detail="Tournament is full")
+    if started:
+        raise HTTPException(status_code=409, detail="Tournament has started")
 
-    new_tournament_team = await tournament_team_service.add_tournament_team(tournament_team)
+    raise HTTPException(status_code=409, detail="Tournament is full")
 
 
-    return new_tournament_team.model_dump() if new_tournament_team else { }
-
-
-@router.get("/all", response_model=Iterable[TournamentTeam], status_code=200)
+@router.get("/all", response_model=Page[TournamentTeam], status_code=200)
 @inject
 async def get_all_tournament_teams(
+        limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: str | None = None,
         service: ITournamentTeamService = Depends(Provide[Container.tournament_team_service]),
-) -> Iterable:
-    """An endpoint for getting all tournament_teams.
+) -> Response:
+    """An endpoint for getting all tournament_teams page by page.
 
     Args:
+        limit (int, optional): The maximal number of tournament_teams on the page.
+        after (str | None, optional): The cursor returned with the previous page.
         service (ITournamentTeamService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
     Returns:
-        Iterable: The tournament_team attributes collection.
+        Response: The tournament_team attributes collection with the cursor of the next page.
     """
 
-    tournament_teams = await service.get_all()
+    try:
+        page = await service.get_page(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return tournament_teams
+    return json_response(page)
 
 
 @router.get("/{tournament_id}/{team_id}",response_model=TournamentTeam,status_code=200,)
@@ -147,6 +176,7 @@ async def update_tournament_team(
         tournament_team_service: ITournamentTeamService = Depends(Provide[Container.tournament_team_service]),
         tournament_service: ITournamentService = Depends(Provide[Container.tournament_service]),
         team_service: ITeamService = Depends(Provide[Container.team_service]),
+        match_service: IMatchService = Depends(Provide[Container.match_service]),
 ) -> dict:
     """
     Update a tournament_team.
@@ -158,30 +188,53 @@ async def update_tournament_team(
         tournament_team_service (ITournamentTeamService): The service for updating tournament_team.
         tournament_service (ITournamentService): The service for updating tournament.
         team_service (ITeamService): The service for updating team.
+        match_service (IMatchService): The service for getting matches.
 
     Raises:
         HTTPException: 404 if the tournament_team does not exist.
+        HTTPException: 409 if either tournament has started.
+        HTTPException: 409 if the Team is already registered for the new Tournament.
+        HTTPException: 409 if the new Tournament is full.
 
     Returns:
         dict: The updated tournament_team details.
     """
 
+    tournament, team = await asyncio.gather(
+        tournament_service.get_by_id(updated_tournament_team.tournament_id),
+        team_service.get_by_id(updated_tournament_team.team_id),
+    )
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    if not team:
+        raise HTTPException(status_code=404, detail="Team not found")
 
+    if tournament_team := await tournament_team_service.update_tournament_team(
+        tournament_id=tournament_id,
+        team_id=team_id,
+        data=updated_tournament_team,
+    ):
+        return tournament_team.model_dump()
 
-    if await tournament_team_service.get_by_tournament_id_team_id(tournament_id=tournament_id, team_id=team_id):
-        if not await tournament_service.get_by_id(updated_tournament_team.tournament_id):
-            raise HTTPException(status_code=404, detail="Tournament not found")
+    registered, conflicting, started = await asyncio.gather(
+        tournament_team_service.get_by_tournament_id_team_id(tournament_id, team_id),
+        tournament_team_service.get_by_tournament_id_team_id(
+            updated_tournament_team.tournament_id,
+            updated_tournament_team.team_id,
+        ),
+        match_service.has_matches((tournament_id, updated_tournament_team.tournament_id)),
+    )
+    if not registered:
+        raise HTTPException(status_code=404, detail="Tournament_Team not found")
 
-        if not await team_service.get_by_id(updated_tournament_team.team_id):
-            raise HTTPException(status_code=404, detail="Team not found")
-        await tournament_team_service.update_tournament_team(
-            tournament_id=tournament_id,
-            team_id=team_id,
-            data=updated_tournament_team,
-        )
-        return {**updated_tournament_team.model_dump()}
+    if started:
+        raise HTTPException(status_code=409, detail="Tournament has started")
 
-    raise HTTPException(status_code=404, detail="Tournament_Team not found")
+    if conflicting:
+        raise HTTPException(status_code=409, detail="Team already registered")
+
+    raise HTTPException(status_code=409, detail="Tournament is full")
 
 @router.delete("/{tournament_id}/{team_id}", status_code=204)
 @inject
@@ -189,6 +242,7 @@ async def delete_tournament_team(
         tournament_id: int,
         team_id: int,
         service: ITournamentTeamService = Depends(Provide[Container.tournament_team_service]),
+        match_service: IMatchService = Depends(Provide[Container.match_service]),
 ) -> None:
     """An endpoint for deleting tournament_teams.
 
@@ -196,14 +250,17 @@ async def delete_tournament_team(
         tournament_id (int): The tournament_id of the tournament_team.
         team_id (int): The tournament_id of the tournament_team.
         service (ITournamentTeamService, optional): The injected service dependency.
+        match_service (IMatchService, optional): The injected match service dependency.
 
     Raises:
         HTTPException: 404 if tournament_team does not exist.
+        HTTPException: 409 if the tournament has started.
     """
 
-    if await service.get_by_tournament_id_team_id(tournament_id=tournament_id, team_id=team_id):
-        await service.delete_tournament_team(tournament_id, team_id)
-
+    if await service.delete_tournament_team(tournament_id, team_id):
         return
 
+    if await match_service.has_matches((tournament_id,)):
+        raise HTTPException(status_code=409, detail="Tournament has started")
+
     raise HTTPException(status_code=404, detail="TournamentTeam not found")
@@ -0,0 +1,65 @@
+"""A module providing maintenance commands.
+
+Usage:
+    python -m tournament_matchmaker.cli migrate
+    python -m tournament_matchmaker.cli rebuild-standings
+    python -m tournament_matchmaker.cli recompute-ratings
+"""
+
+import argparse
+import asyncio
+from typing import Sequence
+
+from tournament_matchmaker.container import Container
+from tournament_matchmaker.db import database, init_db
+
+
+async def migrate() -> None:
+    """Command creating missing tables and applying pending migrations."""
+    await init_db(retries=1)
+    await database.disconnect()
+
+
+async def rebuild_standings() -> None:
+    """Command regenerating the standings from the match history."""
+    await init_db(retries=1)
+    try:
+        rows = await Container.standings_service().rebuild()
+        print(f"Rebuilt {rows} standings rows.")
+    finally:
+        await database.disconnect()
+
+
+async def recompute_ratings() -> None:
+    """Command recomputing Elo ratings of teams from the match history."""
+    await init_db(retries=1)
+    try:
+        teams = await Container.rating_service().recompute()
+        print(f"Rated {teams} teams.")
+    finally:
+        await database.disconnect()
+
+
+COMMANDS = {
+    "migrate": migrate,
+    "rebuild-standings": rebuild_standings,
+    "recompute-ratings": recompute_ratings,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Function running the command chosen in the command line.
+
+    Args:
+        argv (Sequence[str] | None, optional): The command line arguments.
+            Defaults to None.
+    """
+    parser = argparse.ArgumentParser(prog="python -m tournament_matchmaker.cli")
+    parser.add_argument("command", choices=COMMANDS)
+    args = parser.parse_args(argv)
+
+    asyncio.run(COMMANDS[args.command]())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 """A module providing configuration variables."""
 
-from typing import Optional
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,39 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_COMMAND_TIMEOUT: Optional[float] = 30.0
+    DB_ECHO: bool = False
+    DB_FORCE_ROLLBACK: bool = False
+    TEAM_CACHE_ENABLED: bool = False
+    TEAM_CACHE_MAX_SIZE: int = 10_000
+    TEAM_CACHE_TTL: float = 60.0
+    TOURNAMENT_CACHE_ENABLED: bool = False
+    TOURNAMENT_CACHE_MAX_SIZE: int = 10_000
+    TOURNAMENT_CACHE_TTL: float = 60.0
+    TABLE_VERSION_CACHE_ENABLED: bool = False
+    TABLE_VERSION_CACHE_TTL: float = 5.0
+    MATCHMAKING_TEAM_SIZE: int = 5
+    ROUND_INTERVAL_DAYS: int = 7
+    FORECAST_SIMULATIONS: int = 100_000
+    FORECAST_WORKERS: int = 4
+    FORECAST_PARALLEL_THRESHOLD: int = 10_000_000
+    FORECAST_CACHE_MAX_SIZE: int = 1_000
+    FORECAST_CACHE_TTL: float = 600.0
+    JOB_WORKERS: int = 2
+    JOB_QUEUE_MAX_SIZE: int = 1_000
+    JOB_PROGRESS_INTERVAL: float = 0.5
+    JOB_HEARTBEAT_INTERVAL: float = 60.0
+    JOB_STALE_AFTER: float = 600.0
+    IMPORT_CHUNK_SIZE: int = 1_000
+    METRICS_ENABLED: bool = True
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_BUDGET: int = 10
+    QUERY_BUDGETS: dict[str, int] = {}
+    QUERY_BUDGET_MODE: Literal["off", "warn", "fail"] = "warn"
+    QUERY_REPEAT_THRESHOLD: int = 5
 
 
 config = AppConfig()
@@ -1,30 +1,99 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Dict, Factory, Singleton
+
+from tournament_matchmaker.config import config
+from tournament_matchmaker.db import connect_dedicated
+from tournament_matchmaker.infrastructure.cache import LRUCache
+from tournament_matchmaker.infrastructure.notifications import ChangeListener
 
 from tournament_matchmaker.infrastructure.repositories.team_repository import TeamRepository
+from tournament_matchmaker.infrastructure.repositories.cached_team_repository import CachedTeamRepository
 from tournament_matchmaker.infrastructure.services.team_service import TeamService
 
 from tournament_matchmaker.infrastructure.repositories.player_repository import PlayerRepository
 from tournament_matchmaker.infrastructure.services.player_service import PlayerService
 
 from tournament_matchmaker.infrastructure.repositories.tournament_repository import TournamentRepository
+from tournament_matchmaker.infrastructure.repositories.cached_tournament_repository import CachedTournamentRepository
 from tournament_matchmaker.infrastructure.services.tournament_service import TournamentService
 
 from tournament_matchmaker.infrastructure.repositories.match_repository import MatchRepository
 from tournament_matchmaker.infrastructure.services.match_service import MatchService
+from tournament_matchmaker.infrastructure.repositories.bracket_repository import BracketRepository
+from tournament_matchmaker.infrastructure.services.fixture_service import FixtureService
+from tournament_matchmaker.infrastructure.services.forecast_service import ForecastService
 
 from tournament_matchmaker.infrastructure.repositories.tournament_team_repository import TournamentTeamRepository
 from tournament_matchmaker.infrastructure.services.tournament_team_service import TournamentTeamService
 
+from tournament_matchmaker.infrastructure.repositories.raport_repository import RaportRepository
+from tournament_matchmaker.infrastructure.services.raport_service import RaportService
+
+from tournament_matchmaker.infrastructure.repositories.rating_repository import RatingRepository
+from tournament_matchmaker.infrastructure.services.rating_service import RatingService
+
+from tournament_matchmaker.infrastructure.repositories.standings_repository import StandingsRepository
+from tournament_matchmaker.infrastructure.services.standings_service import StandingsService
+
+from tournament_matchmaker.core.matchmaking.queue import MatchmakingQueue
+from tournament_matchmaker.infrastructure.services.matchmaking_service import MatchmakingService
+
+from tournament_matchmaker.infrastructure.repositories.job_repository import JobRepository
+from tournament_matchmaker.infrastructure.services.job_service import JobService
+
+from tournament_matchmaker.infrastructure.repositories.version_repository import VersionRepository
+from tournament_matchmaker.infrastructure.services.version_service import VersionService
+
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
-    team_repository = Singleton(TeamRepository)
+    team_cache = Singleton(
+        LRUCache,
+        max_size=config.TEAM_CACHE_MAX_SIZE,
+        ttl=config.TEAM_CACHE_TTL,
+    )
+    tournament_cache = Singleton(
+        LRUCache,
+        max_size=config.TOURNAMENT_CACHE_MAX_SIZE,
+        ttl=config.TOURNAMENT_CACHE_TTL,
+    )
+    version_cache = Singleton(
+        LRUCache,
+        max_size=64,
+        ttl=config.TABLE_VERSION_CACHE_TTL,
+    )
+    forecast_cache = Singleton(
+        LRUCache,
+        max_size=config.FORECAST_CACHE_MAX_SIZE,
+        ttl=config.FORECAST_CACHE_TTL,
+    )
+    change_listener = Singleton(ChangeListener, connect=connect_dedicated)
+
+    # The caches are opt-in per entity type, without them the plain
+    # repositories are injected.
+    team_repository = (
+        Singleton(CachedTeamRepository, repository=Singleton(TeamRepository), cache=team_cache)
+        if config.TEAM_CACHE_ENABLED
+        else Singleton(TeamRepository)
+    )
     player_repository = Singleton(PlayerRepository)
-    tournament_repository = Singleton(TournamentRepository)
+    tournament_repository = (
+        Singleton(CachedTournamentRepository, repository=Singleton(TournamentRepository), cache=tournament_cache)
+        if config.TOURNAMENT_CACHE_ENABLED
+        else Singleton(TournamentRepository)
+    )
     match_repository = Singleton(MatchRepository)
     tournament_team_repository = Singleton(TournamentTeamRepository)
+    raport_repository = Singleton(RaportRepository)
+    standings_repository = Singleton(StandingsRepository)
+    rating_repository = Singleton(RatingRepository)
+    bracket_repository = Singleton(BracketRepository)
+    job_repository = Singleton(JobRepository)
+    version_repository = Singleton(
+        VersionRepository,
+        cache=version_cache if config.TABLE_VERSION_CACHE_ENABLED else None,
+    )
 
     team_service = Factory(
         TeamService,
@@ -51,3 +120,75 @@ class Container(DeclarativeContainer):
         match_repository=match_repository,
     )
 
+    fixture_service = Factory(
+        FixtureService,
+        match_repository=match_repository,
+        tournament_team_repository=tournament_team_repository,
+        bracket_repository=bracket_repository,
+        rating_repository=rating_repository,
+        round_interval_days=config.ROUND_INTERVAL_DAYS,
+    )
+
+    # The service owns the pool of simulation processes.
+    forecast_service = Singleton(
+        ForecastService,
+        match_repository=match_repository,
+        tournament_team_repository=tournament_team_repository,
+        standings_repository=standings_repository,
+        rating_repository=rating_repository,
+        cache=forecast_cache,
+        simulations=config.FORECAST_SIMULATIONS,
+        workers=config.FORECAST_WORKERS,
+        parallel_threshold=config.FORECAST_PARALLEL_THRESHOLD,
+    )
+
+    raport_service = Factory(
+        RaportService,
+        raport_repository=raport_repository,
+        caches=Dict(
+            team=team_cache,
+            tournament=tournament_cache,
+            forecast=forecast_cache,
+        ),
+    )
+
+    standings_service = Factory(
+        StandingsService,
+        standings_repository=standings_repository,
+    )
+
+    rating_service = Factory(
+        RatingService,
+        rating_repository=rating_repository,
+    )
+
+    # The queue lives in the memory of the worker, so the service holding
+    # it is shared by all requests.
+    matchmaking_service = Singleton(
+        MatchmakingService,
+        queue=Singleton(MatchmakingQueue, team_size=config.MATCHMAKING_TEAM_SIZE),
+        team_repository=team_repository,
+        player_repository=player_repository,
+    )
+
+    # The service owns the workers and the queue of the jobs.
+    job_service = Singleton(
+        JobService,
+        job_repository=job_repository,
+        tournament_service=tournament_service,
+        fixture_service=fixture_service,
+        rating_service=rating_service,
+        team_repository=team_repository,
+        player_repository=player_repository,
+        workers=config.JOB_WORKERS,
+        queue_max_size=config.JOB_QUEUE_MAX_SIZE,
+        progress_interval=config.JOB_PROGRESS_INTERVAL,
+        heartbeat_interval=config.JOB_HEARTBEAT_INTERVAL,
+        stale_after=config.JOB_STALE_AFTER,
+        import_chunk_size=config.IMPORT_CHUNK_SIZE,
+    )
+
+    version_service = Factory(
+        VersionService,
+        version_repository=version_repository,
+    )
@@ -0,0 +1,57 @@
+"""Module containing bracket-related domain models"""
+
+from typing import List, Literal, Optional
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict
+
+from tournament_matchmaker.core.domains.record import record_to_dict
+
+
+class Bracket(BaseModel):
+    """Model representing the state of an elimination bracket.
+
+    The nodes of the bracket (its matches) are numbered by the layout of
+    the format, `slots` holds the two teams of every node, 0 for a bye
+    and None while unknown.
+    """
+    tournament_id: int
+    double: bool
+    size: int
+    slots: List[Optional[int]]
+    winners: List[Optional[int]]
+    match_ids: List[Optional[int]]
+    version: int = 0
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_record(cls, record: Record) -> "Bracket":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            BracketDTO: The final DTO instance.
+        """
+        return cls.model_validate(record_to_dict(record))
+
+
+class BracketMatch(BaseModel):
+    """Model representing a match of the bracket."""
+    node: int
+    bracket: Literal["winners", "losers", "final"]
+    round: int
+    team1_id: Optional[int] = None
+    team2_id: Optional[int] = None
+    winner_id: Optional[int] = None
+    match_id: Optional[int] = None
+
+
+class BracketView(BaseModel):
+    """Model representing the bracket of a tournament."""
+    tournament_id: int
+    double: bool
+    size: int
+    champion_id: Optional[int] = None
+    matches: List[BracketMatch]
@@ -0,0 +1,21 @@
+"""Module containing forecast-related domain models"""
+
+from typing import List
+from pydantic import BaseModel
+
+
+class TeamForecast(BaseModel):
+    """Model representing the chances of a team in a tournament."""
+    team_id: int
+    rating: float
+    wins: int
+    expected_wins: float
+    win_probability: float
+
+
+class Forecast(BaseModel):
+    """Model representing the simulated outcome of a tournament."""
+    tournament_id: int
+    simulations: int
+    remaining_matches: int
+    teams: List[TeamForecast]
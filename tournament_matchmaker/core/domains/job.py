@@ -0,0 +1,83 @@
+"""Module containing job-related domain models"""
+
+import datetime
+import json
+from typing import Any, List, Literal, Optional
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from tournament_matchmaker.core.domains.record import record_to_dict
+
+JobKind = Literal["end_recruiting", "import", "recompute_ratings"]
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobIn(BaseModel):
+    """Model representing the work of a job."""
+    kind: JobKind
+    params: dict = Field(default_factory=dict)
+
+    @field_validator("params", mode="before")
+    @classmethod
+    def parse_params(cls, value: Any) -> Any:
+        """A method parsing the params read as raw JSON from the DB."""
+        return json.loads(value) if isinstance(value, str) else value
+
+
+class Job(BaseModel):
+    """Model representing the state of a job in the database."""
+    id: int
+    kind: JobKind
+    status: JobStatus
+    progress: int
+    total: Optional[int] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime.datetime
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @field_validator("result", mode="before")
+    @classmethod
+    def parse_result(cls, value: Any) -> Any:
+        """A method parsing the result read as raw JSON from the DB."""
+        return json.loads(value) if isinstance(value, str) else value
+
+    @classmethod
+    def from_record(cls, record: Record) -> "Job":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            JobDTO: The final DTO instance.
+        """
+        return cls.model_validate(record_to_dict(record))
+
+
+class ImportPlayer(BaseModel):
+    """Model representing a player of an imported team."""
+    name: str
+    rank: str
+
+
+class ImportTeam(BaseModel):
+    """Model representing an imported team with its players."""
+    name: str
+    players: List[ImportPlayer] = Field(default_factory=list)
+
+
+class ImportIn(BaseModel):
+    """Model representing the teams and their players to import."""
+    teams: List[ImportTeam]
+
+    def count(self) -> int:
+        """A method counting the imported teams and players.
+
+        Returns:
+            int: The number of the rows to insert.
+        """
+        return sum(1 + len(team.players) for team in self.teams)
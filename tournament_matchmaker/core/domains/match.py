@@ -1,10 +1,12 @@
 """Module containing match-related domain models"""
 import datetime
-from typing import Optional
+from typing import Iterable, List, Optional
 from asyncpg import Record
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional
 
+from tournament_matchmaker.core.domains.record import record_to_dict
+
 
 class MatchIn(BaseModel):
     """Model representing match's DTO attributes."""
@@ -14,6 +16,7 @@ class MatchIn(BaseModel):
     team1_score: int
     team2_score: int
     match_date: datetime.date
+    round: Optional[int] = None
 
 
 class Match(MatchIn):
@@ -26,31 +29,45 @@ class Match(MatchIn):
     def from_record(cls, record: Record) -> "Match":
         """A method for preparing DTO instance based on DB record.
 
+        The values are validated by the precompiled core schema of the
+        model straight from the record, without keyword arguments.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             MatchDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            tournament_id=record_dict.get("tournament_id"),  # type: ignore
-            team1_id=record_dict.get("team1_id"),  # type: ignore
-            team2_id=record_dict.get("team2_id"),  # type: ignore
-            team1_score=record_dict.get("team1_score"),  # type: ignore
-            team2_score=record_dict.get("team2_score"),  # type: ignore
-            match_date=record_dict.get("match_date"),  # type: ignore
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Match"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call of a precompiled
+        `TypeAdapter`, which is the fastest path for whole listings.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[MatchDTO]: The final DTO instances.
+        """
+        return _match_list_adapter.validate_python(
+            [record_to_dict(record) for record in records]
         )
 
-    def get_winner_team_id(self) -> int:
-        """A method for getting id of the winner team of the tournament.
+    def get_winner_team_id(self) -> int | None:
+        """A method for getting id of the winner team of the match.
 
         Returns:
-            int: The id of the winner team.
+            int | None: The id of the winner team, None for a draw.
         """
-        if self.team1_score == 1:
+        if self.team1_score > self.team2_score:
             return self.team1_id
-        else:
+        if self.team2_score > self.team1_score:
             return self.team2_id
+        return None
+
+
+_match_list_adapter = TypeAdapter(List[Match])
@@ -0,0 +1,11 @@
+"""Module containing matchmaking-related domain models"""
+
+from typing import Literal, Optional
+from pydantic import BaseModel
+
+
+class QueueTicket(BaseModel):
+    """Model representing the state of a player in the matchmaking queue."""
+    player_id: int
+    status: Literal["queued", "matched"]
+    team_id: Optional[int] = None
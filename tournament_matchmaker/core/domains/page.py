@@ -0,0 +1,20 @@
+"""Module containing pagination-related domain models"""
+
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+ItemT = TypeVar("ItemT")
+
+
+class Page(BaseModel, Generic[ItemT]):
+    """Model representing a single page of a listing.
+
+    The `next` attribute is an opaque cursor pointing after the last item
+    of the page, it is None when there are no more items.
+    """
+    items: List[ItemT]
+    next: Optional[str] = None
@@ -1,10 +1,12 @@
 """Module containing player-related domain models"""
 
-from typing import Optional
+from typing import Iterable, List, Optional
 from asyncpg import Record
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional
 
+from tournament_matchmaker.core.domains.record import record_to_dict
+
 
 class PlayerIn(BaseModel):
     """Model representing player's DTO attributes."""
@@ -23,17 +25,33 @@ class Player(PlayerIn):
     def from_record(cls, record: Record) -> "Player":
         """A method for preparing DTO instance based on DB record.
 
+        The values are validated by the precompiled core schema of the
+        model straight from the record, without keyword arguments.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             PlayerDTO: The final DTO instance.
         """
-        record_dict = dict(record)
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Player"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call of a precompiled
+        `TypeAdapter`, which is the fastest path for whole listings.
 
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            name=record_dict.get("name"),  # type: ignore
-            rank=record_dict.get("rank"),
-            team_id=record_dict.get("team_id", None),  # type: ignore
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[PlayerDTO]: The final DTO instances.
+        """
+        return _player_list_adapter.validate_python(
+            [record_to_dict(record) for record in records]
         )
+
+
+_player_list_adapter = TypeAdapter(List[Player])
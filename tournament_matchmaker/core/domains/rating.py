@@ -0,0 +1,45 @@
+"""Module containing rating-related domain models"""
+
+from typing import Iterable, List
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from tournament_matchmaker.core.domains.record import record_to_dict
+
+
+class TeamRating(BaseModel):
+    """Model representing the Elo rating of a team."""
+    team_id: int
+    rating: float
+    matches: int
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_record(cls, record: Record) -> "TeamRating":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            TeamRatingDTO: The final DTO instance.
+        """
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["TeamRating"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[TeamRatingDTO]: The final DTO instances.
+        """
+        return _team_rating_list_adapter.validate_python(
+            [record_to_dict(record) for record in records]
+        )
+
+
+_team_rating_list_adapter = TypeAdapter(List[TeamRating])
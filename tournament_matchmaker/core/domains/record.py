@@ -0,0 +1,20 @@
+"""Module containing helpers for building domain models from DB records"""
+
+from typing import Any
+
+
+def record_to_dict(record: Any) -> dict:
+    """A function copying the values of a DB record into a dict.
+
+    Records of `databases` wrap the raw asyncpg record and convert each
+    value on access, which our column types never need. Reading the raw
+    record through `_mapping` copies all values at C speed.
+
+    Args:
+        record (Any): The DB record (or any mapping).
+
+    Returns:
+        dict: The column values keyed by column names.
+    """
+
+    return dict(getattr(record, "_mapping", record).items())
@@ -0,0 +1,53 @@
+"""Module containing standing-related domain models"""
+
+from typing import Iterable, List
+from asyncpg import Record
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from tournament_matchmaker.core.domains.record import record_to_dict
+
+
+class Standing(BaseModel):
+    """Model representing results of a team in a tournament.
+
+    Only played matches count, a match scored 0:0 is a scheduled one.
+    """
+    tournament_id: int
+    team_id: int
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    score_for: int
+    score_against: int
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+    @classmethod
+    def from_record(cls, record: Record) -> "Standing":
+        """A method for preparing DTO instance based on DB record.
+
+        Args:
+            record (Record): The DB record.
+
+        Returns:
+            StandingDTO: The final DTO instance.
+        """
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Standing"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[StandingDTO]: The final DTO instances.
+        """
+        return _standing_list_adapter.validate_python(
+            [record_to_dict(record) for record in records]
+        )
+
+
+_standing_list_adapter = TypeAdapter(List[Standing])
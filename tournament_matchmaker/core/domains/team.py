@@ -1,8 +1,10 @@
 """Module containing team-related domain models"""
 
-from typing import Optional
+from typing import Iterable, List, Optional
 from asyncpg import Record
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from tournament_matchmaker.core.domains.record import record_to_dict
 
 
 class TeamIn(BaseModel):
@@ -20,15 +22,33 @@ class Team(TeamIn):
     def from_record(cls, record: Record) -> "Team":
         """A method for preparing DTO instance based on DB record.
 
+        The values are validated by the precompiled core schema of the
+        model straight from the record, without keyword arguments.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             TeamDTO: The final DTO instance.
         """
-        record_dict = dict(record)
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Team"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call of a precompiled
+        `TypeAdapter`, which is the fastest path for whole listings.
 
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            name=record_dict.get("name"),  # type: ignore
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[TeamDTO]: The final DTO instances.
+        """
+        return _team_list_adapter.validate_python(
+            [record_to_dict(record) for record in records]
         )
+
+
+_team_list_adapter = TypeAdapter(List[Team])
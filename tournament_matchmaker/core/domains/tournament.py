@@ -1,10 +1,12 @@
 """Module containing tournament-related domain models"""
 import datetime
-from typing import Optional, List
+from typing import Iterable, List, Literal, Optional
 from asyncpg import Record
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional
 
+from tournament_matchmaker.core.domains.record import record_to_dict
+
 
 class TournamentIn(BaseModel):
     """Model representing tournament's DTO attributes."""
@@ -12,6 +14,7 @@ class TournamentIn(BaseModel):
     date: datetime.date
     max_teams_count: int
     preffered_rank: str
+    format: Literal["round_robin", "swiss", "single_elimination", "double_elimination"] = "round_robin"
 
 
 class Tournament(TournamentIn):
@@ -24,18 +27,33 @@ class Tournament(TournamentIn):
     def from_record(cls, record: Record) -> "Tournament":
         """A method for preparing DTO instance based on DB record.
 
+        The values are validated by the precompiled core schema of the
+        model straight from the record, without keyword arguments.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             TournamentDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            name=record_dict.get("name"),  # type: ignore
-            date=record_dict.get("date"),
-            max_teams_count=record_dict.get("max_teams_count"),
-            preffered_rank=record_dict.get("preffered_rank"),
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["Tournament"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call of a precompiled
+        `TypeAdapter`, which is the fastest path for whole listings.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[TournamentDTO]: The final DTO instances.
+        """
+        return _tournament_list_adapter.validate_python(
+            [record_to_dict(record) for record in records]
         )
+
+
+_tournament_list_adapter = TypeAdapter(List[Tournament])
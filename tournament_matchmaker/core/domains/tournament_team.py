@@ -1,10 +1,12 @@
 """Module containing tournament_team-related domain models"""
 
-from typing import Optional
+from typing import Iterable, List, Optional
 from asyncpg import Record
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Optional
 
+from tournament_matchmaker.core.domains.record import record_to_dict
+
 
 class TournamentTeamIn(BaseModel):
     """Model representing tournament_team's DTO attributes."""
@@ -21,15 +23,33 @@ class TournamentTeam(TournamentTeamIn):
     def from_record(cls, record: Record) -> "TournamentTeam":
         """A method for preparing DTO instance based on DB record.
 
+        The values are validated by the precompiled core schema of the
+        model straight from the record, without keyword arguments.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             TournamentTeamDTO: The final DTO instance.
         """
-        record_dict = dict(record)
+        return cls.model_validate(record_to_dict(record))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> List["TournamentTeam"]:
+        """A method for preparing DTO instances based on many DB records.
+
+        All records are validated in a single call of a precompiled
+        `TypeAdapter`, which is the fastest path for whole listings.
 
-        return cls(
-            tournament_id=record_dict.get("tournament_id"),  # type: ignore
-            team_id=record_dict.get("team_id"),  # type: ignore
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            List[TournamentTeamDTO]: The final DTO instances.
+        """
+        return _tournament_team_list_adapter.validate_python(
+            [record_to_dict(record) for record in records]
         )
+
+
+_tournament_team_list_adapter = TypeAdapter(List[TournamentTeam])
@@ -0,0 +1 @@
+"""A package containing forecasts of tournament outcomes."""
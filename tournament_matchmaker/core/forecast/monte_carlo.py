@@ -0,0 +1,137 @@
+"""A module containing the vectorized Monte Carlo simulation of tournaments."""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import List, NamedTuple
+
+import numpy as np
+
+from tournament_matchmaker.core.rating.elo import SCALE
+
+# The number of simulated matches, or of win counts, computed at once,
+# bounding the memory of one chunk (8 bytes per element) to tens of megabytes.
+CHUNK_ELEMENTS = 1 << 22
+
+
+class TournamentState(NamedTuple):
+    """Model representing the played part of a tournament and the remaining fixtures.
+
+    Teams are referred to by their positions in the arrays of teams.
+    """
+    wins: np.ndarray
+    tiebreak: np.ndarray
+    rating: np.ndarray
+    team1: np.ndarray
+    team2: np.ndarray
+
+
+class Outcomes(NamedTuple):
+    """Model representing the totals of simulated tournaments by team."""
+    simulations: int
+    firsts: np.ndarray
+    wins: np.ndarray
+
+
+def win_probability(rating1: np.ndarray, rating2: np.ndarray) -> np.ndarray:
+    """Function getting the Elo probability that the first team wins.
+
+    Args:
+        rating1 (np.ndarray): The ratings of the first teams.
+        rating2 (np.ndarray): The ratings of the second teams.
+
+    Returns:
+        np.ndarray: The probabilities.
+    """
+    return 1.0 / (1.0 + 10.0 ** ((rating2 - rating1) / SCALE))
+
+
+def simulate(state: TournamentState, simulations: int, seed: int | np.random.SeedSequence | None = None) -> Outcomes:
+    """Function playing the remaining fixtures many times and counting the winners.
+
+    Every remaining match is won by one of its teams with the Elo
+    probability. A chunk of simulations is one matrix of random numbers,
+    the winners of all its matches are counted with a single bincount
+    and the team with the most wins (then the better tiebreak) of every
+    simulation is found with one argmax.
+
+    Args:
+        state (TournamentState): The tournament.
+        simulations (int): The number of simulated tournaments.
+        seed (int | np.random.SeedSequence | None, optional): The seed of
+            the random numbers. Defaults to None.
+
+    Returns:
+        Outcomes: The number of firsts and the total wins of every team.
+    """
+    rng = np.random.default_rng(seed)
+    teams = len(state.wins)
+    firsts = np.zeros(teams, dtype=np.int64)
+    wins = np.zeros(teams, dtype=np.int64)
+    if teams == 0:
+        return Outcomes(simulations, firsts, wins)
+
+    wins += state.wins.astype(np.int64) * simulations
+    # Wins decide and the tiebreak (smaller than one win) orders teams with equal wins.
+    base = state.wins.astype(np.int64) * teams + state.tiebreak
+    matches = len(state.team1)
+    if matches == 0:
+        # Nothing is left to play, every simulation ends with the current leader.
+        firsts[np.argmax(base)] = simulations
+        return Outcomes(simulations, firsts, wins)
+
+    probability = win_probability(state.rating[state.team1], state.rating[state.team2]).astype(np.float32)
+    # A chunk holds both the winners of its matches and the wins of its teams.
+    chunk = max(1, CHUNK_ELEMENTS // max(matches, teams))
+
+    for start in range(0, simulations, chunk):
+        size = min(chunk, simulations - start)
+        won = rng.random((size, matches), dtype=np.float32) < probability
+        winners = np.where(won, state.team1, state.team2)
+        winners += (np.arange(size) * teams)[:, None]
+        simulated_wins = np.bincount(winners.ravel(), minlength=size * teams).reshape(size, teams)
+
+        firsts += np.bincount(np.argmax(simulated_wins * teams + base, axis=1), minlength=teams)
+        wins += simulated_wins.sum(axis=0)
+
+    return Outcomes(simulations, firsts, wins)
+
+
+async def simulate_parallel(
+        executor: Executor,
+        state: TournamentState,
+        simulations: int,
+        parts: int,
+        seed: int | None = None,
+) -> Outcomes:
+    """Function splitting the simulations between the workers of the executor.
+
+    Every part gets an independent stream of random numbers spawned from
+    the seed, so the result does not depend on the number of parts other
+    than by chance.
+
+    Args:
+        executor (Executor): The executor, a process pool for CPU parallelism.
+        state (TournamentState): The tournament.
+        simulations (int): The number of simulated tournaments.
+        parts (int): The number of parts run concurrently.
+        seed (int | None, optional): The seed of the random numbers.
+            Defaults to None.
+
+    Returns:
+        Outcomes: The totals of all parts.
+    """
+    loop = asyncio.get_running_loop()
+    sizes = [simulations // parts + (part < simulations % parts) for part in range(parts)]
+    seeds = np.random.SeedSequence(seed).spawn(parts)
+
+    results: List[Outcomes] = await asyncio.gather(*(
+        loop.run_in_executor(executor, simulate, state, size, part_seed)
+        for size, part_seed in zip(sizes, seeds)
+        if size
+    ))
+
+    return Outcomes(
+        simulations,
+        sum(result.firsts for result in results),
+        sum(result.wins for result in results),
+    )
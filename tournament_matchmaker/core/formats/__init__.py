@@ -0,0 +1 @@
+"""A package containing tournament formats pairing teams round by round."""
@@ -0,0 +1,269 @@
+"""A module containing the single and double elimination formats."""
+
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Sequence
+
+from tournament_matchmaker.core.domains.bracket import Bracket
+from tournament_matchmaker.core.domains.match import Match
+from tournament_matchmaker.core.formats.format import Pairing, TournamentFormat
+
+BYE = 0
+
+
+class BracketNode(NamedTuple):
+    """Model representing the place of a match in the bracket.
+
+    The targets are slot indexes, the two slots of node `n` are `2n`
+    and `2n + 1`.
+    """
+    bracket: str
+    round: int
+    winner_to: int | None
+    loser_to: int | None
+
+
+def seed_order(size: int) -> List[int]:
+    """Function getting the seeds in the order of the first round slots.
+
+    The best seed meets the worst one and the two best seeds can only
+    meet in the final (1 v 8, 4 v 5, 2 v 7, 3 v 6 for 8 slots).
+
+    Args:
+        size (int): The number of slots, a power of two.
+
+    Returns:
+        List[int]: The seeds, 1 being the best.
+    """
+    seeds = [1]
+    while len(seeds) < size:
+        total = 2 * len(seeds) + 1
+        seeds = [seed for top in seeds for seed in (top, total - top)]
+
+    return seeds
+
+
+@lru_cache(maxsize=64)
+def layout(size: int, double: bool) -> tuple[BracketNode, ...]:
+    """Function getting the nodes of a bracket and where their teams go.
+
+    The winners bracket comes first, round by round. In a double
+    elimination the losers bracket follows: its odd rounds pair the
+    survivors among themselves (the first one the losers of the first
+    winners round), its even rounds meet them with the losers of the
+    next winners round, in alternating order to postpone rematches.
+    The grand final and its rematch (played only if the winner of the
+    losers bracket wins the grand final) are the last two nodes.
+
+    Args:
+        size (int): The number of slots of the first round, a power of two.
+        double (bool): Whether the losers get a second chance.
+
+    Returns:
+        tuple[BracketNode, ...]: The nodes in the order of their numbers.
+    """
+    depth = size.bit_length() - 1
+    kinds: list[tuple[str, int]] = []
+
+    winners = []
+    for round_number in range(1, depth + 1):
+        winners.append(list(range(len(kinds), len(kinds) + (size >> round_number))))
+        kinds.extend(("winners", round_number) for _ in winners[-1])
+
+    losers = []
+    if double:
+        for round_number in range(1, 2 * (depth - 1) + 1):
+            count = size >> ((round_number + 1) // 2 + 1)
+            losers.append(list(range(len(kinds), len(kinds) + count)))
+            kinds.extend(("losers", round_number) for _ in losers[-1])
+        final = len(kinds)
+        kinds.extend((("final", 1), ("final", 2)))
+
+    winner_to: list[int | None] = [None] * len(kinds)
+    loser_to: list[int | None] = [None] * len(kinds)
+
+    for index, nodes in enumerate(winners):
+        for position, node in enumerate(nodes):
+            if index + 1 < len(winners):
+                winner_to[node] = 2 * winners[index + 1][position // 2] + position % 2
+            elif double:
+                winner_to[node] = 2 * final
+
+            if not double:
+                continue
+            if index == 0:
+                loser_to[node] = 2 * losers[0][position // 2] + position % 2
+            else:
+                target = losers[2 * index - 1]
+                if index % 2 == 0:
+                    position = len(target) - 1 - position
+                loser_to[node] = 2 * target[position] + 1
+
+    for index, nodes in enumerate(losers):
+        for position, node in enumerate(nodes):
+            if index + 1 == len(losers):
+                winner_to[node] = 2 * final + 1
+            elif index % 2 == 0:
+                winner_to[node] = 2 * losers[index + 1][position]
+            else:
+                winner_to[node] = 2 * losers[index + 1][position // 2] + position % 2
+
+    return tuple(
+        BracketNode(bracket, round_number, winner_to[node], loser_to[node])
+        for node, (bracket, round_number) in enumerate(kinds)
+    )
+
+
+class EliminationFormat(TournamentFormat):
+    """A class representing single or double elimination.
+
+    Rounds are not paired from standings, a match is created as soon as
+    both of its teams are known (see `advance`), teams meeting a bye go
+    through without a match.
+    """
+
+    def __init__(self, double: bool = False) -> None:
+        """The initializer of the `elimination format`.
+
+        Args:
+            double (bool, optional): Whether a team is out after its second
+                loss instead of the first one. Defaults to False.
+        """
+        self.double = double
+
+    def next_round(self, team_ids: Sequence[int], matches: Sequence[Match]) -> List[Pairing]:
+        """The method pairing the next round, which the bracket does on its own.
+
+        Returns:
+            List[Pairing]: Always empty.
+        """
+
+        return []
+
+    def bracket_size(self, teams: int) -> int:
+        """The method getting the number of first round slots for the number of teams.
+
+        Args:
+            teams (int): The number of teams.
+
+        Returns:
+            int: The smallest sufficient power of two.
+        """
+
+        minimum = 4 if self.double else 2
+
+        return max(minimum, 1 << (teams - 1).bit_length())
+
+    def create(self, tournament_id: int, team_ids: Sequence[int]) -> tuple[Bracket, List[int]]:
+        """The method seeding the teams into a new bracket.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+            team_ids (Sequence[int]): The ids of the teams, the best seed first.
+
+        Returns:
+            tuple[Bracket, List[int]]: The bracket and its nodes which need a match.
+        """
+
+        size = self.bracket_size(len(team_ids))
+        nodes = layout(size, self.double)
+        slots: list[int | None] = [None] * (2 * len(nodes))
+        for slot, seed in enumerate(seed_order(size)):
+            slots[slot] = team_ids[seed - 1] if seed <= len(team_ids) else BYE
+
+        bracket = Bracket(
+            tournament_id=tournament_id,
+            double=self.double,
+            size=size,
+            slots=slots,
+            winners=[None] * len(nodes),
+            match_ids=[None] * len(nodes),
+        )
+
+        return bracket, self._resolve(bracket, range(size // 2))
+
+    def advance(self, bracket: Bracket, node: int, winner: int, loser: int) -> List[int]:
+        """The method moving the teams of a decided match on.
+
+        Args:
+            bracket (Bracket): The bracket, updated in place.
+            node (int): The node of the match.
+            winner (int): The id of the winner.
+            loser (int): The id of the loser.
+
+        Returns:
+            List[int]: The nodes which need a match now.
+        """
+
+        return self._resolve(bracket, self._decide(bracket, node, winner, loser))
+
+    def champion(self, bracket: Bracket) -> int | None:
+        """The method getting the winner of the bracket.
+
+        Args:
+            bracket (Bracket): The bracket.
+
+        Returns:
+            int | None: The id of the champion, None until the final is decided.
+        """
+
+        return bracket.winners[-1] or None
+
+    def _decide(self, bracket: Bracket, node: int, winner: int, loser: int) -> List[int]:
+        """A private method recording the winner and filling the next slots.
+
+        Returns:
+            List[int]: The nodes of the filled slots.
+        """
+
+        nodes = layout(bracket.size, bracket.double)
+        target = nodes[node]
+        bracket.winners[node] = winner
+
+        if target.bracket == "final" and target.round == 1:
+            # The winner of the winners bracket has not lost yet, so the
+            # final is replayed only if it loses.
+            rematch = node + 1
+            if loser != BYE and winner == bracket.slots[2 * node + 1]:
+                bracket.slots[2 * rematch], bracket.slots[2 * rematch + 1] = loser, winner
+                return [rematch]
+
+            bracket.winners[rematch] = winner
+            return []
+
+        filled = []
+        for team, slot in ((winner, target.winner_to), (loser, target.loser_to)):
+            if slot is not None:
+                bracket.slots[slot] = team
+                filled.append(slot // 2)
+
+        return filled
+
+    def _resolve(self, bracket: Bracket, nodes: Iterable[int]) -> List[int]:
+        """A private method passing byes on and finding nodes ready to be played.
+
+        Args:
+            bracket (Bracket): The bracket, updated in place.
+            nodes (Iterable[int]): The nodes whose slots could have changed.
+
+        Returns:
+            List[int]: The nodes with two teams and no match yet.
+        """
+
+        pending = list(nodes)
+        ready = set()
+
+        while pending:
+            node = pending.pop()
+            if bracket.winners[node] is not None or bracket.match_ids[node] is not None:
+                continue
+
+            first, second = bracket.slots[2 * node], bracket.slots[2 * node + 1]
+            if first is None or second is None:
+                continue
+
+            if first != BYE and second != BYE:
+                ready.add(node)
+            else:
+                pending.extend(self._decide(bracket, node, first or second, BYE))
+
+        return sorted(ready)
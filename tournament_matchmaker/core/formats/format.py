@@ -0,0 +1,62 @@
+"""A module containing the protocol of tournament formats."""
+
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Sequence
+
+from tournament_matchmaker.core.domains.match import Match
+
+
+class Pairing(NamedTuple):
+    """Model representing two teams meeting in a match."""
+    team1_id: int
+    team2_id: int
+
+
+def is_played(match: Match) -> bool:
+    """Function checking whether the match has a result.
+
+    A match scored 0:0 is a scheduled, not yet played one, the same as
+    in the standings.
+
+    Args:
+        match (Match): The match.
+
+    Returns:
+        bool: Whether the match was played.
+    """
+    return match.team1_score != 0 or match.team2_score != 0
+
+
+def current_round(matches: Sequence[Match]) -> int:
+    """Function getting the number of the latest generated round.
+
+    Matches created before rounds were recorded belong to the first one.
+
+    Args:
+        matches (Sequence[Match]): The matches of the tournament.
+
+    Returns:
+        int: The number of the round, 0 if none was generated.
+    """
+    return max((match.round or 1 for match in matches), default=0)
+
+
+class TournamentFormat(ABC):
+    """An abstract class representing a format generating the rounds of a tournament."""
+
+    # Whether a round can be paired only once the previous one is played.
+    depends_on_results = True
+
+    @abstractmethod
+    def next_round(self, team_ids: Sequence[int], matches: Sequence[Match]) -> List[Pairing]:
+        """The abstract pairing teams for the round after the latest one.
+
+        Args:
+            team_ids (Sequence[int]): The ids of the teams in the tournament.
+            matches (Sequence[Match]): The matches of the previous rounds,
+                all of them played.
+
+        Returns:
+            List[Pairing]: The pairings of the next round, empty if the
+                tournament is complete.
+        """
@@ -0,0 +1,28 @@
+"""A module registering the available tournament formats by name."""
+
+from tournament_matchmaker.core.formats.elimination import EliminationFormat
+from tournament_matchmaker.core.formats.format import TournamentFormat
+from tournament_matchmaker.core.formats.round_robin import RoundRobinFormat
+from tournament_matchmaker.core.formats.swiss import SwissFormat
+
+FORMATS: dict[str, TournamentFormat] = {
+    "round_robin": RoundRobinFormat(),
+    "swiss": SwissFormat(),
+    "single_elimination": EliminationFormat(double=False),
+    "double_elimination": EliminationFormat(double=True),
+}
+
+
+def get_format(name: str) -> TournamentFormat:
+    """Function getting the format of a tournament.
+
+    Args:
+        name (str): The name of the format.
+
+    Raises:
+        KeyError: If the format is unknown.
+
+    Returns:
+        TournamentFormat: The format.
+    """
+    return FORMATS[name]
@@ -0,0 +1,93 @@
+"""A module containing the round robin format."""
+
+from typing import List, Sequence
+
+from tournament_matchmaker.core.domains.match import Match
+from tournament_matchmaker.core.formats.format import Pairing, TournamentFormat, current_round
+
+
+def circle_round(team_ids: Sequence[int], round_index: int) -> List[Pairing]:
+    """Function pairing the teams for a round by the circle method.
+
+    The first team stays in place while the others rotate by one
+    position a round, so over n - 1 rounds (n with an odd number of
+    teams) every two teams meet exactly once and no team plays twice in
+    a round. Any round is computed directly, without the previous ones.
+
+    Args:
+        team_ids (Sequence[int]): The ids of the teams, in a fixed order.
+        round_index (int): The number of the round, counted from 0.
+
+    Returns:
+        List[Pairing]: The pairings of the round, the team with a bye
+            (with an odd number of teams) is left out.
+    """
+    teams: list[int | None] = list(team_ids)
+    if len(teams) % 2:
+        teams.append(None)
+
+    size = len(teams)
+    if size < 2:
+        return []
+
+    rest = teams[1:]
+    shift = round_index % (size - 1)
+    line = [teams[0], *rest[len(rest) - shift:], *rest[:len(rest) - shift]]
+
+    pairings = []
+    for position in range(size // 2):
+        home, away = line[position], line[size - 1 - position]
+        if home is None or away is None:
+            continue
+        # The fixed team would always play at home otherwise.
+        if position == 0 and round_index % 2:
+            home, away = away, home
+        pairings.append(Pairing(home, away))
+
+    return pairings
+
+
+class RoundRobinFormat(TournamentFormat):
+    """A class representing the format in which every team meets every other one.
+
+    The pairings do not depend on results, so rounds can be generated
+    ahead, one at a time, instead of all matches at once.
+    """
+
+    depends_on_results = False
+
+    def rounds(self, teams: int) -> int:
+        """The method getting the number of rounds for the number of teams.
+
+        Args:
+            teams (int): The number of teams.
+
+        Returns:
+            int: The number of rounds.
+        """
+
+        return teams - 1 + teams % 2 if teams > 1 else 0
+
+    def next_round(self, team_ids: Sequence[int], matches: Sequence[Match]) -> List[Pairing]:
+        """The method pairing teams for the round after the latest one.
+
+        Args:
+            team_ids (Sequence[int]): The ids of the teams in the tournament.
+            matches (Sequence[Match]): The matches of the previous rounds.
+
+        Returns:
+            List[Pairing]: The pairings of the next round, empty once every
+                two teams have met.
+        """
+
+        # Tournaments scheduled before rounds existed have all their
+        # matches already.
+        teams = len(team_ids)
+        if len(matches) >= teams * (teams - 1) // 2:
+            return []
+
+        round_index = current_round(matches)
+        if round_index >= self.rounds(teams):
+            return []
+
+        return circle_round(team_ids, round_index)
@@ -0,0 +1,169 @@
+"""A module containing the Swiss-system format."""
+
+import math
+from collections import defaultdict
+from typing import List, Sequence
+
+from tournament_matchmaker.core.domains.match import Match
+from tournament_matchmaker.core.formats.format import (
+    Pairing,
+    TournamentFormat,
+    current_round,
+    is_played,
+)
+
+WIN_POINTS = 2
+DRAW_POINTS = 1
+MAX_BACKTRACKING_STEPS = 100_000
+
+
+class SwissFormat(TournamentFormat):
+    """A class representing the Swiss system.
+
+    In every round teams with equal points meet each other and no two
+    teams meet twice, so a winner is found after about log2(n) rounds
+    instead of the n - 1 rounds of round robin. Only the next round is
+    paired, from the results of the previous ones.
+    """
+
+    def __init__(self, rounds: int | None = None) -> None:
+        """The initializer of the `Swiss format`.
+
+        Args:
+            rounds (int | None, optional): The number of rounds.
+                Defaults to None (log2 of the number of teams, rounded up).
+        """
+        self._rounds = rounds
+
+    def rounds(self, teams: int) -> int:
+        """The method getting the number of rounds for the number of teams.
+
+        Args:
+            teams (int): The number of teams.
+
+        Returns:
+            int: The number of rounds.
+        """
+
+        if self._rounds is not None:
+            return self._rounds
+
+        return math.ceil(math.log2(teams)) if teams > 1 else 0
+
+    def next_round(self, team_ids: Sequence[int], matches: Sequence[Match]) -> List[Pairing]:
+        """The method pairing teams of equal points which have not met yet.
+
+        Teams are ordered by points, then by the points of their opponents
+        (Buchholz), and the first one is paired with the next one it has
+        not played. When the rest cannot be paired the previous choices
+        are revised, which in practice happens only in the last teams.
+        With an odd number of teams, the lowest one without a bye sits out
+        and gets the points of a win.
+
+        Args:
+            team_ids (Sequence[int]): The ids of the teams in the tournament.
+            matches (Sequence[Match]): The matches of the previous rounds,
+                all of them played.
+
+        Returns:
+            List[Pairing]: The pairings of the next round, empty after the last one.
+        """
+
+        played_rounds = current_round(matches)
+        if played_rounds >= self.rounds(len(team_ids)):
+            return []
+
+        points: dict[int, int] = dict.fromkeys(team_ids, 0)
+        opponents: dict[int, set[int]] = defaultdict(set)
+        appearances: dict[int, int] = dict.fromkeys(team_ids, 0)
+
+        for match in matches:
+            opponents[match.team1_id].add(match.team2_id)
+            opponents[match.team2_id].add(match.team1_id)
+            appearances[match.team1_id] = appearances.get(match.team1_id, 0) + 1
+            appearances[match.team2_id] = appearances.get(match.team2_id, 0) + 1
+
+            if not is_played(match):
+                continue
+            if match.team1_score > match.team2_score:
+                points[match.team1_id] = points.get(match.team1_id, 0) + WIN_POINTS
+            elif match.team1_score < match.team2_score:
+                points[match.team2_id] = points.get(match.team2_id, 0) + WIN_POINTS
+            else:
+                points[match.team1_id] = points.get(match.team1_id, 0) + DRAW_POINTS
+                points[match.team2_id] = points.get(match.team2_id, 0) + DRAW_POINTS
+
+        # A team which played fewer matches than there were rounds had byes.
+        byes = {team_id for team_id in team_ids if appearances[team_id] < played_rounds}
+        for team_id in byes:
+            points[team_id] += WIN_POINTS * (played_rounds - appearances[team_id])
+
+        buchholz = {
+            team_id: sum(points.get(opponent, 0) for opponent in opponents[team_id])
+            for team_id in team_ids
+        }
+        order = sorted(team_ids, key=lambda team_id: (-points[team_id], -buchholz[team_id], team_id))
+
+        if len(order) % 2:
+            bye = next((team_id for team_id in reversed(order) if team_id not in byes), order[-1])
+            order.remove(bye)
+
+        pairs = _pair(order, opponents, MAX_BACKTRACKING_STEPS)
+        if pairs is None:
+            # Every pairing has a rematch (more rounds than the teams allow),
+            # the neighbours in the order are paired regardless.
+            pairs = list(zip(order[::2], order[1::2]))
+
+        return [Pairing(*pair) for pair in pairs]
+
+
+def _pair(
+        order: Sequence[int],
+        opponents: dict[int, set[int]],
+        max_steps: int,
+) -> List[tuple[int, int]] | None:
+    """A private function pairing the ordered teams without rematches.
+
+    The first unpaired team is paired with the nearest following team
+    it has not played, a depth-first search going back to the latest
+    choice when the remaining teams cannot be paired.
+
+    Args:
+        order (Sequence[int]): The ids of the teams, the strongest first.
+        opponents (dict[int, set[int]]): The previous opponents of the teams.
+        max_steps (int): The maximal number of revised choices.
+
+    Returns:
+        List[tuple[int, int]] | None: The pairs, None if there are none
+            without a rematch within the steps.
+    """
+    size = len(order)
+    used = [False] * size
+    stack: list[tuple[int, int]] = []
+    top, candidate = 0, 0
+    steps = 0
+
+    while True:
+        while top < size and used[top]:
+            top += 1
+        if top == size:
+            return [(order[first], order[second]) for first, second in stack]
+
+        played = opponents[order[top]]
+        candidate = max(candidate, top + 1)
+        while candidate < size and (used[candidate] or order[candidate] in played):
+            candidate += 1
+
+        if candidate < size:
+            used[top] = used[candidate] = True
+            stack.append((top, candidate))
+            top, candidate = top + 1, 0
+            continue
+
+        if not stack or steps == max_steps:
+            return None
+
+        top, candidate = stack.pop()
+        used[top] = used[candidate] = False
+        candidate += 1
+        steps += 1
@@ -0,0 +1 @@
+"""A package containing the matchmaking of solo players into teams."""
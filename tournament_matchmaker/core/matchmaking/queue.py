@@ -0,0 +1,160 @@
+"""A module containing the in-memory matchmaking queue."""
+
+import time
+from collections import OrderedDict, deque
+from typing import Callable, List
+
+
+class MatchmakingQueue:
+    """A class representing solo players waiting for a team, bucketed by rank.
+
+    Every rank has its own FIFO bucket, so a team is formed of the
+    longest waiting players of one rank as soon as the bucket has
+    enough of them. Enqueuing and leaving are O(1), independent of the
+    number of queued players.
+    """
+
+    def __init__(
+            self,
+            team_size: int,
+            clock: Callable[[], float] = time.monotonic,
+            wait_samples: int = 10_000,
+    ) -> None:
+        """The initializer of the `matchmaking queue`.
+
+        Args:
+            team_size (int): The number of players in a team.
+            clock (Callable[[], float], optional): The source of the current
+                time. Defaults to time.monotonic.
+            wait_samples (int, optional): The number of the latest waiting
+                times kept for the statistics. Defaults to 10_000.
+        """
+        self._team_size = team_size
+        self._clock = clock
+        self._buckets: dict[str, OrderedDict[int, float]] = {}
+        self._ranks: dict[int, str] = {}
+        self._waits: deque[float] = deque(maxlen=wait_samples)
+        self._matched_players = 0
+        self._formed_teams = 0
+
+    @staticmethod
+    def normalize_rank(rank: str) -> str:
+        """A method getting the bucket key of the rank.
+
+        Args:
+            rank (str): The rank of a player.
+
+        Returns:
+            str: The rank compared without case and surrounding spaces.
+        """
+        return rank.strip().lower()
+
+    def __contains__(self, player_id: int) -> bool:
+        """A method checking whether the player is queued."""
+        return player_id in self._ranks
+
+    def __len__(self) -> int:
+        """A method getting the number of queued players."""
+        return len(self._ranks)
+
+    def enqueue(self, player_id: int, rank: str) -> List[int] | None:
+        """A method queuing the player and forming a team if the bucket is full.
+
+        Args:
+            player_id (int): The id of the player.
+            rank (str): The rank of the player.
+
+        Raises:
+            ValueError: If the player is already queued.
+
+        Returns:
+            List[int] | None: The ids of the players of the formed team,
+                None if the player waits.
+        """
+        if player_id in self._ranks:
+            raise ValueError(f"Player {player_id} is already queued")
+
+        key = self.normalize_rank(rank)
+        bucket = self._buckets.setdefault(key, OrderedDict())
+        bucket[player_id] = self._clock()
+        self._ranks[player_id] = key
+
+        if len(bucket) < self._team_size:
+            return None
+
+        now = self._clock()
+        team = []
+        for _ in range(self._team_size):
+            member, enqueued_at = bucket.popitem(last=False)
+            del self._ranks[member]
+            self._waits.append(now - enqueued_at)
+            team.append(member)
+
+        self._matched_players += len(team)
+        self._formed_teams += 1
+
+        return team
+
+    def requeue(self, player_ids: List[int], rank: str) -> None:
+        """A method putting players of a team which was not saved back in front of their bucket.
+
+        The players are not matched again until the next player of their
+        rank is queued, and the team is no longer counted as formed.
+
+        Args:
+            player_ids (List[int]): The ids of the players, the longest waiting first.
+            rank (str): The rank of the players.
+        """
+        key = self.normalize_rank(rank)
+        bucket = self._buckets.setdefault(key, OrderedDict())
+        now = self._clock()
+        for player_id in reversed(player_ids):
+            if player_id in self._ranks:
+                continue
+            bucket[player_id] = now
+            bucket.move_to_end(player_id, last=False)
+            self._ranks[player_id] = key
+
+        self._formed_teams -= 1
+        self._matched_players -= self._team_size
+
+    def remove(self, player_id: int) -> bool:
+        """A method removing the player from the queue.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            bool: Whether the player was queued.
+        """
+        key = self._ranks.pop(player_id, None)
+        if key is None:
+            return False
+
+        del self._buckets[key][player_id]
+
+        return True
+
+    def stats(self) -> dict:
+        """A method getting the queue depth and the time-to-match statistics.
+
+        Returns:
+            dict: The queued players (in total and by rank), the formed
+                teams and the waiting times of the latest matched players.
+        """
+        waits = sorted(self._waits)
+
+        def percentile(p: float) -> float:
+            return waits[min(len(waits) - 1, int(p * len(waits)))] if waits else 0.0
+
+        return {
+            "team_size": self._team_size,
+            "queued": len(self._ranks),
+            "queued_by_rank": {key: len(bucket) for key, bucket in self._buckets.items() if bucket},
+            "matched_players": self._matched_players,
+            "formed_teams": self._formed_teams,
+            "time_to_match_avg": sum(waits) / len(waits) if waits else 0.0,
+            "time_to_match_p50": percentile(0.5),
+            "time_to_match_p95": percentile(0.95),
+            "time_to_match_max": waits[-1] if waits else 0.0,
+        }
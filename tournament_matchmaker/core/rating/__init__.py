@@ -0,0 +1 @@
+"""A package containing rating engines computing skill from match results."""
@@ -0,0 +1,98 @@
+"""A module containing the vectorized Elo rating engine."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+SCALE = 400.0
+
+
+class MatchHistory(NamedTuple):
+    """Model representing played matches as parallel arrays."""
+    match_day: np.ndarray
+    team1_id: np.ndarray
+    team2_id: np.ndarray
+    team1_score: np.ndarray
+    team2_score: np.ndarray
+
+
+class Ratings(NamedTuple):
+    """Model representing ratings of all teams as parallel arrays."""
+    team_id: np.ndarray
+    rating: np.ndarray
+    matches: np.ndarray
+
+
+def compute_elo(
+        history: MatchHistory,
+        initial_rating: float = INITIAL_RATING,
+        k_factor: float = K_FACTOR,
+) -> Ratings:
+    """Function replaying the match history and computing Elo ratings of teams.
+
+    The matches are replayed day by day. All matches of one day are
+    rated from the ratings before that day and applied as one batch,
+    so the work is a few array operations per day instead of Python
+    code per match. A win scores 1, a draw 0.5 and a loss 0.
+
+    Args:
+        history (MatchHistory): The played matches, in any order. A
+            history already sorted by day is not sorted again.
+        initial_rating (float, optional): The rating of a new team.
+            Defaults to INITIAL_RATING.
+        k_factor (float, optional): The maximal change of a rating in
+            one match. Defaults to K_FACTOR.
+
+    Returns:
+        Ratings: The final rating and the number of matches of every team.
+    """
+    days = history.match_day
+    if np.any(days[1:] < days[:-1]):
+        order = np.argsort(days, kind="stable")
+        history = MatchHistory(*(column[order] for column in history))
+        days = history.match_day
+
+    team_id, teams = _dense_ids(np.concatenate((history.team1_id, history.team2_id)))
+    team1, team2 = np.split(teams, 2)
+    score = np.sign(history.team1_score - history.team2_score) * 0.5 + 0.5
+
+    rating = np.full(len(team_id), initial_rating, dtype=np.float64)
+    starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+    ends = np.r_[starts[1:], len(days)]
+
+    for start, end in zip(starts, ends):
+        home, away = team1[start:end], team2[start:end]
+        expected = 1.0 / (1.0 + 10.0 ** ((rating[away] - rating[home]) / SCALE))
+        change = k_factor * (score[start:end] - expected)
+        np.add.at(rating, home, change)
+        np.subtract.at(rating, away, change)
+
+    return Ratings(
+        team_id=team_id,
+        rating=rating,
+        matches=np.bincount(teams, minlength=len(team_id)),
+    )
+
+
+def _dense_ids(ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """A private function numbering the distinct ids from 0.
+
+    Database ids are dense, so a lookup table indexed by id is used
+    instead of sorting, unless the ids are too sparse for it.
+
+    Args:
+        ids (np.ndarray): The ids, repeated.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The distinct sorted ids and the
+            number of every given id.
+    """
+    if not len(ids) or ids.min() < 0 or ids.max() > 4 * len(ids):
+        return np.unique(ids, return_inverse=True)
+
+    present = np.zeros(ids.max() + 1, dtype=bool)
+    present[ids] = True
+
+    return np.flatnonzero(present), (np.cumsum(present) - 1)[ids]
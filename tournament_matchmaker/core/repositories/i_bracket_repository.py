@@ -0,0 +1,48 @@
+"""Module containing bracket repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+from tournament_matchmaker.core.domains.bracket import Bracket
+from tournament_matchmaker.core.domains.match import MatchIn
+
+
+class IBracketRepository(ABC):
+    """An abstract class representing protocol of bracket repository."""
+
+    @abstractmethod
+    async def get_by_tournament_id(self, tournament_id: int, for_update: bool = False) -> Any | None:
+        """The abstract getting the bracket of the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+            for_update (bool, optional): Whether to lock the bracket until
+                the end of the current transaction. Defaults to False.
+
+        Returns:
+            Any | None: The bracket, None if the tournament has none.
+        """
+
+    @abstractmethod
+    async def add_bracket(self, bracket: Bracket, matches: dict[int, MatchIn]) -> Any | None:
+        """The abstract adding a new bracket with the matches of its nodes.
+
+        Args:
+            bracket (Bracket): The new bracket.
+            matches (dict[int, MatchIn]): The new matches by nodes.
+
+        Returns:
+            Any | None: The saved bracket, None if the tournament already has one.
+        """
+
+    @abstractmethod
+    async def update_bracket(self, bracket: Bracket, matches: dict[int, MatchIn]) -> Any | None:
+        """The abstract saving the bracket with the matches of its new nodes.
+
+        Args:
+            bracket (Bracket): The bracket, with the version it was read with.
+            matches (dict[int, MatchIn]): The new matches by nodes.
+
+        Returns:
+            Any | None: The saved bracket, None if it was changed since it was read.
+        """
@@ -0,0 +1,95 @@
+"""Module containing job repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+from tournament_matchmaker.core.domains.job import JobIn
+
+
+class IJobRepository(ABC):
+    """An abstract class representing protocol of job repository."""
+
+    @abstractmethod
+    async def get_by_id(self, job_id: int) -> Any | None:
+        """The abstract getting job by provided id.
+
+        Args:
+            job_id (int): The id of the job.
+
+        Returns:
+            Any | None: The state of the job.
+        """
+
+    @abstractmethod
+    async def get_queued_ids(self) -> Iterable[int]:
+        """The abstract getting the ids of the jobs waiting to run.
+
+        Returns:
+            Iterable[int]: The ids of the queued jobs, the oldest first.
+        """
+
+    @abstractmethod
+    async def add_job(self, data: JobIn) -> Any | None:
+        """The abstract adding new queued job to the data storage.
+
+        Args:
+            data (JobIn): The work of the job.
+
+        Returns:
+            Any | None: The newly added job.
+        """
+
+    @abstractmethod
+    async def claim_job(self, job_id: int) -> JobIn | None:
+        """The abstract marking the queued job as running.
+
+        Args:
+            job_id (int): The id of the job.
+
+        Returns:
+            JobIn | None: The work of the job, None if it is not queued
+                (e.g. claimed by another worker).
+        """
+
+    @abstractmethod
+    async def update_progress(self, job_id: int, progress: int, total: int | None) -> bool:
+        """The abstract saving the progress of the running job.
+
+        Args:
+            job_id (int): The id of the job.
+            progress (int): The number of the processed items.
+            total (int | None): The number of all items, None if unknown.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+    @abstractmethod
+    async def finish_job(
+            self,
+            job_id: int,
+            result: dict | None = None,
+            error: str | None = None,
+    ) -> bool:
+        """The abstract marking the running job as succeeded or, with an error, failed.
+
+        Args:
+            job_id (int): The id of the job.
+            result (dict | None, optional): The result of the job. Defaults to None.
+            error (str | None, optional): The reason of the failure. Defaults to None.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+    @abstractmethod
+    async def fail_stale_jobs(self, stale_after: float) -> int:
+        """The abstract failing running jobs which stopped reporting progress.
+
+        Args:
+            stale_after (float): The time without saves in seconds
+                after which the worker of the job is considered dead.
+
+        Returns:
+            int: The number of the failed jobs.
+        """
@@ -1,8 +1,10 @@
 """Module containing match repository abstractions."""
 
+import datetime
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List
+from typing import Any, AsyncIterator, Iterable, List
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.match import MatchIn, Match
 from tournament_matchmaker.core.domains.tournament import Tournament
 
@@ -18,6 +20,38 @@ class IMatchRepository(ABC):
             Iterable[Any]: Matches in the data storage.
         """
 
+    @abstractmethod
+    async def get_matches_page(self, limit: int, after: str | None = None) -> Page:
+        """The abstract getting a page of matches from the data storage.
+
+        Args:
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Matches on the page.
+        """
+
+    @abstractmethod
+    def iterate_matches(self) -> AsyncIterator[Any]:
+        """The abstract iterating over all matches in the data storage.
+
+        Returns:
+            AsyncIterator[Any]: Matches read with a server-side cursor.
+        """
+
+    @abstractmethod
+    async def count_matches(self) -> int:
+        """The abstract counting all matches in the data storage.
+
+        Returns:
+            int: The number of matches in the data storage.
+        """
+
     @abstractmethod
     async def get_by_id(self, match_id: int) -> Any | None:
         """The abstract getting match by provided id.
@@ -40,6 +74,42 @@ class IMatchRepository(ABC):
             List[Match]: The list of matches
         """
 
+    @abstractmethod
+    async def has_matches(self, tournament_ids: Iterable[int]) -> bool:
+        """The abstract checking whether any of the tournaments has matches.
+
+        Args:
+            tournament_ids (Iterable[int]): The ids of the tournaments.
+
+        Returns:
+            bool: Whether a match of the tournaments exists.
+        """
+
+    @abstractmethod
+    async def get_matches_page_by_date(
+            self,
+            match_date: datetime.date,
+            limit: int,
+            after: str | None = None,
+            tournament_id: int | None = None,
+    ) -> Page:
+        """The abstract getting a page of matches played on the date.
+
+        Args:
+            match_date (datetime.date): The date of the matches.
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+            tournament_id (int | None, optional): The id of the tournament
+                to narrow the matches to. Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: The matches of the date on the page.
+        """
+
     @abstractmethod
     async def add_match(self, data: MatchIn) -> Any | None:
         """The abstract adding new match to the data storage.
@@ -51,6 +121,36 @@ class IMatchRepository(ABC):
             Any | None: The newly added match.
         """
 
+    @abstractmethod
+    async def add_matches(self, data: List[MatchIn]) -> List[int]:
+        """The abstract adding many new matches to the data storage at once.
+
+        Args:
+            data (List[MatchIn]): The details of the new matches.
+
+        Returns:
+            List[int]: The ids of the newly added matches.
+        """
+
+    @abstractmethod
+    async def add_round(
+            self,
+            tournament_id: int,
+            round_number: int,
+            data: List[MatchIn],
+    ) -> List[int] | None:
+        """The abstract adding the matches of a new round of the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+            round_number (int): The number of the new round.
+            data (List[MatchIn]): The details of the new matches.
+
+        Returns:
+            List[int] | None: The ids of the newly added matches, None if
+                the round or a later one already exists.
+        """
+
     @abstractmethod
     async def update_match(
             self,
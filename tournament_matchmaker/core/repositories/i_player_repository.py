@@ -1,8 +1,9 @@
 """Module containing player repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.player import PlayerIn
 
 
@@ -17,6 +18,38 @@ class IPlayerRepository(ABC):
             Iterable[Any]: Players in the data storage.
         """
 
+    @abstractmethod
+    async def get_players_page(self, limit: int, after: str | None = None) -> Page:
+        """The abstract getting a page of players from the data storage.
+
+        Args:
+            limit (int): The maximal number of players on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Players on the page.
+        """
+
+    @abstractmethod
+    def iterate_players(self) -> AsyncIterator[Any]:
+        """The abstract iterating over all players in the data storage.
+
+        Returns:
+            AsyncIterator[Any]: Players read with a server-side cursor.
+        """
+
+    @abstractmethod
+    async def count_players(self) -> int:
+        """The abstract counting all players in the data storage.
+
+        Returns:
+            int: The number of players in the data storage.
+        """
+
     @abstractmethod
     async def get_by_id(self, player_id: int) -> Any | None:
         """The abstract getting player by provided id.
@@ -50,6 +83,17 @@ class IPlayerRepository(ABC):
             Any | None: The newly added player.
         """
 
+    @abstractmethod
+    async def add_players(self, data: Iterable[PlayerIn]) -> Iterable[Any]:
+        """The abstract adding many new players to the data storage at once.
+
+        Args:
+            data (Iterable[PlayerIn]): The details of the new players.
+
+        Returns:
+            Iterable[Any]: The newly added players, in the order of `data`.
+        """
+
     @abstractmethod
     async def update_player(
             self,
@@ -66,6 +110,18 @@ class IPlayerRepository(ABC):
             Any | None: The updated player details.
         """
 
+    @abstractmethod
+    async def update_players_team(self, team_ids: dict[int, int]) -> Iterable[int]:
+        """The abstract assigning many players without a team to their teams at once.
+
+        Args:
+            team_ids (dict[int, int]): The ids of the teams by player ids.
+
+        Returns:
+            Iterable[int]: The ids of the updated players, without the ones
+                which already had a team.
+        """
+
     @abstractmethod
     async def delete_player(self, player_id: int) -> bool:
         """The abstract updating removing player from the data storage.
@@ -0,0 +1,27 @@
+"""Module containing raport repository abstractions."""
+
+from abc import ABC, abstractmethod
+
+
+class IRaportRepository(ABC):
+    """An abstract class representing protocol of raport repository."""
+
+    @abstractmethod
+    async def get_summary(self, approximate: bool = False) -> dict:
+        """The abstract getting numbers of all entities in the data storage.
+
+        Args:
+            approximate (bool, optional): Whether to use the planner
+                estimates instead of exact counts. Defaults to False.
+
+        Returns:
+            dict: The numbers of tournaments, players, teams and matches.
+        """
+
+    @abstractmethod
+    def get_pool_stats(self) -> dict:
+        """The abstract getting statistics of the data storage connection pool.
+
+        Returns:
+            dict: The pool limits, usage and acquisition wait times.
+        """
@@ -0,0 +1,62 @@
+"""Module containing rating repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+from tournament_matchmaker.core.rating.elo import MatchHistory, Ratings
+
+
+class IRatingRepository(ABC):
+    """An abstract class representing protocol of rating repository."""
+
+    @abstractmethod
+    async def get_by_team_id(self, team_id: int) -> Any | None:
+        """The abstract getting the rating of the team.
+
+        Args:
+            team_id (int): The id of the team.
+
+        Returns:
+            Any | None: The rating of the team, None if it was not rated.
+        """
+
+    @abstractmethod
+    async def get_by_team_ids(self, team_ids: Iterable[int]) -> Iterable[Any]:
+        """The abstract getting the ratings of the teams with a single query.
+
+        Args:
+            team_ids (Iterable[int]): The ids of the teams.
+
+        Returns:
+            Iterable[Any]: The ratings of the rated teams, others are skipped.
+        """
+
+    @abstractmethod
+    async def get_leaderboard(self, limit: int) -> Iterable[Any]:
+        """The abstract getting the best rated teams.
+
+        Args:
+            limit (int): The maximal number of teams.
+
+        Returns:
+            Iterable[Any]: The ratings, the best first.
+        """
+
+    @abstractmethod
+    async def get_match_history(self) -> MatchHistory:
+        """The abstract getting all played matches for rating.
+
+        Returns:
+            MatchHistory: The played matches as arrays.
+        """
+
+    @abstractmethod
+    async def replace_ratings(self, ratings: Ratings) -> int:
+        """The abstract replacing all stored ratings.
+
+        Args:
+            ratings (Ratings): The new ratings of all teams.
+
+        Returns:
+            int: The number of stored ratings.
+        """
@@ -0,0 +1,27 @@
+"""Module containing standings repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+
+class IStandingsRepository(ABC):
+    """An abstract class representing protocol of standings repository."""
+
+    @abstractmethod
+    async def get_by_tournament_id(self, tournament_id: int) -> Iterable[Any]:
+        """The abstract getting standings of the tournament, best team first.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Iterable[Any]: The standings of teams which played in the tournament.
+        """
+
+    @abstractmethod
+    async def rebuild(self) -> int:
+        """The abstract regenerating all standings from the match history.
+
+        Returns:
+            int: The number of standings rows.
+        """
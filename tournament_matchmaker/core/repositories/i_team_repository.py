@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.team import TeamIn
 
 
@@ -17,6 +18,30 @@ class ITeamRepository(ABC):
             Iterable[Any]: Teams in the data storage.
         """
 
+    @abstractmethod
+    async def get_teams_page(self, limit: int, after: str | None = None) -> Page:
+        """The abstract getting a page of teams from the data storage.
+
+        Args:
+            limit (int): The maximal number of teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Teams on the page.
+        """
+
+    @abstractmethod
+    async def count_teams(self) -> int:
+        """The abstract counting all teams in the data storage.
+
+        Returns:
+            int: The number of teams in the data storage.
+        """
+
     @abstractmethod
     async def get_by_id(self, team_id: int) -> Any | None:
         """The abstract getting team by provided id.
@@ -28,6 +53,28 @@ class ITeamRepository(ABC):
             Any | None: The team details.
         """
 
+    @abstractmethod
+    async def get_by_ids(self, team_ids: Iterable[int]) -> Iterable[Any]:
+        """The abstract getting teams by provided ids with a single query.
+
+        Args:
+            team_ids (Iterable[int]): The ids of the teams.
+
+        Returns:
+            Iterable[Any]: The details of the found teams, unknown ids are skipped.
+        """
+
+    @abstractmethod
+    async def get_tournament_winner(self, tournament_id: int) -> Any | None:
+        """The abstract getting the team with the most wins in the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Any | None: The winner team details.
+        """
+
     @abstractmethod
     async def add_team(self, data: TeamIn) -> Any | None:
         """The abstract adding new team to the data storage.
@@ -39,6 +86,17 @@ class ITeamRepository(ABC):
             Any | None: The newly added team.
         """
 
+    @abstractmethod
+    async def add_teams(self, data: Iterable[TeamIn]) -> Iterable[Any]:
+        """The abstract adding many new teams to the data storage at once.
+
+        Args:
+            data (Iterable[TeamIn]): The details of the new teams.
+
+        Returns:
+            Iterable[Any]: The newly added teams, in the order of `data`.
+        """
+
     @abstractmethod
     async def update_team(
             self,
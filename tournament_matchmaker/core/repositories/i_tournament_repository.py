@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.tournament import TournamentIn
 
 
@@ -17,6 +18,30 @@ class ITournamentRepository(ABC):
             Iterable[Any]: Tournaments in the data storage.
         """
 
+    @abstractmethod
+    async def get_tournaments_page(self, limit: int, after: str | None = None) -> Page:
+        """The abstract getting a page of tournaments from the data storage.
+
+        Args:
+            limit (int): The maximal number of tournaments on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Tournaments on the page.
+        """
+
+    @abstractmethod
+    async def count_tournaments(self) -> int:
+        """The abstract counting all tournaments in the data storage.
+
+        Returns:
+            int: The number of tournaments in the data storage.
+        """
+
     @abstractmethod
     async def get_by_id(self, tournament_id: int) -> Any | None:
         """The abstract getting tournament by provided id.
@@ -52,7 +77,8 @@ class ITournamentRepository(ABC):
             data (TournamentIn): The details of the updated tournament.
 
         Returns:
-            Any | None: The updated tournament details.
+            Any | None: The updated tournament details, None if it does
+                not exist or its format would change after its matches.
         """
 
     @abstractmethod
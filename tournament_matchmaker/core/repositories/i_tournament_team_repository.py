@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.tournament_team import TournamentTeamIn
 
 
@@ -17,6 +18,22 @@ class ITournamentTeamRepository(ABC):
             Iterable[Any]: TournamentTeams in the data storage.
         """
 
+    @abstractmethod
+    async def get_tournament_teams_page(self, limit: int, after: str | None = None) -> Page:
+        """The abstract getting a page of tournament_teams from the data storage.
+
+        Args:
+            limit (int): The maximal number of tournament_teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: TournamentTeams on the page.
+        """
+
     @abstractmethod
     async def get_by_tournament_id_team_id(self, tournament_id:int, team_id: int) -> Any | None:
         """The abstract getting tournament_team by provided combination of tournament id and team id.
@@ -30,11 +47,14 @@ class ITournamentTeamRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all_by_tournament_id(self, tournament_id: int) -> Iterable[Any]:
+    async def get_all_by_tournament_id(self, tournament_id: int, for_update: bool = False) -> Iterable[Any]:
         """The abstract getting all tournament_teams by provided tournament id.
 
         Args:
             tournament_id (int): Tournament id of the tournament_team.
+            for_update (bool, optional): Whether to lock the registrations of
+                the tournament until the end of the current transaction.
+                Defaults to False.
 
         Returns:
             Iterable[Any]: TournamentTeams in the data storage.
@@ -54,13 +74,15 @@ class ITournamentTeamRepository(ABC):
 
     @abstractmethod
     async def add_tournament_team(self, data: TournamentTeamIn) -> Any | None:
-        """The abstract adding new tournament_team to the data storage.
+        """The abstract registering the team for the tournament if it has a free slot.
 
         Args:
             data (TournamentTeamIn): The details of the new tournament_team.
 
         Returns:
-            Any | None: The newly added tournament_team.
+            Any | None: The newly added tournament_team, None if the tournament
+                is full, unknown or started or the team is unknown or already
+                registered.
         """
 
     @abstractmethod
@@ -74,7 +96,9 @@ class ITournamentTeamRepository(ABC):
             data (TeamTournamentIn): The details of the updated team_tournament.
 
         Returns:
-            Any | None: The updated tournament_team details.
+            Any | None: The updated tournament_team details, None if it does
+                not exist, one of the tournaments has started, the new one
+                is full or the team is already registered for it.
         """
 
     @abstractmethod
@@ -86,6 +110,6 @@ class ITournamentTeamRepository(ABC):
             team_id (int): The id of the team.
 
         Returns:
-            bool: Success of the operation.
+            bool: Success of the operation, False if the tournament has started.
         """
 
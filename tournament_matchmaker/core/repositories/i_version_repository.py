@@ -0,0 +1,19 @@
+"""Module containing table version repository abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class IVersionRepository(ABC):
+    """An abstract class representing protocol of table version repository."""
+
+    @abstractmethod
+    async def get_versions(self, tables: Iterable[str]) -> dict[str, int]:
+        """The abstract getting change counters of the tables.
+
+        Args:
+            tables (Iterable[str]): The names of the tables.
+
+        Returns:
+            dict[str, int]: The change counter of every table.
+        """
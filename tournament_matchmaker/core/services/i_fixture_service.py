@@ -0,0 +1,82 @@
+"""Module containing fixture service abstractions."""
+
+import datetime
+from abc import ABC, abstractmethod
+from typing import List
+
+from tournament_matchmaker.core.domains.bracket import BracketView
+from tournament_matchmaker.core.domains.match import Match, MatchIn
+from tournament_matchmaker.core.domains.tournament import Tournament
+
+
+class IFixtureService(ABC):
+    """A class representing fixture service."""
+
+    @abstractmethod
+    async def start(self, tournament: Tournament) -> List[Match]:
+        """The method generating the first round of the tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Returns:
+            List[Match]: The new matches, empty if the tournament has started.
+        """
+
+    @abstractmethod
+    async def schedule(self, tournament: Tournament, until: datetime.date) -> List[Match]:
+        """The method generating the missing rounds up to the date.
+
+        Args:
+            tournament (Tournament): The tournament.
+            until (datetime.date): The date of the last round to generate.
+
+        Raises:
+            ValueError: If the rounds of the format depend on results.
+
+        Returns:
+            List[Match]: The new matches, empty if all rounds up to the date exist.
+        """
+
+    @abstractmethod
+    async def update_match(self, match_id: int, data: MatchIn, tournament: Tournament) -> Match | None:
+        """The method updating the match, moving the teams of a decided bracket match on.
+
+        Args:
+            match_id (int): The id of the match.
+            data (MatchIn): The details of the updated match.
+            tournament (Tournament): The tournament of the updated match.
+
+        Raises:
+            ValueError: If the teams or the score of a decided bracket
+                match would change.
+
+        Returns:
+            Match | None: The updated match details.
+        """
+
+    @abstractmethod
+    async def get_bracket(self, tournament_id: int) -> BracketView | None:
+        """The method getting the bracket of the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            BracketView | None: The bracket, None if the tournament has none.
+        """
+
+    @abstractmethod
+    async def next_round(self, tournament: Tournament) -> List[Match]:
+        """The method generating the round after the latest one, by the format of the tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Raises:
+            ValueError: If a match of the latest round was not played and
+                the format pairs from results.
+
+        Returns:
+            List[Match]: The new matches, empty if the tournament is complete.
+        """
@@ -0,0 +1,34 @@
+"""Module containing forecast service abstractions."""
+
+from abc import ABC, abstractmethod
+
+from tournament_matchmaker.core.domains.forecast import Forecast
+from tournament_matchmaker.core.domains.tournament import Tournament
+
+
+class IForecastService(ABC):
+    """A class representing forecast service."""
+
+    @abstractmethod
+    async def get_forecast(self, tournament: Tournament) -> Forecast:
+        """The method getting the chances of the teams to win the tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Returns:
+            Forecast: The chances of the teams, the most likely winner first.
+        """
+
+    @abstractmethod
+    def evict(self, tournament_id: int | None = None) -> None:
+        """The method dropping the cached forecast after a match of the tournament changed.
+
+        Args:
+            tournament_id (int | None, optional): The id of the tournament,
+                None for all tournaments. Defaults to None.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """The method stopping the simulation workers."""
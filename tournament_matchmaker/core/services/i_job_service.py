@@ -0,0 +1,50 @@
+"""Module containing job service abstractions."""
+
+from abc import ABC, abstractmethod
+
+from tournament_matchmaker.core.domains.job import Job, JobIn
+
+
+class IJobService(ABC):
+    """A class representing job service."""
+
+    @abstractmethod
+    async def submit(self, data: JobIn) -> Job:
+        """The method queuing new job for the workers.
+
+        Args:
+            data (JobIn): The work of the job.
+
+        Raises:
+            ValueError: If the queue of the jobs is full.
+
+        Returns:
+            Job: The queued job.
+        """
+
+    @abstractmethod
+    async def get_by_id(self, job_id: int) -> Job | None:
+        """The method getting the state of the job.
+
+        Args:
+            job_id (int): The id of the job.
+
+        Returns:
+            Job | None: The job details.
+        """
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """The method getting the throughput of the workers by job kind.
+
+        Returns:
+            dict: The statistics of the workers and the jobs run by them.
+        """
+
+    @abstractmethod
+    async def start(self) -> None:
+        """The method starting the workers, resuming jobs queued before."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """The method stopping the workers, failing the jobs they run."""
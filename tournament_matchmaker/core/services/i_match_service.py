@@ -1,8 +1,10 @@
 """Module containing match service abstractions."""
 
+import datetime
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import AsyncIterator, Iterable, List
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.match import Match, MatchIn
 from tournament_matchmaker.core.domains.tournament import Tournament
 
@@ -19,6 +21,38 @@ class IMatchService(ABC):
         """
 
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of matches from the repository.
+
+        Args:
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Matches on the page.
+        """
+
+    @abstractmethod
+    def iterate_all(self) -> AsyncIterator[Match]:
+        """The method iterating over all matches in the repository.
+
+        Returns:
+            AsyncIterator[Match]: All matches, fetched lazily.
+        """
+
+    @abstractmethod
+    async def count(self) -> int:
+        """The method counting all matches in the repository.
+
+        Returns:
+            int: The number of matches.
+        """
+
     @abstractmethod
     async def get_by_id(self, match_id: int) -> Match | None:
         """The method getting match by provided id.
@@ -41,6 +75,42 @@ class IMatchService(ABC):
             List[Match]: List of the matches.
         """
 
+    @abstractmethod
+    async def has_matches(self, tournament_ids: Iterable[int]) -> bool:
+        """The method checking whether any of the tournaments has matches.
+
+        Args:
+            tournament_ids (Iterable[int]): The ids of the tournaments.
+
+        Returns:
+            bool: Whether a match of the tournaments exists.
+        """
+
+
+    @abstractmethod
+    async def get_page_by_date(
+            self,
+            match_date: datetime.date,
+            limit: int,
+            after: str | None = None,
+            tournament_id: int | None = None,
+    ) -> Page:
+        """The method getting a page of matches played on the date.
+
+        Args:
+            match_date (datetime.date): The date of the matches.
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+            tournament_id (int | None, optional): The id of the tournament
+                to narrow the matches to. Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: The matches of the date on the page.
+        """
 
     @abstractmethod
     async def add_match(self, data: MatchIn) -> Match | None:
@@ -53,6 +123,17 @@ class IMatchService(ABC):
             Match | None: Full details of the newly added match.
         """
 
+    @abstractmethod
+    async def add_matches(self, data: List[MatchIn]) -> List[int]:
+        """The method adding many new matches to the data storage at once.
+
+        Args:
+            data (List[MatchIn]): The details of the new matches.
+
+        Returns:
+            List[int]: The ids of the newly added matches.
+        """
+
     @abstractmethod
     async def update_match(
             self,
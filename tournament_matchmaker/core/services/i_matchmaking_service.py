@@ -0,0 +1,54 @@
+"""Module containing matchmaking service abstractions."""
+
+from abc import ABC, abstractmethod
+
+from tournament_matchmaker.core.domains.matchmaking import QueueTicket
+from tournament_matchmaker.core.domains.player import Player
+
+
+class IMatchmakingService(ABC):
+    """A class representing matchmaking service."""
+
+    @abstractmethod
+    def is_queued(self, player_id: int) -> bool:
+        """The method checking whether the player waits for a team.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            bool: Whether the player is queued or its team is being created.
+        """
+
+    @abstractmethod
+    async def enqueue(self, player: Player) -> QueueTicket:
+        """The method queuing the player, creating a team if enough players of its rank wait.
+
+        Args:
+            player (Player): The player without a team.
+
+        Raises:
+            ValueError: If the player is already queued.
+
+        Returns:
+            QueueTicket: The state of the player, with its team if it was matched.
+        """
+
+    @abstractmethod
+    def leave(self, player_id: int) -> bool:
+        """The method removing the player from the queue.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            bool: Whether the player was queued.
+        """
+
+    @abstractmethod
+    def get_stats(self) -> dict:
+        """The method getting the queue depth and the time-to-match statistics.
+
+        Returns:
+            dict: The statistics of the queue.
+        """
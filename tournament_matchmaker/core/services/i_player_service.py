@@ -1,8 +1,9 @@
 """Module containing player service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.player import Player, PlayerIn
 
 
@@ -18,6 +19,38 @@ class IPlayerService(ABC):
         """
 
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of players from the repository.
+
+        Args:
+            limit (int): The maximal number of players on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Players on the page.
+        """
+
+    @abstractmethod
+    def iterate_all(self) -> AsyncIterator[Player]:
+        """The method iterating over all players in the repository.
+
+        Returns:
+            AsyncIterator[Player]: All players, fetched lazily.
+        """
+
+    @abstractmethod
+    async def count(self) -> int:
+        """The method counting all players in the repository.
+
+        Returns:
+            int: The number of players.
+        """
+
     @abstractmethod
     async def get_by_id(self, player_id: int) -> Player | None:
         """The method getting player by provided id.
@@ -0,0 +1,35 @@
+"""Module containing raport service abstractions."""
+
+from abc import ABC, abstractmethod
+
+
+class IRaportService(ABC):
+    """A class representing raport repository."""
+
+    @abstractmethod
+    async def get_summary(self, approximate: bool = False) -> dict:
+        """The method getting numbers of all entities in the repository.
+
+        Args:
+            approximate (bool, optional): Whether to use the planner
+                estimates instead of exact counts. Defaults to False.
+
+        Returns:
+            dict: The numbers of tournaments, players, teams and matches.
+        """
+
+    @abstractmethod
+    def get_pool_stats(self) -> dict:
+        """The method getting statistics of the data storage connection pool.
+
+        Returns:
+            dict: The pool limits, usage and acquisition wait times.
+        """
+
+    @abstractmethod
+    def get_cache_stats(self) -> dict:
+        """The method getting statistics of the entity caches.
+
+        Returns:
+            dict: The size, hits and misses of every cache by entity type.
+        """
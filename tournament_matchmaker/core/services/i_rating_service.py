@@ -0,0 +1,40 @@
+"""Module containing rating service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from tournament_matchmaker.core.domains.rating import TeamRating
+
+
+class IRatingService(ABC):
+    """A class representing rating service."""
+
+    @abstractmethod
+    async def get_by_team_id(self, team_id: int) -> TeamRating | None:
+        """The method getting the rating of the team.
+
+        Args:
+            team_id (int): The id of the team.
+
+        Returns:
+            TeamRating | None: The rating of the team, None if it was not rated.
+        """
+
+    @abstractmethod
+    async def get_leaderboard(self, limit: int) -> Iterable[TeamRating]:
+        """The method getting the best rated teams.
+
+        Args:
+            limit (int): The maximal number of teams.
+
+        Returns:
+            Iterable[TeamRating]: The ratings, the best first.
+        """
+
+    @abstractmethod
+    async def recompute(self) -> int:
+        """The method recomputing ratings of all teams from the match history.
+
+        Returns:
+            int: The number of rated teams.
+        """
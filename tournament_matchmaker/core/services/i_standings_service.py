@@ -0,0 +1,29 @@
+"""Module containing standings service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from tournament_matchmaker.core.domains.standing import Standing
+
+
+class IStandingsService(ABC):
+    """A class representing standings service."""
+
+    @abstractmethod
+    async def get_by_tournament_id(self, tournament_id: int) -> Iterable[Standing]:
+        """The method getting standings of the tournament, best team first.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Iterable[Standing]: The standings of teams which played in the tournament.
+        """
+
+    @abstractmethod
+    async def rebuild(self) -> int:
+        """The method regenerating all standings from the match history.
+
+        Returns:
+            int: The number of standings rows.
+        """
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.tournament import Tournament, TournamentIn
 
 
@@ -18,6 +19,30 @@ class ITournamentService(ABC):
         """
 
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of tournaments from the repository.
+
+        Args:
+            limit (int): The maximal number of tournaments on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Tournaments on the page.
+        """
+
+    @abstractmethod
+    async def count(self) -> int:
+        """The method counting all tournaments in the repository.
+
+        Returns:
+            int: The number of tournaments.
+        """
+
     @abstractmethod
     async def get_by_id(self, tournament_id: int) -> Tournament | None:
         """The method getting tournament by provided id.
@@ -54,7 +79,8 @@ class ITournamentService(ABC):
             data (TournamentIn): The details of the updated tournament.
 
         Returns:
-            Tournament | None: The updated tournament details.
+            Tournament | None: The updated tournament details, None if it does
+                not exist or its format would change after its matches.
         """
 
     @abstractmethod
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.tournament_team import TournamentTeam, TournamentTeamIn
 
 
@@ -18,6 +19,22 @@ class ITournamentTeamService(ABC):
         """
 
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of tournament_teams from the repository.
+
+        Args:
+            limit (int): The maximal number of tournament_teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: TournamentTeams on the page.
+        """
+
     @abstractmethod
     async def get_by_tournament_id_team_id(self, tournament_id: int, team_id: int) -> TournamentTeam | None:
         """The method getting tournament_team by provided tournament id and team id.
@@ -55,13 +72,15 @@ class ITournamentTeamService(ABC):
 
     @abstractmethod
     async def add_tournament_team(self, data: TournamentTeamIn) -> TournamentTeam | None:
-        """The method adding new tournament_team to the data storage.
+        """The method registering the team for the tournament if it has a free slot.
 
         Args:
             data (TournamentTeamIn): The details of the new tournament_team.
 
         Returns:
-            TournamentTeam | None: Full details of the newly added tournament_team.
+            TournamentTeam | None: Full details of the newly added tournament_team,
+                None if the tournament is full, unknown or started or the team
+                is unknown or already registered.
         """
 
     @abstractmethod
@@ -73,7 +92,7 @@ class ITournamentTeamService(ABC):
             team_id (int): The id of the tournament.
 
         Returns:
-            bool: Success of the operation.
+            bool: Success of the operation, False if the tournament has started.
         """
 
     @abstractmethod
@@ -87,5 +106,7 @@ class ITournamentTeamService(ABC):
             data (TeamTournamentIn): The details of the updated team_tournament.
 
         Returns:
-            Any | None: The updated tournament_team details.
+            Any | None: The updated tournament_team details, None if it does
+                not exist, one of the tournaments has started, the new one
+                is full or the team is already registered for it.
         """
@@ -0,0 +1,21 @@
+"""Module containing table version service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+
+class IVersionService(ABC):
+    """A class representing table version service."""
+
+    @abstractmethod
+    async def get_etag(self, tables: Iterable[str], resource: str | None = None) -> str:
+        """The method getting an entity tag of data read from the tables.
+
+        Args:
+            tables (Iterable[str]): The names of the tables the data is read from.
+            resource (str | None, optional): The name of the single resource
+                the tag is scoped to. Defaults to None.
+
+        Returns:
+            str: The weak entity tag, changed with any write to the tables.
+        """
@@ -1,17 +1,26 @@
 """A module providing database access."""
 
 import asyncio
+import logging
+import sys
+import time
+from collections import Counter
+from contextvars import ContextVar
+from types import FrameType
+from typing import Any
 
+import asyncpg  # type: ignore
 import databases
 import sqlalchemy
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
 )
 
 from tournament_matchmaker.config import config
+from tournament_matchmaker.metrics import ROW_BUCKETS, registry
+from tournament_matchmaker.migrations import migrate
 
 metadata = sqlalchemy.MetaData()
 
@@ -22,6 +31,8 @@ player_table = sqlalchemy.Table(
     sqlalchemy.Column("name", sqlalchemy.String),
     sqlalchemy.Column("rank", sqlalchemy.String),
     sqlalchemy.Column("team_id", sqlalchemy.ForeignKey("team.id"), nullable = True),
+    sqlalchemy.Index("ix_player_team_id", "team_id"),
+    sqlalchemy.Index("ix_player_name_id", "name", "id"),
 )
 
 match_table = sqlalchemy.Table(
@@ -34,6 +45,11 @@ match_table = sqlalchemy.Table(
     sqlalchemy.Column("team1_score", sqlalchemy.Integer),
     sqlalchemy.Column("team2_score", sqlalchemy.Integer),
     sqlalchemy.Column("match_date", sqlalchemy.Date),
+    sqlalchemy.Column("round", sqlalchemy.Integer),
+    sqlalchemy.Index("ix_match_tournament_id", "tournament_id"),
+    sqlalchemy.Index("ix_match_team1_id", "team1_id"),
+    sqlalchemy.Index("ix_match_team2_id", "team2_id"),
+    sqlalchemy.Index("ix_match_match_date", "match_date"),
 )
 
 tournament_table = sqlalchemy.Table(
@@ -44,6 +60,9 @@ tournament_table = sqlalchemy.Table(
     sqlalchemy.Column("date", sqlalchemy.Date),
     sqlalchemy.Column("max_teams_count", sqlalchemy.Integer),
     sqlalchemy.Column("preffered_rank", sqlalchemy.String),
+    sqlalchemy.Column("teams_count", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Column("format", sqlalchemy.String, nullable = False, server_default = "round_robin"),
+    sqlalchemy.Index("ix_tournament_name_id", "name", "id"),
 )
 
 team_table = sqlalchemy.Table(
@@ -51,13 +70,74 @@ team_table = sqlalchemy.Table(
     metadata,
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
     sqlalchemy.Column("name", sqlalchemy.String),
+    sqlalchemy.Index("ix_team_name_id", "name", "id"),
 )
 
 tournament_team_table = sqlalchemy.Table(
     "tournament_team",
     metadata,
-    sqlalchemy.Column("tournament_id", sqlalchemy.Integer, sqlalchemy.ForeignKey("tournament.id"), nullable = False),
-    sqlalchemy.Column("team_id", sqlalchemy.Integer, sqlalchemy.ForeignKey("team.id"), nullable = False),
+    sqlalchemy.Column("tournament_id", sqlalchemy.Integer, sqlalchemy.ForeignKey("tournament.id"), primary_key=True),
+    sqlalchemy.Column("team_id", sqlalchemy.Integer, sqlalchemy.ForeignKey("team.id"), primary_key=True),
+    sqlalchemy.Index("ix_tournament_team_team_id", "team_id"),
+)
+
+standings_table = sqlalchemy.Table(
+    "standings",
+    metadata,
+    sqlalchemy.Column("tournament_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("team_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("played", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Column("wins", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Column("draws", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Column("losses", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Column("score_for", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Column("score_against", sqlalchemy.Integer, nullable = False, server_default = "0"),
+)
+
+bracket_table = sqlalchemy.Table(
+    "bracket",
+    metadata,
+    sqlalchemy.Column("tournament_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("double", sqlalchemy.Boolean, nullable = False),
+    sqlalchemy.Column("size", sqlalchemy.Integer, nullable = False),
+    sqlalchemy.Column("slots", ARRAY(sqlalchemy.Integer), nullable = False),
+    sqlalchemy.Column("winners", ARRAY(sqlalchemy.Integer), nullable = False),
+    sqlalchemy.Column("match_ids", ARRAY(sqlalchemy.Integer), nullable = False),
+    sqlalchemy.Column("version", sqlalchemy.Integer, nullable = False, server_default = "0"),
+)
+
+team_rating_table = sqlalchemy.Table(
+    "team_rating",
+    metadata,
+    sqlalchemy.Column("team_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("rating", sqlalchemy.Float, nullable = False),
+    sqlalchemy.Column("matches", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Index("ix_team_rating_rating", sqlalchemy.desc("rating"), "team_id"),
+)
+
+job_table = sqlalchemy.Table(
+    "job",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("kind", sqlalchemy.String, nullable = False),
+    sqlalchemy.Column("status", sqlalchemy.String, nullable = False, server_default = "queued"),
+    sqlalchemy.Column("params", JSONB(none_as_null=True), nullable = False, server_default = "{}"),
+    sqlalchemy.Column("progress", sqlalchemy.Integer, nullable = False, server_default = "0"),
+    sqlalchemy.Column("total", sqlalchemy.Integer),
+    sqlalchemy.Column("result", JSONB(none_as_null=True)),
+    sqlalchemy.Column("error", sqlalchemy.String),
+    sqlalchemy.Column("created_at", sqlalchemy.DateTime(timezone=True), nullable = False, server_default = sqlalchemy.func.now()),
+    sqlalchemy.Column("started_at", sqlalchemy.DateTime(timezone=True)),
+    sqlalchemy.Column("updated_at", sqlalchemy.DateTime(timezone=True), nullable = False, server_default = sqlalchemy.func.now()),
+    sqlalchemy.Column("finished_at", sqlalchemy.DateTime(timezone=True)),
+    sqlalchemy.Index("ix_job_status_id", "status", "id"),
+)
+
+table_version_table = sqlalchemy.Table(
+    "table_version",
+    metadata,
+    sqlalchemy.Column("table_name", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("version", sqlalchemy.BigInteger, nullable = False, server_default = "0"),
 )
 
 
@@ -66,39 +146,350 @@ db_uri = (
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
-engine = create_async_engine(
-    db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
+
+
+# The number of frames searched for the repository method of a query,
+# enough to get through helpers such as `fetch_page`.
+CALLER_DEPTH = 4
+
+query_seconds = registry.histogram(
+    "db_query_duration_seconds",
+    "Time of queries by repository method and database operation.",
+    ("method", "operation"),
 )
+query_rows = registry.histogram(
+    "db_query_rows",
+    "Rows fetched by queries by repository method.",
+    ("method",),
+    ROW_BUCKETS,
+)
+_method_names: dict[Any, str] = {}
+
+
+def _caller_name(frame: FrameType | None) -> str:
+    """Function naming the repository method which runs the query.
+
+    The name is looked up by code objects, so after the first query of
+    a method it costs a few dictionary lookups.
+
+    Args:
+        frame (FrameType | None): The frame of the caller of the database.
+
+    Returns:
+        str: The qualified name of the first repository method up the
+            stack, of the direct caller if there is none.
+    """
+    caller = frame
+    for _ in range(CALLER_DEPTH):
+        if frame is None:
+            break
+        code = frame.f_code
+        name = _method_names.get(code)
+        if name is None:
+            name = _method_names[code] = code.co_qualname if "Repository." in code.co_qualname else ""
+        if name:
+            return name
+        frame = frame.f_back
+
+    return caller.f_code.co_qualname if caller else "unknown"
+
+
+class QueryStats:
+    """A class representing the queries run while handling one request.
+
+    Tasks started by the request copy its context, so their queries are
+    counted too.
+    """
+
+    __slots__ = ("count", "time", "methods")
+
+    def __init__(self) -> None:
+        """The initializer of the `query stats`."""
+        self.count = 0
+        self.time = 0.0
+        self.methods: Counter[str] = Counter()
+
+    def record(self, method: str, elapsed: float) -> None:
+        """A method counting the query of the repository method.
+
+        Args:
+            method (str): The name of the repository method.
+            elapsed (float): The time of the query in seconds.
+        """
+        self.count += 1
+        self.time += elapsed
+        self.methods[method] += 1
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """A method getting the methods queried many times, likely in a loop (N+1).
+
+        Args:
+            threshold (int): The smallest number of queries reported.
+
+        Returns:
+            dict[str, int]: The numbers of queries by method name.
+        """
+        return {method: count for method, count in self.methods.items() if count >= threshold}
+
+
+request_queries: ContextVar[QueryStats | None] = ContextVar("request_queries", default=None)
+
+
+class TimedPool:
+    """A class representing an asyncpg pool proxy timing acquisitions."""
+
+    def __init__(self, pool: Any, database: "PooledDatabase") -> None:
+        """The initializer of the `timed pool`.
+
+        Args:
+            pool (Any): The proxied asyncpg pool.
+            database (PooledDatabase): The database recording wait times.
+        """
+        self._pool = pool
+        self._database = database
 
-database = databases.Database(
+    def __getattr__(self, name: str) -> Any:
+        """A method forwarding everything else to the proxied pool."""
+        return getattr(self._pool, name)
+
+    async def acquire(self, *args: Any, **kwargs: Any) -> Any:
+        """A method acquiring a connection and recording the wait time.
+
+        Returns:
+            Any: The acquired connection.
+        """
+        start = time.perf_counter()
+        try:
+            return await self._pool.acquire(*args, **kwargs)
+        finally:
+            self._database.record_wait(time.perf_counter() - start)
+
+
+class PooledDatabase(databases.Database):
+    """A class representing the database keeping statistics of its pool.
+
+    It is the only connection pool of the app, the schema is managed
+    through it too.
+    """
+
+    def __init__(self, url: str, metrics: bool = True, **options: Any) -> None:
+        """The initializer of the `pooled database`.
+
+        Args:
+            url (str): The database URL.
+            metrics (bool, optional): Whether to time the queries by
+                repository method. Defaults to True.
+            **options (Any): Options passed to the database and the pool.
+        """
+        super().__init__(url, **options)
+        self._metrics = metrics
+        self._acquisitions = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    async def connect(self) -> None:
+        """A method connecting to the database and timing pool acquisitions."""
+        await super().connect()
+
+        # The backend keeps the asyncpg pool privately, every query of
+        # `databases` acquires its connection through `Pool.acquire`.
+        self._backend._pool = TimedPool(self._backend._pool, self)  # type: ignore
+
+    async def fetch_all(self, query: Any, values: dict | None = None) -> list:
+        """A method fetching all rows of the query, timing it if enabled."""
+        if not self._metrics and request_queries.get() is None:
+            return await super().fetch_all(query, values)
+
+        start = time.perf_counter()
+        rows = None
+        try:
+            rows = await super().fetch_all(query, values)
+            return rows
+        finally:
+            self._observe(sys._getframe(1), "fetch_all", start, len(rows) if rows is not None else None)
+
+    async def fetch_one(self, query: Any, values: dict | None = None) -> Any:
+        """A method fetching the first row of the query, timing it if enabled."""
+        if not self._metrics and request_queries.get() is None:
+            return await super().fetch_one(query, values)
+
+        start = time.perf_counter()
+        row = rows = None
+        try:
+            row = await super().fetch_one(query, values)
+            rows = 0 if row is None else 1
+            return row
+        finally:
+            self._observe(sys._getframe(1), "fetch_one", start, rows)
+
+    async def fetch_val(self, query: Any, values: dict | None = None, column: Any = 0) -> Any:
+        """A method fetching a value of the first row of the query, timing it if enabled."""
+        if not self._metrics and request_queries.get() is None:
+            return await super().fetch_val(query, values, column=column)
+
+        start = time.perf_counter()
+        try:
+            return await super().fetch_val(query, values, column=column)
+        finally:
+            self._observe(sys._getframe(1), "fetch_val", start)
+
+    async def execute(self, query: Any, values: dict | None = None) -> Any:
+        """A method executing the query, timing it if enabled."""
+        if not self._metrics and request_queries.get() is None:
+            return await super().execute(query, values)
+
+        start = time.perf_counter()
+        try:
+            return await super().execute(query, values)
+        finally:
+            self._observe(sys._getframe(1), "execute", start)
+
+    async def execute_many(self, query: Any, values: list) -> None:
+        """A method executing the query for every values, timing it if enabled."""
+        if not self._metrics and request_queries.get() is None:
+            return await super().execute_many(query, values)
+
+        start = time.perf_counter()
+        try:
+            return await super().execute_many(query, values)
+        finally:
+            self._observe(sys._getframe(1), "execute_many", start)
+
+    def _observe(
+            self,
+            caller: FrameType,
+            operation: str,
+            start: float,
+            rows: int | None = None,
+    ) -> None:
+        """A private method recording the time and rows of a query.
+
+        The query is counted in the metrics and in the statistics of the
+        current request, if any.
+
+        Args:
+            caller (FrameType): The frame of the caller of the database.
+            operation (str): The name of the database method.
+            start (float): The time the query started at.
+            rows (int | None, optional): The number of fetched rows,
+                None if the query fetches none. Defaults to None.
+        """
+        elapsed = time.perf_counter() - start
+        method = _caller_name(caller)
+        if self._metrics:
+            query_seconds.labels(method, operation).observe(elapsed)
+            if rows is not None:
+                query_rows.labels(method).observe(rows)
+        if (stats := request_queries.get()) is not None:
+            stats.record(method, elapsed)
+
+    def record_wait(self, waited: float) -> None:
+        """A method recording the time spent waiting for a pooled connection.
+
+        Args:
+            waited (float): The wait time in seconds.
+        """
+        self._acquisitions += 1
+        self._wait_time_total += waited
+        self._wait_time_max = max(self._wait_time_max, waited)
+
+    def pool_stats(self) -> dict:
+        """A method getting the current statistics of the connection pool.
+
+        Returns:
+            dict: The pool limits, usage and acquisition wait times.
+        """
+        pool = getattr(self._backend, "_pool", None)
+        size = pool.get_size() if pool else 0
+        idle = pool.get_idle_size() if pool else 0
+
+        return {
+            "min_size": pool.get_min_size() if pool else 0,
+            "max_size": pool.get_max_size() if pool else 0,
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "acquisitions": self._acquisitions,
+            "wait_time_total": self._wait_time_total,
+            "wait_time_avg": self._wait_time_total / self._acquisitions if self._acquisitions else 0.0,
+            "wait_time_max": self._wait_time_max,
+        }
+
+
+database = PooledDatabase(
     db_uri,
-    force_rollback=True,
+    metrics=config.METRICS_ENABLED,
+    force_rollback=config.DB_FORCE_ROLLBACK,
+    min_size=min(config.DB_POOL_MIN_SIZE, config.DB_POOL_MAX_SIZE),
+    max_size=config.DB_POOL_MAX_SIZE,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    command_timeout=config.DB_COMMAND_TIMEOUT,
+)
+
+registry.gauge(
+    "db_pool_connections",
+    "Connections of the pool by state.",
+    lambda: {("in_use",): (stats := database.pool_stats())["in_use"], ("idle",): stats["idle"]},
+    ("state",),
+)
+registry.gauge(
+    "db_pool_max_connections",
+    "The maximal size of the pool.",
+    lambda: database.pool_stats()["max_size"],
+)
+registry.gauge(
+    "db_pool_acquisitions_total",
+    "Connections acquired from the pool.",
+    lambda: database.pool_stats()["acquisitions"],
+    kind="counter",
+)
+registry.gauge(
+    "db_pool_wait_seconds_total",
+    "Time spent waiting for pooled connections.",
+    lambda: database.pool_stats()["wait_time_total"],
+    kind="counter",
 )
 
+if config.DB_ECHO:
+    db_logger = logging.getLogger("databases")
+    db_logger.setLevel(logging.DEBUG)
+    if not db_logger.handlers:
+        db_logger.addHandler(logging.StreamHandler())
+
+
+async def connect_dedicated() -> asyncpg.Connection:
+    """Function opening a connection outside of the pool, e.g. for LISTEN.
+
+    Returns:
+        asyncpg.Connection: The new connection, closed by the caller.
+    """
+    return await asyncpg.connect(
+        db_uri.replace("postgresql+asyncpg://", "postgresql://", 1),
+        timeout=config.DB_COMMAND_TIMEOUT,
+    )
+
 
 async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+    """Function connecting to the DB and applying pending migrations.
 
     Args:
         retries (int, optional): Number of retries of connect to DB.
             Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        delay (int, optional): Delay of connect do DB. Defaults to 5.
     """
     for attempt in range(retries):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
-            return
+            await database.connect()
+            break
         except (
-                OperationalError,
-                DatabaseError,
+                OSError,
+                asyncio.TimeoutError,
                 CannotConnectNowError,
                 ConnectionDoesNotExistError,
         ) as e:
             print(f"Attempt {attempt + 1} failed: {e}")
             await asyncio.sleep(delay)
+    else:
+        raise ConnectionError("Could not connect to DB after several retries.")
 
-    raise ConnectionError("Could not connect to DB after several retries.")
+    await migrate(database, metadata)
@@ -0,0 +1,143 @@
+"""A module providing an in-process LRU cache with entry expiration."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUCache:
+    """A class representing a least-recently-used cache with a TTL.
+
+    Entries are evicted when the cache is full (the least recently used
+    one first) or when they are older than the TTL. The cache is meant
+    to be used from a single event loop, so it needs no locking.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            ttl: float,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """The initializer of the `LRU cache`.
+
+        Args:
+            max_size (int): The maximal number of entries.
+            ttl (float): The time to live of an entry in seconds.
+            clock (Callable[[], float], optional): The source of the current
+                time. Defaults to time.monotonic.
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def version(self) -> int:
+        """The number of invalidations so far.
+
+        A reader takes it before loading a value and passes it to `set`,
+        so a value loaded before a concurrent invalidation is not stored.
+        """
+        return self._version
+
+    def get(self, key: Hashable) -> Any | None:
+        """A method getting the entry and marking it as recently used.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            Any | None: The cached value, None if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: Any, version: int | None = None) -> None:
+        """A method storing the entry, evicting the least recently used one.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to store.
+            version (int | None, optional): The `version` read before the
+                value was loaded, the value is dropped if the cache was
+                invalidated since. Defaults to None (always stored).
+        """
+        if version is not None and version != self._version:
+            return
+
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """A method removing the entry after its source has changed.
+
+        Args:
+            key (Hashable): The key of the entry.
+        """
+        self._entries.pop(key, None)
+        self._version += 1
+        self._invalidations += 1
+
+    def evict(self, key: Hashable | None = None) -> None:
+        """A method removing the entry or, without a key, all entries.
+
+        Args:
+            key (Hashable | None, optional): The key of the entry.
+                Defaults to None.
+        """
+        if key is None:
+            self.clear()
+        else:
+            self.invalidate(key)
+
+    def clear(self) -> None:
+        """A method removing all entries."""
+        self._entries.clear()
+        self._version += 1
+        self._invalidations += 1
+
+    def stats(self) -> dict:
+        """A method getting the statistics of the cache.
+
+        Returns:
+            dict: The size, limits, hits, misses and removed entries.
+        """
+        lookups = self._hits + self._misses
+
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "ttl": self._ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+        }
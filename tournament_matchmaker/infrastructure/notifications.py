@@ -0,0 +1,123 @@
+"""A module providing the listener of entity change notifications.
+
+Writes to the entity tables are published by triggers (see migration
+0003) on the `entity_change` channel, in every worker the listener
+passes the changed keys to the subscribed handlers, e.g. cache eviction.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable
+
+
+CHANGES_CHANNEL = "entity_change"
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[Any | None], None]
+
+
+class ChangeListener:
+    """A class representing the listener of entity change notifications.
+
+    It keeps one dedicated connection (outside of the pool) listening to
+    the channel and reconnects when it is lost. As notifications sent
+    while it was disconnected are lost, every handler is then called with
+    None, meaning that any entity of the table could have changed.
+    """
+
+    def __init__(
+            self,
+            connect: Callable[[], Awaitable[Any]],
+            channel: str = CHANGES_CHANNEL,
+            reconnect_delay: float = 1.0,
+    ) -> None:
+        """The initializer of the `change listener`.
+
+        Args:
+            connect (Callable[[], Awaitable[Any]]): The factory of dedicated
+                asyncpg connections.
+            channel (str, optional): The notification channel.
+                Defaults to CHANGES_CHANNEL.
+            reconnect_delay (float, optional): The delay before reconnecting
+                in seconds. Defaults to 1.0.
+        """
+        self._connect = connect
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+        self._handlers: dict[str, list[tuple[str, Handler]]] = defaultdict(list)
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, table: str, handler: Handler, key: str = "id") -> None:
+        """A method registering the handler of changes of the table.
+
+        Args:
+            table (str): The name of the table.
+            handler (Handler): The function called with the changed key,
+                or with None if anything could have changed.
+            key (str, optional): The key column passed to the handler.
+                Defaults to "id".
+        """
+        self._handlers[table].append((key, handler))
+
+    async def start(self) -> None:
+        """A method starting listening in the background, if anything subscribed."""
+        if self._handlers and not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """A method stopping listening and closing the connection."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """A private method listening until cancelled, reconnecting on failures."""
+        while True:
+            connection = None
+            try:
+                connection = await self._connect()
+                lost = asyncio.get_running_loop().create_future()
+                connection.add_termination_listener(
+                    lambda _: lost.done() or lost.set_result(None)
+                )
+                await connection.add_listener(self._channel, self._on_notification)
+
+                # Changes made before the subscription are unknown.
+                self._reset()
+                await lost
+                logger.warning("Connection of the change listener lost")
+            except Exception:
+                # Any failure, e.g. an InterfaceError of a broken connection,
+                # only delays the next attempt.
+                logger.exception("Change listener failed")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+
+            self._reset()
+            await asyncio.sleep(self._reconnect_delay)
+
+    def _on_notification(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        """A private method passing the changed keys to the handlers of the table.
+
+        Args:
+            payload (str): The JSON with the table, operation and keys.
+        """
+        change = json.loads(payload)
+        keys = change.get("keys") or {}
+
+        for key, handler in self._handlers.get(change.get("table"), ()):
+            handler(keys.get(key))
+
+    def _reset(self) -> None:
+        """A private method telling every handler that anything could have changed."""
+        for handlers in self._handlers.values():
+            for _, handler in handlers:
+                handler(None)
@@ -0,0 +1,134 @@
+"""Module containing bracket repository implementation."""
+
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from tournament_matchmaker.core.domains.bracket import Bracket
+from tournament_matchmaker.core.domains.match import MatchIn
+from tournament_matchmaker.core.repositories.i_bracket_repository import IBracketRepository
+from tournament_matchmaker.db import (
+    bracket_table,
+    match_table,
+    database,
+)
+
+
+class BracketRepository(IBracketRepository):
+    """A class representing bracket DB repository.
+
+    The whole bracket is one row of arrays indexed by node, so it is read
+    with one primary key lookup. Concurrent results are serialized by
+    locking the row and by its version.
+    """
+
+    async def get_by_tournament_id(self, tournament_id: int, for_update: bool = False) -> Any | None:
+        """The method getting the bracket of the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+            for_update (bool, optional): Whether to lock the bracket until
+                the end of the current transaction. Defaults to False.
+
+        Returns:
+            Any | None: The bracket, None if the tournament has none.
+        """
+
+        query = (
+            select(bracket_table)
+            .where(bracket_table.c.tournament_id == tournament_id)
+        )
+        if for_update:
+            query = query.with_for_update()
+        bracket = await database.fetch_one(query)
+
+        return Bracket.from_record(bracket) if bracket else None
+
+    async def add_bracket(self, bracket: Bracket, matches: dict[int, MatchIn]) -> Any | None:
+        """The method adding a new bracket with the matches of its nodes.
+
+        Args:
+            bracket (Bracket): The new bracket.
+            matches (dict[int, MatchIn]): The new matches by nodes.
+
+        Returns:
+            Any | None: The saved bracket, None if the tournament already has one.
+        """
+
+        bracket = bracket.model_copy(deep=True)
+
+        async with database.transaction():
+            query = (
+                insert(bracket_table)
+                .values(**bracket.model_dump(exclude={"version"}))
+                .on_conflict_do_nothing()
+                .returning(bracket_table.c.version)
+            )
+            if await database.fetch_val(query) is None:
+                return None
+
+            await self._add_matches(bracket, matches)
+
+        return bracket
+
+    async def update_bracket(self, bracket: Bracket, matches: dict[int, MatchIn]) -> Any | None:
+        """The method saving the bracket with the matches of its new nodes.
+
+        Args:
+            bracket (Bracket): The bracket, with the version it was read with.
+            matches (dict[int, MatchIn]): The new matches by nodes.
+
+        Returns:
+            Any | None: The saved bracket, None if it was changed since it was read.
+        """
+
+        bracket = bracket.model_copy(deep=True)
+
+        async with database.transaction():
+            query = (
+                bracket_table.update()
+                .where(bracket_table.c.tournament_id == bracket.tournament_id)
+                .where(bracket_table.c.version == bracket.version)
+                .values(version=bracket_table.c.version + 1)
+                .returning(bracket_table.c.version)
+            )
+            version = await database.fetch_val(query)
+            if version is None:
+                return None
+
+            bracket.version = version
+            await self._add_matches(bracket, matches)
+
+        return bracket
+
+    async def _add_matches(self, bracket: Bracket, matches: dict[int, MatchIn]) -> None:
+        """A private method inserting the matches of the nodes and saving the arrays.
+
+        Args:
+            bracket (Bracket): The bracket, its match ids are filled in.
+            matches (dict[int, MatchIn]): The new matches by nodes.
+        """
+
+        nodes = sorted(matches)
+        if nodes:
+            query = (
+                match_table.insert()
+                .values([matches[node].model_dump() for node in nodes])
+                .returning(match_table.c.id)
+            )
+            # The ids are drawn from the sequence in the order of the values.
+            match_ids = sorted(match["id"] for match in await database.fetch_all(query))
+            for node, match_id in zip(nodes, match_ids):
+                bracket.match_ids[node] = match_id
+
+        query = (
+            bracket_table.update()
+            .where(bracket_table.c.tournament_id == bracket.tournament_id)
+            .values(
+                slots=bracket.slots,
+                winners=bracket.winners,
+                match_ids=bracket.match_ids,
+            )
+        )
+        await database.execute(query)
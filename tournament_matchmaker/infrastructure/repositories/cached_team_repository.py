@@ -0,0 +1,191 @@
+"""Module containing the cached team repository implementation."""
+
+from typing import Any, Iterable
+
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.core.domains.team import TeamIn
+from tournament_matchmaker.core.repositories.i_team_repository import ITeamRepository
+from tournament_matchmaker.infrastructure.cache import LRUCache
+
+
+class CachedTeamRepository(ITeamRepository):
+    """A class representing a read-through cache of team repository.
+
+    Teams looked up by id are kept in the cache, updates and deletes
+    through this repository refresh or invalidate their entries. New
+    teams are cached by their first read, as their insert may still be
+    rolled back by the transaction of the caller. Listings, counts and
+    aggregates are always read from the wrapped repository.
+    """
+
+    _repository: ITeamRepository
+    _cache: LRUCache
+
+    def __init__(self, repository: ITeamRepository, cache: LRUCache) -> None:
+        """The initializer of the `cached team repository`.
+
+        Args:
+            repository (ITeamRepository): The wrapped repository.
+            cache (LRUCache): The cache of teams by id.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_all_teams(self) -> Iterable[Any]:
+        """The method getting all teams from the data storage.
+
+        Returns:
+            Iterable[Any]: Teams in the data storage.
+        """
+
+        return await self._repository.get_all_teams()
+
+    async def get_teams_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of teams from the data storage.
+
+        Args:
+            limit (int): The maximal number of teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Teams on the page.
+        """
+
+        return await self._repository.get_teams_page(limit, after)
+
+    async def count_teams(self) -> int:
+        """The method counting all teams in the data storage.
+
+        Returns:
+            int: The number of teams in the data storage.
+        """
+
+        return await self._repository.count_teams()
+
+    async def get_by_id(self, team_id: int) -> Any | None:
+        """The method getting team by provided id, from the cache if possible.
+
+        Args:
+            team_id (int): The id of the team.
+
+        Returns:
+            Any | None: The team details.
+        """
+
+        if team := self._cache.get(team_id):
+            return team
+
+        version = self._cache.version
+        if team := await self._repository.get_by_id(team_id):
+            self._cache.set(team_id, team, version)
+
+        return team
+
+    async def get_by_ids(self, team_ids: Iterable[int]) -> Iterable[Any]:
+        """The method getting teams by provided ids, missing ones in one query.
+
+        Args:
+            team_ids (Iterable[int]): The ids of the teams.
+
+        Returns:
+            Iterable[Any]: The details of the found teams, unknown ids are skipped.
+        """
+
+        teams = []
+        missing = []
+        for team_id in set(team_ids):
+            if team := self._cache.get(team_id):
+                teams.append(team)
+            else:
+                missing.append(team_id)
+
+        if missing:
+            version = self._cache.version
+            for team in await self._repository.get_by_ids(missing):
+                self._cache.set(team.id, team, version)
+                teams.append(team)
+
+        return teams
+
+    async def get_tournament_winner(self, tournament_id: int) -> Any | None:
+        """The method getting the team with the most wins in the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Any | None: The winner team details.
+        """
+
+        return await self._repository.get_tournament_winner(tournament_id)
+
+    async def add_team(self, data: TeamIn) -> Any | None:
+        """The method adding new team to the data storage.
+
+        Args:
+            data (TeamIn): The details of the new team.
+
+        Returns:
+            Any | None: The newly added team.
+        """
+
+        return await self._repository.add_team(data)
+
+    async def add_teams(self, data: Iterable[TeamIn]) -> Iterable[Any]:
+        """The method adding many new teams to the data storage at once.
+
+        Args:
+            data (Iterable[TeamIn]): The details of the new teams.
+
+        Returns:
+            Iterable[Any]: The newly added teams, in the order of `data`.
+        """
+
+        return await self._repository.add_teams(data)
+
+    async def update_team(
+            self,
+            team_id: int,
+            data: TeamIn,
+    ) -> Any | None:
+        """The method updating team data in the data storage.
+
+        Args:
+            team_id (int): The id of the team.
+            data (TeamIn): The details of the updated team.
+
+        Returns:
+            Any | None: The updated team details.
+        """
+
+        team = await self._repository.update_team(
+            team_id=team_id,
+            data=data,
+        )
+
+        # Invalidated after the write, so that reads which started before
+        # it do not store the old values.
+        self._cache.invalidate(team_id)
+        if team:
+            self._cache.set(team_id, team)
+
+        return team
+
+    async def delete_team(self, team_id: int) -> bool:
+        """The method updating removing team from the data storage.
+
+        Args:
+            team_id (int): The id of the team.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        deleted = await self._repository.delete_team(team_id)
+        self._cache.invalidate(team_id)
+
+        return deleted
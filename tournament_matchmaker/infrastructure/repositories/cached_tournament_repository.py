@@ -0,0 +1,143 @@
+"""Module containing the cached tournament repository implementation."""
+
+from typing import Any, Iterable
+
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.core.domains.tournament import TournamentIn
+from tournament_matchmaker.core.repositories.i_tournament_repository import ITournamentRepository
+from tournament_matchmaker.infrastructure.cache import LRUCache
+
+
+class CachedTournamentRepository(ITournamentRepository):
+    """A class representing a read-through cache of tournament repository.
+
+    Tournaments looked up by id are kept in the cache, writes through
+    this repository refresh or invalidate their entries. Listings and
+    counts are always read from the wrapped repository.
+    """
+
+    _repository: ITournamentRepository
+    _cache: LRUCache
+
+    def __init__(self, repository: ITournamentRepository, cache: LRUCache) -> None:
+        """The initializer of the `cached tournament repository`.
+
+        Args:
+            repository (ITournamentRepository): The wrapped repository.
+            cache (LRUCache): The cache of tournaments by id.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    async def get_all_tournaments(self) -> Iterable[Any]:
+        """The method getting all tournaments from the data storage.
+
+        Returns:
+            Iterable[Any]: Tournaments in the data storage.
+        """
+
+        return await self._repository.get_all_tournaments()
+
+    async def get_tournaments_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of tournaments from the data storage.
+
+        Args:
+            limit (int): The maximal number of tournaments on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Tournaments on the page.
+        """
+
+        return await self._repository.get_tournaments_page(limit, after)
+
+    async def count_tournaments(self) -> int:
+        """The method counting all tournaments in the data storage.
+
+        Returns:
+            int: The number of tournaments in the data storage.
+        """
+
+        return await self._repository.count_tournaments()
+
+    async def get_by_id(self, tournament_id: int) -> Any | None:
+        """The method getting tournament by provided id, from the cache if possible.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Any | None: The tournament details.
+        """
+
+        if tournament := self._cache.get(tournament_id):
+            return tournament
+
+        version = self._cache.version
+        if tournament := await self._repository.get_by_id(tournament_id):
+            self._cache.set(tournament_id, tournament, version)
+
+        return tournament
+
+    async def add_tournament(self, data: TournamentIn) -> Any | None:
+        """The method adding new tournament to the data storage.
+
+        Args:
+            data (TournamentIn): The details of the new tournament.
+
+        Returns:
+            Any | None: The newly added tournament.
+        """
+
+        if tournament := await self._repository.add_tournament(data):
+            self._cache.set(tournament.id, tournament)
+
+        return tournament
+
+    async def update_tournament(
+            self,
+            tournament_id: int,
+            data: TournamentIn,
+    ) -> Any | None:
+        """The method updating tournament data in the data storage.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+            data (TournamentIn): The details of the updated tournament.
+
+        Returns:
+            Any | None: The updated tournament details, None if it does
+                not exist or its format would change after its matches.
+        """
+
+        tournament = await self._repository.update_tournament(
+            tournament_id=tournament_id,
+            data=data,
+        )
+
+        # Invalidated after the write, so that reads which started before
+        # it do not store the old values.
+        self._cache.invalidate(tournament_id)
+        if tournament:
+            self._cache.set(tournament_id, tournament)
+
+        return tournament
+
+    async def delete_tournament(self, tournament_id: int) -> bool:
+        """The method updating removing tournament from the data storage.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        deleted = await self._repository.delete_tournament(tournament_id)
+        self._cache.invalidate(tournament_id)
+
+        return deleted
@@ -0,0 +1,183 @@
+"""Module containing job repository implementation."""
+
+import datetime
+from typing import Any, Iterable
+
+from sqlalchemy import Interval, cast, func, select
+
+from tournament_matchmaker.core.domains.job import Job, JobIn
+from tournament_matchmaker.core.domains.record import record_to_dict
+from tournament_matchmaker.core.repositories.i_job_repository import IJobRepository
+from tournament_matchmaker.db import (
+    job_table,
+    database,
+)
+
+# The params of an import hold all imported rows, the state of a job
+# is read without them.
+JOB_COLUMNS = [
+    column for column in job_table.c
+    if column.name not in ("params", "updated_at")
+]
+
+
+class JobRepository(IJobRepository):
+    """A class representing job DB repository."""
+
+    async def get_by_id(self, job_id: int) -> Any | None:
+        """The method getting job by provided id.
+
+        Args:
+            job_id (int): The id of the job.
+
+        Returns:
+            Any | None: The state of the job.
+        """
+
+        query = (
+            select(*JOB_COLUMNS)
+            .where(job_table.c.id == job_id)
+        )
+        job = await database.fetch_one(query)
+
+        return Job.from_record(job) if job else None
+
+    async def get_queued_ids(self) -> Iterable[int]:
+        """The method getting the ids of the jobs waiting to run.
+
+        Returns:
+            Iterable[int]: The ids of the queued jobs, the oldest first.
+        """
+
+        query = (
+            select(job_table.c.id)
+            .where(job_table.c.status == "queued")
+            .order_by(job_table.c.id.asc())
+        )
+        jobs = await database.fetch_all(query)
+
+        return [job["id"] for job in jobs]
+
+    async def add_job(self, data: JobIn) -> Any | None:
+        """The method adding new queued job to the data storage.
+
+        Args:
+            data (JobIn): The work of the job.
+
+        Returns:
+            Any | None: The newly added job.
+        """
+
+        query = (
+            job_table.insert()
+            .values(**data.model_dump())
+            .returning(*JOB_COLUMNS)
+        )
+        job = await database.fetch_one(query)
+
+        return Job.from_record(job) if job else None
+
+    async def claim_job(self, job_id: int) -> JobIn | None:
+        """The method marking the queued job as running.
+
+        The status is checked by the update itself, so a job recovered
+        by several workers at startup runs only once.
+
+        Args:
+            job_id (int): The id of the job.
+
+        Returns:
+            JobIn | None: The work of the job, None if it is not queued.
+        """
+
+        query = (
+            job_table.update()
+            .where(job_table.c.id == job_id)
+            .where(job_table.c.status == "queued")
+            .values(status="running", started_at=func.now(), updated_at=func.now())
+            .returning(job_table.c.kind, job_table.c.params)
+        )
+        job = await database.fetch_one(query)
+
+        return JobIn.model_validate(record_to_dict(job)) if job else None
+
+    async def update_progress(self, job_id: int, progress: int, total: int | None) -> bool:
+        """The method saving the progress of the running job.
+
+        Args:
+            job_id (int): The id of the job.
+            progress (int): The number of the processed items.
+            total (int | None): The number of all items, None if unknown.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        query = (
+            job_table.update()
+            .where(job_table.c.id == job_id)
+            .where(job_table.c.status == "running")
+            .values(progress=progress, total=total, updated_at=func.now())
+            .returning(job_table.c.id)
+        )
+
+        return await database.fetch_one(query) is not None
+
+    async def finish_job(
+            self,
+            job_id: int,
+            result: dict | None = None,
+            error: str | None = None,
+    ) -> bool:
+        """The method marking the running job as succeeded or, with an error, failed.
+
+        Args:
+            job_id (int): The id of the job.
+            result (dict | None, optional): The result of the job. Defaults to None.
+            error (str | None, optional): The reason of the failure. Defaults to None.
+
+        Returns:
+            bool: Success of the operation.
+        """
+
+        query = (
+            job_table.update()
+            .where(job_table.c.id == job_id)
+            .where(job_table.c.status == "running")
+            .values(
+                status="failed" if error is not None else "succeeded",
+                result=result,
+                error=error,
+                updated_at=func.now(),
+                finished_at=func.now(),
+            )
+            .returning(job_table.c.id)
+        )
+
+        return await database.fetch_one(query) is not None
+
+    async def fail_stale_jobs(self, stale_after: float) -> int:
+        """The method failing running jobs which stopped reporting progress.
+
+        Args:
+            stale_after (float): The time without saves in seconds
+                after which the worker of the job is considered dead.
+
+        Returns:
+            int: The number of the failed jobs.
+        """
+
+        query = (
+            job_table.update()
+            .where(job_table.c.status == "running")
+            .where(job_table.c.updated_at < func.now() - cast(datetime.timedelta(seconds=stale_after), Interval))
+            .values(
+                status="failed",
+                error="Interrupted",
+                updated_at=func.now(),
+                finished_at=func.now(),
+            )
+            .returning(job_table.c.id)
+        )
+
+        return len(await database.fetch_all(query))
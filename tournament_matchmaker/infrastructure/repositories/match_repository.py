@@ -1,18 +1,26 @@
 """Module containing match repository implementation."""
 
-from typing import Any, Iterable, List
+import datetime
+from typing import Any, AsyncIterator, Iterable, List
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import Integer, any_, bindparam, exists, func, select, join
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from tournament_matchmaker.core.domains.tournament import Tournament
 from tournament_matchmaker.core.repositories.i_match_repository import IMatchRepository
 from tournament_matchmaker.core.domains.match import Match, MatchIn
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.infrastructure.repositories.pagination import fetch_page
 from tournament_matchmaker.db import (
     match_table,
+    tournament_table,
     database,
 )
 
+MATCHES_INSERT_CHUNK_SIZE = 1000
+
+
 class MatchRepository(IMatchRepository):
     """A class representing continent DB repository."""
 
@@ -28,7 +36,59 @@ class MatchRepository(IMatchRepository):
         )
         matches = await database.fetch_all(query)
 
-        return [Match.from_record(match) for match in matches]
+        return Match.from_records(matches)
+
+    async def get_matches_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of matches ordered by id.
+
+        Args:
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Matches on the page.
+        """
+
+        return await fetch_page(
+            query=select(match_table),
+            order_by=(match_table.c.id,),
+            limit=limit,
+            after=after,
+            from_records=Match.from_records,
+        )
+
+    async def iterate_matches(self) -> AsyncIterator[Any]:
+        """The method iterating over all matches in the data storage.
+
+        The rows are read with a server-side cursor, so only a small
+        window of them is held in memory at a time.
+
+        Returns:
+            AsyncIterator[Any]: Matches read with a server-side cursor.
+        """
+
+        query = (
+            select(match_table)
+            .order_by(match_table.c.id.asc())
+        )
+
+        async for match in database.iterate(query):
+            yield Match.from_record(match)
+
+    async def count_matches(self) -> int:
+        """The method counting all matches in the data storage.
+
+        Returns:
+            int: The number of matches in the data storage.
+        """
+
+        query = select(func.count()).select_from(match_table)
+
+        return await database.fetch_val(query)
 
     async def get_by_id(self, match_id: int) -> Any | None:
         """The method getting match by provided id.
@@ -61,9 +121,65 @@ class MatchRepository(IMatchRepository):
 
         matches = await database.fetch_all(query)
 
-        return [Match.from_record(match) for match in matches]
+        return Match.from_records(matches)
+
+    async def has_matches(self, tournament_ids: Iterable[int]) -> bool:
+        """The method checking whether any of the tournaments has matches.
+
+        The ids are sent as one array parameter (`tournament_id = ANY($1)`)
+        and the index of `tournament_id` answers on the first match found.
+
+        Args:
+            tournament_ids (Iterable[int]): The ids of the tournaments.
+
+        Returns:
+            bool: Whether a match of the tournaments exists.
+        """
+
+        ids = list(set(tournament_ids))
+        query = select(exists().where(
+            match_table.c.tournament_id == any_(bindparam("tournament_ids", ids, type_=ARRAY(Integer)))
+        ))
+
+        return await database.fetch_val(query)
 
 
+    async def get_matches_page_by_date(
+            self,
+            match_date: datetime.date,
+            limit: int,
+            after: str | None = None,
+            tournament_id: int | None = None,
+    ) -> Page:
+        """The method getting a page of matches played on the date.
+
+        Args:
+            match_date (datetime.date): The date of the matches.
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+            tournament_id (int | None, optional): The id of the tournament
+                to narrow the matches to. Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: The matches of the date on the page, by tournament.
+        """
+
+        query = select(match_table).where(match_table.c.match_date == match_date)
+        if tournament_id is not None:
+            query = query.where(match_table.c.tournament_id == tournament_id)
+
+        return await fetch_page(
+            query=query,
+            order_by=(match_table.c.tournament_id, match_table.c.id),
+            limit=limit,
+            after=after,
+            from_records=Match.from_records,
+        )
+
     async def add_match(self, data: MatchIn) -> Any | None:
         """The method adding new match to the data storage.
 
@@ -77,11 +193,72 @@ class MatchRepository(IMatchRepository):
             Any | None: The newly added match.
         """
 
-        query = match_table.insert().values(**data.model_dump())
-        new_match_id = await database.execute(query)
-        new_match = await self._get_by_id(new_match_id)
+        query = (
+            match_table.insert()
+            .values(**data.model_dump())
+            .returning(match_table)
+        )
+        new_match = await database.fetch_one(query)
+
+        return Match.from_record(new_match) if new_match else None
+
+    async def add_matches(self, data: List[MatchIn]) -> List[int]:
+        """The method adding many new matches to the data storage at once.
+
+        The rows are written with multi-row INSERT statements inside
+        a single transaction, split into chunks so that the number of
+        bound parameters stays below the PostgreSQL limit.
+
+        Args:
+            data (List[MatchIn]): The details of the new matches.
+
+        Returns:
+            List[int]: The ids of the newly added matches.
+        """
+
+        if not data:
+            return []
+
+        async with database.transaction():
+            return await self._insert_matches(data)
 
-        return Match(**dict(new_match)) if new_match else None
+    async def add_round(
+            self,
+            tournament_id: int,
+            round_number: int,
+            data: List[MatchIn],
+    ) -> List[int] | None:
+        """The method adding the matches of a new round of the tournament.
+
+        The tournament row is locked for the transaction, so concurrent
+        requests cannot generate the same round twice.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+            round_number (int): The number of the new round.
+            data (List[MatchIn]): The details of the new matches.
+
+        Returns:
+            List[int] | None: The ids of the newly added matches, None if
+                the round or a later one already exists.
+        """
+
+        async with database.transaction():
+            await database.execute(
+                select(tournament_table.c.id)
+                .where(tournament_table.c.id == tournament_id)
+                .with_for_update()
+            )
+            query = (
+                select(func.count())
+                .select_from(match_table)
+                .where(match_table.c.tournament_id == tournament_id)
+                .where(func.coalesce(match_table.c.round, 1) >= round_number)
+            )
+            if await database.fetch_val(query):
+                return None
+
+            return await self._insert_matches(data)
 
     async def update_match(
             self,
@@ -90,6 +267,8 @@ class MatchRepository(IMatchRepository):
     ) -> Any | None:
         """The method updating match data in the data storage.
 
+        Only the fields sent are written, so a match keeps its round.
+
         Args:
             match_id (int): The id of the match.
             data (MatchIn): The details of the updated match.
@@ -98,19 +277,15 @@ class MatchRepository(IMatchRepository):
             Any | None: The updated match details.
         """
 
-        if await self._get_by_id(match_id):
-            query = (
-                match_table.update()
-                .where(match_table.c.id == match_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            match = await self._get_by_id(match_id)
-
-            return Match(**dict(match)) if match else None
+        query = (
+            match_table.update()
+            .where(match_table.c.id == match_id)
+            .values(**data.model_dump(exclude_unset=True))
+            .returning(match_table)
+        )
+        match = await database.fetch_one(query)
 
-        return None
+        return Match.from_record(match) if match else None
 
     async def delete_match(self, match_id: int) -> bool:
         """The method updating removing match from the data storage.
@@ -122,15 +297,37 @@ class MatchRepository(IMatchRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(match_id):
-            query = match_table \
-                .delete() \
-                .where(match_table.c.id == match_id)
-            await database.execute(query)
+        query = (
+            match_table.delete()
+            .where(match_table.c.id == match_id)
+            .returning(match_table.c.id)
+        )
+
+        return await database.fetch_one(query) is not None
+
+    async def _insert_matches(self, data: List[MatchIn]) -> List[int]:
+        """A private method inserting matches in chunks, in the current transaction.
 
-            return True
+        Args:
+            data (List[MatchIn]): The details of the new matches.
+
+        Returns:
+            List[int]: The ids of the newly added matches.
+        """
+
+        new_match_ids: List[int] = []
+
+        for start in range(0, len(data), MATCHES_INSERT_CHUNK_SIZE):
+            chunk = data[start:start + MATCHES_INSERT_CHUNK_SIZE]
+            query = (
+                match_table.insert()
+                .values([match.model_dump() for match in chunk])
+                .returning(match_table.c.id)
+            )
+            new_matches = await database.fetch_all(query)
+            new_match_ids.extend(match["id"] for match in new_matches)
 
-        return False
+        return new_match_ids
 
     async def _get_by_id(self, match_id: int) -> Record | None:
         """A private method getting match from the DB based on its ID.
@@ -0,0 +1,99 @@
+"""Module containing keyset pagination helpers shared by the repositories."""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, Iterable, List, Sequence
+
+from sqlalchemy import Column, Select, tuple_
+
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.db import database
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """A function encoding the sort key of a row as an opaque cursor.
+
+    Args:
+        values (Sequence[Any]): The values of the sort columns.
+
+    Returns:
+        str: The cursor.
+    """
+
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Column]) -> List[Any]:
+    """A function decoding the sort key of a row from an opaque cursor.
+
+    Args:
+        cursor (str): The cursor.
+        columns (Sequence[Column]): The sort columns.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        List[Any]: The values of the sort columns.
+    """
+
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise ValueError("Invalid cursor")
+
+    for value, column in zip(values, columns):
+        if not isinstance(value, column.type.python_type):
+            raise ValueError("Invalid cursor")
+
+    return values
+
+
+async def fetch_page(
+        query: Select,
+        order_by: Sequence[Column],
+        limit: int,
+        after: str | None,
+        from_records: Callable[[Iterable[Any]], List[Any]],
+) -> Page:
+    """A function fetching a single page of rows using keyset pagination.
+
+    Instead of an OFFSET the query is filtered to the rows placed after
+    the cursor in the given ordering, so every page costs the same
+    index range scan regardless of its depth.
+
+    Args:
+        query (Select): The base query.
+        order_by (Sequence[Column]): Columns defining a unique ordering.
+        limit (int): The maximal number of rows on the page.
+        after (str | None): The cursor returned with the previous page.
+        from_records (Callable[[Iterable[Any]], List[Any]]): Records to
+            domain objects converter.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        Page: The page of domain objects.
+    """
+
+    if after is not None:
+        query = query.where(tuple_(*order_by) > tuple(decode_cursor(after, order_by)))
+
+    query = query.order_by(*order_by).limit(limit + 1)
+    records = await database.fetch_all(query)
+    items = from_records(records[:limit])
+    next_cursor = None
+
+    if len(records) > limit:
+        last = records[limit - 1]
+        next_cursor = encode_cursor([last[column.name] for column in order_by])
+
+    return Page(items=items, next=next_cursor)
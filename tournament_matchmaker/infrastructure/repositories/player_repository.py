@@ -1,12 +1,15 @@
 """Module containing player repository implementation."""
 
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import Integer, bindparam, cast, func, join, select
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from tournament_matchmaker.core.repositories.i_player_repository import IPlayerRepository
 from tournament_matchmaker.core.domains.player import Player, PlayerIn
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.infrastructure.repositories.pagination import fetch_page
 from tournament_matchmaker.db import (
     player_table,
     database,
@@ -28,7 +31,59 @@ class PlayerRepository(IPlayerRepository):
         )
         players = await database.fetch_all(query)
 
-        return [Player.from_record(player) for player in players]
+        return Player.from_records(players)
+
+    async def get_players_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of players ordered by name, then id.
+
+        Args:
+            limit (int): The maximal number of players on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Players on the page.
+        """
+
+        return await fetch_page(
+            query=select(player_table),
+            order_by=(player_table.c.name, player_table.c.id),
+            limit=limit,
+            after=after,
+            from_records=Player.from_records,
+        )
+
+    async def iterate_players(self) -> AsyncIterator[Any]:
+        """The method iterating over all players in the data storage.
+
+        The rows are read with a server-side cursor, so only a small
+        window of them is held in memory at a time.
+
+        Returns:
+            AsyncIterator[Any]: Players read with a server-side cursor.
+        """
+
+        query = (
+            select(player_table)
+            .order_by(player_table.c.name.asc(), player_table.c.id.asc())
+        )
+
+        async for player in database.iterate(query):
+            yield Player.from_record(player)
+
+    async def count_players(self) -> int:
+        """The method counting all players in the data storage.
+
+        Returns:
+            int: The number of players in the data storage.
+        """
+
+        query = select(func.count()).select_from(player_table)
+
+        return await database.fetch_val(query)
 
     async def get_by_id(self, player_id: int) -> Any | None:
         """The method getting player by provided id.
@@ -62,7 +117,7 @@ class PlayerRepository(IPlayerRepository):
 
         players = await database.fetch_all(query)
 
-        return [Player.from_record(player) for player in players]
+        return Player.from_records(players)
 
     async def add_player(self, data: PlayerIn) -> Any | None:
         """The method adding new player to the data storage.
@@ -77,11 +132,39 @@ class PlayerRepository(IPlayerRepository):
             Any | None: The newly added player.
         """
 
-        query = player_table.insert().values(**data.model_dump())
-        new_player_id = await database.execute(query)
-        new_player = await self._get_by_id(new_player_id)
+        query = (
+            player_table.insert()
+            .values(**data.model_dump())
+            .returning(player_table)
+        )
+        new_player = await database.fetch_one(query)
+
+        return Player.from_record(new_player) if new_player else None
 
-        return Player(**dict(new_player)) if new_player else None
+    async def add_players(self, data: Iterable[PlayerIn]) -> Iterable[Any]:
+        """The method adding many new players with a single statement.
+
+        Args:
+            data (Iterable[PlayerIn]): The details of the new players.
+
+        Returns:
+            Iterable[Any]: The newly added players, in the order of `data`.
+        """
+
+        values = [player.model_dump() for player in data]
+        if not values:
+            return []
+
+        query = (
+            player_table.insert()
+            .values(values)
+            .returning(player_table)
+        )
+        players = await database.fetch_all(query)
+
+        # RETURNING has no guaranteed order, but the ids are drawn from
+        # the sequence in the order of the inserted values.
+        return Player.from_records(sorted(players, key=lambda player: player["id"]))
 
     async def update_player(
             self,
@@ -98,19 +181,44 @@ class PlayerRepository(IPlayerRepository):
             Any | None: The updated player details.
         """
 
-        if self._get_by_id(player_id):
-            query = (
-                player_table.update()
-                .where(player_table.c.id == player_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            player_table.update()
+            .where(player_table.c.id == player_id)
+            .values(**data.model_dump())
+            .returning(player_table)
+        )
+        player = await database.fetch_one(query)
+
+        return Player.from_record(player) if player else None
+
+    async def update_players_team(self, team_ids: dict[int, int]) -> Iterable[int]:
+        """The method assigning many players without a team to their teams with a single statement.
+
+        Args:
+            team_ids (dict[int, int]): The ids of the teams by player ids.
+
+        Returns:
+            Iterable[int]: The ids of the updated players, without the ones
+                which already had a team.
+        """
 
-            player = await self._get_by_id(player_id)
+        if not team_ids:
+            return []
 
-            return Player(**dict(player)) if player else None
+        assignment = func.unnest(
+            cast(bindparam("player_ids", list(team_ids.keys())), ARRAY(Integer)),
+            cast(bindparam("team_ids", list(team_ids.values())), ARRAY(Integer)),
+        ).table_valued("player_id", "team_id").render_derived(name="assignment")
+        query = (
+            player_table.update()
+            .where(player_table.c.id == assignment.c.player_id)
+            .where(player_table.c.team_id.is_(None))
+            .values(team_id=assignment.c.team_id)
+            .returning(player_table.c.id)
+        )
+        players = await database.fetch_all(query)
 
-        return None
+        return [player["id"] for player in players]
 
     async def delete_player(self, player_id: int) -> bool:
         """The method updating removing player from the data storage.
@@ -122,15 +230,13 @@ class PlayerRepository(IPlayerRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(player_id):
-            query = player_table \
-                .delete() \
-                .where(player_table.c.id == player_id)
-            await database.execute(query)
-
-            return True
+        query = (
+            player_table.delete()
+            .where(player_table.c.id == player_id)
+            .returning(player_table.c.id)
+        )
 
-        return False
+        return await database.fetch_one(query) is not None
 
     async def _get_by_id(self, player_id: int) -> Record | None:
         """A private method getting player from the DB based on its ID.
@@ -0,0 +1,88 @@
+"""Module containing raport repository implementation."""
+
+from sqlalchemy import BigInteger, Table, cast, column, func, select, table
+from sqlalchemy.sql.selectable import ScalarSelect
+
+from tournament_matchmaker.core.repositories.i_raport_repository import IRaportRepository
+from tournament_matchmaker.db import (
+    match_table,
+    player_table,
+    team_table,
+    tournament_table,
+    database,
+)
+
+pg_class_table = table(
+    "pg_class",
+    column("oid"),
+    column("reltuples"),
+)
+
+
+class RaportRepository(IRaportRepository):
+    """A class representing raport DB repository."""
+
+    async def get_summary(self, approximate: bool = False) -> dict:
+        """The method getting numbers of all entities in the data storage.
+
+        All four numbers are read with a single statement. The approximate
+        variant reads the `pg_class.reltuples` estimates maintained by
+        VACUUM/ANALYZE instead of scanning the tables.
+
+        Args:
+            approximate (bool, optional): Whether to use the planner
+                estimates instead of exact counts. Defaults to False.
+
+        Returns:
+            dict: The numbers of tournaments, players, teams and matches.
+        """
+
+        count = self._estimate if approximate else self._count
+        query = select(
+            count(tournament_table).label("total_tournaments"),
+            count(player_table).label("total_players"),
+            count(team_table).label("total_teams"),
+            count(match_table).label("total_matches"),
+        )
+        summary = await database.fetch_one(query)
+
+        return dict(summary)  # type: ignore
+
+    def get_pool_stats(self) -> dict:
+        """The method getting statistics of the data storage connection pool.
+
+        Returns:
+            dict: The pool limits, usage and acquisition wait times.
+        """
+
+        return database.pool_stats()
+
+    @staticmethod
+    def _count(counted_table: Table) -> ScalarSelect:
+        """A private method preparing an exact count subquery.
+
+        Args:
+            counted_table (Table): The counted table.
+
+        Returns:
+            ScalarSelect: The subquery.
+        """
+
+        return select(func.count()).select_from(counted_table).scalar_subquery()
+
+    @staticmethod
+    def _estimate(counted_table: Table) -> ScalarSelect:
+        """A private method preparing an estimated count subquery.
+
+        Args:
+            counted_table (Table): The counted table.
+
+        Returns:
+            ScalarSelect: The subquery.
+        """
+
+        return (
+            select(func.greatest(cast(pg_class_table.c.reltuples, BigInteger), 0))
+            .where(pg_class_table.c.oid == func.to_regclass(counted_table.name))
+            .scalar_subquery()
+        )
@@ -0,0 +1,140 @@
+"""Module containing rating repository implementation."""
+
+from typing import Any, Iterable
+
+import numpy as np
+from sqlalchemy import Integer, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from tournament_matchmaker.core.domains.rating import TeamRating
+from tournament_matchmaker.core.rating.elo import MatchHistory, Ratings
+from tournament_matchmaker.core.repositories.i_rating_repository import IRatingRepository
+from tournament_matchmaker.db import (
+    team_rating_table,
+    team_table,
+    database,
+)
+
+# Every column is aggregated into one array, asyncpg decodes a whole
+# array in C, which is much faster than building a record per match.
+# The rows are aggregated in the order of the sorted subquery, so the
+# engine gets the history sorted by day already. Matches without a date
+# are replayed last, scheduled (0:0) ones are skipped.
+MATCH_HISTORY_QUERY = """
+    SELECT
+        coalesce(array_agg(match_day), '{}'),
+        coalesce(array_agg(team1_id), '{}'),
+        coalesce(array_agg(team2_id), '{}'),
+        coalesce(array_agg(team1_score), '{}'),
+        coalesce(array_agg(team2_score), '{}')
+    FROM (
+        SELECT
+            coalesce(match_date - DATE '1970-01-01', 2147483647) AS match_day,
+            team1_id, team2_id, team1_score, team2_score
+        FROM match
+        WHERE team1_score IS NOT NULL AND team2_score IS NOT NULL
+          AND (team1_score <> 0 OR team2_score <> 0)
+        ORDER BY match_day, id
+    ) history
+"""
+
+
+class RatingRepository(IRatingRepository):
+    """A class representing rating DB repository."""
+
+    async def get_by_team_id(self, team_id: int) -> Any | None:
+        """The method getting the rating of the team.
+
+        Args:
+            team_id (int): The id of the team.
+
+        Returns:
+            Any | None: The rating of the team, None if it was not rated.
+        """
+
+        query = (
+            select(team_rating_table)
+            .where(team_rating_table.c.team_id == team_id)
+        )
+        rating = await database.fetch_one(query)
+
+        return TeamRating.from_record(rating) if rating else None
+
+    async def get_by_team_ids(self, team_ids: Iterable[int]) -> Iterable[Any]:
+        """The method getting the ratings of the teams with a single query.
+
+        Args:
+            team_ids (Iterable[int]): The ids of the teams.
+
+        Returns:
+            Iterable[Any]: The ratings of the rated teams, others are skipped.
+        """
+
+        ids = list(set(team_ids))
+        if not ids:
+            return []
+
+        query = (
+            select(team_rating_table)
+            .where(team_rating_table.c.team_id == any_(bindparam("team_ids", ids, type_=ARRAY(Integer))))
+        )
+        ratings = await database.fetch_all(query)
+
+        return TeamRating.from_records(ratings)
+
+    async def get_leaderboard(self, limit: int) -> Iterable[Any]:
+        """The method getting the best rated existing teams.
+
+        Args:
+            limit (int): The maximal number of teams.
+
+        Returns:
+            Iterable[Any]: The ratings, the best first.
+        """
+
+        query = (
+            select(team_rating_table)
+            .join(team_table, team_table.c.id == team_rating_table.c.team_id)
+            .order_by(team_rating_table.c.rating.desc(), team_rating_table.c.team_id.asc())
+            .limit(limit)
+        )
+        ratings = await database.fetch_all(query)
+
+        return TeamRating.from_records(ratings)
+
+    async def get_match_history(self) -> MatchHistory:
+        """The method getting all played matches for rating.
+
+        Returns:
+            MatchHistory: The played matches as arrays.
+        """
+
+        async with database.connection() as connection:
+            columns = await connection.raw_connection.fetchrow(MATCH_HISTORY_QUERY)
+
+        return MatchHistory(*(np.array(column, dtype=np.int64) for column in columns))
+
+    async def replace_ratings(self, ratings: Ratings) -> int:
+        """The method replacing all stored ratings in one transaction.
+
+        Args:
+            ratings (Ratings): The new ratings of all teams.
+
+        Returns:
+            int: The number of stored ratings.
+        """
+
+        async with database.connection() as connection:
+            conn = connection.raw_connection
+
+            async with conn.transaction():
+                await conn.execute("DELETE FROM team_rating")
+                await conn.execute(
+                    "INSERT INTO team_rating (team_id, rating, matches) "
+                    "SELECT * FROM unnest($1::integer[], $2::double precision[], $3::integer[])",
+                    ratings.team_id.tolist(),
+                    ratings.rating.tolist(),
+                    ratings.matches.tolist(),
+                )
+
+        return len(ratings.team_id)
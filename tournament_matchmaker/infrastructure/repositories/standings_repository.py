@@ -0,0 +1,104 @@
+"""Module containing standings repository implementation."""
+
+from typing import Any, Iterable
+
+from sqlalchemy import and_, func, or_, select, text, union_all
+
+from tournament_matchmaker.core.domains.standing import Standing
+from tournament_matchmaker.core.repositories.i_standings_repository import IStandingsRepository
+from tournament_matchmaker.db import (
+    match_table,
+    standings_table,
+    database,
+)
+
+# The best team first: most wins, then the best score difference.
+STANDINGS_ORDER = (
+    standings_table.c.wins.desc(),
+    (standings_table.c.score_for - standings_table.c.score_against).desc(),
+    standings_table.c.team_id.asc(),
+)
+
+
+class StandingsRepository(IStandingsRepository):
+    """A class representing standings DB repository.
+
+    The standings are kept up to date by a trigger of the `match` table,
+    in the same transaction as every write of a match.
+    """
+
+    async def get_by_tournament_id(self, tournament_id: int) -> Iterable[Any]:
+        """The method getting standings of the tournament, best team first.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Iterable[Any]: The standings of teams which played in the tournament.
+        """
+
+        query = (
+            select(standings_table)
+            .where(standings_table.c.tournament_id == tournament_id)
+            .order_by(*STANDINGS_ORDER)
+        )
+        standings = await database.fetch_all(query)
+
+        return Standing.from_records(standings)
+
+    async def rebuild(self) -> int:
+        """The method regenerating all standings from the match history.
+
+        The table is locked for writes meanwhile, so matches written
+        concurrently wait for the rebuild instead of being lost.
+
+        Returns:
+            int: The number of standings rows.
+        """
+
+        played = and_(
+            match_table.c.team1_score.isnot(None),
+            match_table.c.team2_score.isnot(None),
+            or_(match_table.c.team1_score != 0, match_table.c.team2_score != 0),
+        )
+        sides = union_all(
+            select(
+                match_table.c.tournament_id,
+                match_table.c.team1_id.label("team_id"),
+                match_table.c.team1_score.label("scored"),
+                match_table.c.team2_score.label("conceded"),
+            ).where(played),
+            select(
+                match_table.c.tournament_id,
+                match_table.c.team2_id,
+                match_table.c.team2_score,
+                match_table.c.team1_score,
+            ).where(played),
+        ).subquery()
+        results = (
+            select(
+                sides.c.tournament_id,
+                sides.c.team_id,
+                func.count(),
+                func.count().filter(sides.c.scored > sides.c.conceded),
+                func.count().filter(sides.c.scored == sides.c.conceded),
+                func.count().filter(sides.c.scored < sides.c.conceded),
+                func.sum(sides.c.scored),
+                func.sum(sides.c.conceded),
+            )
+            .group_by(sides.c.tournament_id, sides.c.team_id)
+        )
+        query = standings_table.insert().from_select(
+            [
+                "tournament_id", "team_id", "played", "wins", "draws", "losses",
+                "score_for", "score_against",
+            ],
+            results,
+        )
+
+        async with database.transaction():
+            await database.execute(text("LOCK TABLE standings IN EXCLUSIVE MODE"))
+            await database.execute(standings_table.delete())
+            await database.execute(query)
+
+            return await database.fetch_val(select(func.count()).select_from(standings_table))
@@ -3,11 +3,16 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import Integer, any_, bindparam, func, select, join
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from tournament_matchmaker.core.repositories.i_team_repository import ITeamRepository
 from tournament_matchmaker.core.domains.team import Team, TeamIn
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.infrastructure.repositories.pagination import fetch_page
+from tournament_matchmaker.infrastructure.repositories.standings_repository import STANDINGS_ORDER
 from tournament_matchmaker.db import (
+    standings_table,
     team_table,
     database,
 )
@@ -28,7 +33,41 @@ class TeamRepository(ITeamRepository):
         )
         teams = await database.fetch_all(query)
 
-        return [Team.from_record(team) for team in teams]
+        return Team.from_records(teams)
+
+    async def get_teams_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of teams ordered by name, then id.
+
+        Args:
+            limit (int): The maximal number of teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Teams on the page.
+        """
+
+        return await fetch_page(
+            query=select(team_table),
+            order_by=(team_table.c.name, team_table.c.id),
+            limit=limit,
+            after=after,
+            from_records=Team.from_records,
+        )
+
+    async def count_teams(self) -> int:
+        """The method counting all teams in the data storage.
+
+        Returns:
+            int: The number of teams in the data storage.
+        """
+
+        query = select(func.count()).select_from(team_table)
+
+        return await database.fetch_val(query)
 
     async def get_by_id(self, team_id: int) -> Any | None:
         """The method getting team by provided id.
@@ -44,6 +83,56 @@ class TeamRepository(ITeamRepository):
 
         return Team.from_record(team) if team else None
 
+    async def get_by_ids(self, team_ids: Iterable[int]) -> Iterable[Any]:
+        """The method getting teams by provided ids with a single query.
+
+        The ids are sent as one array parameter (`id = ANY($1)`), so the
+        statement is the same for any number of ids.
+
+        Args:
+            team_ids (Iterable[int]): The ids of the teams.
+
+        Returns:
+            Iterable[Any]: The details of the found teams, unknown ids are skipped.
+        """
+
+        ids = list(set(team_ids))
+        if not ids:
+            return []
+
+        query = (
+            select(team_table)
+            .where(team_table.c.id == any_(bindparam("team_ids", ids, type_=ARRAY(Integer))))
+        )
+        teams = await database.fetch_all(query)
+
+        return Team.from_records(teams)
+
+    async def get_tournament_winner(self, tournament_id: int) -> Any | None:
+        """The method getting the leader of the tournament standings.
+
+        The standings are maintained with every write of a match, so the
+        winner is a single index lookup. A team has to win at least once.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Any | None: The winner team details.
+        """
+
+        query = (
+            select(team_table)
+            .join(standings_table, standings_table.c.team_id == team_table.c.id)
+            .where(standings_table.c.tournament_id == tournament_id)
+            .where(standings_table.c.wins > 0)
+            .order_by(*STANDINGS_ORDER)
+            .limit(1)
+        )
+        team = await database.fetch_one(query)
+
+        return Team.from_record(team) if team else None
+
     async def add_team(self, data: TeamIn) -> Any | None:
         """The method adding new team to the data storage.
 
@@ -57,11 +146,39 @@ class TeamRepository(ITeamRepository):
             Any | None: The newly added team.
         """
 
-        query = team_table.insert().values(**data.model_dump())
-        new_team_id = await database.execute(query)
-        new_team = await self._get_by_id(new_team_id)
+        query = (
+            team_table.insert()
+            .values(**data.model_dump())
+            .returning(team_table)
+        )
+        new_team = await database.fetch_one(query)
+
+        return Team.from_record(new_team) if new_team else None
+
+    async def add_teams(self, data: Iterable[TeamIn]) -> Iterable[Any]:
+        """The method adding many new teams with a single statement.
 
-        return Team(**dict(new_team)) if new_team else None
+        Args:
+            data (Iterable[TeamIn]): The details of the new teams.
+
+        Returns:
+            Iterable[Any]: The newly added teams, in the order of `data`.
+        """
+
+        values = [team.model_dump() for team in data]
+        if not values:
+            return []
+
+        query = (
+            team_table.insert()
+            .values(values)
+            .returning(team_table)
+        )
+        teams = await database.fetch_all(query)
+
+        # RETURNING has no guaranteed order, but the ids are drawn from
+        # the sequence in the order of the inserted values.
+        return Team.from_records(sorted(teams, key=lambda team: team["id"]))
 
     async def update_team(
             self,
@@ -78,19 +195,15 @@ class TeamRepository(ITeamRepository):
             Any | None: The updated team details.
         """
 
-        if self._get_by_id(team_id):
-            query = (
-                team_table.update()
-                .where(team_table.c.id == team_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            team = await self._get_by_id(team_id)
-
-            return Team(**dict(team)) if team else None
+        query = (
+            team_table.update()
+            .where(team_table.c.id == team_id)
+            .values(**data.model_dump())
+            .returning(team_table)
+        )
+        team = await database.fetch_one(query)
 
-        return None
+        return Team.from_record(team) if team else None
 
     async def delete_team(self, team_id: int) -> bool:
         """The method updating removing team from the data storage.
@@ -102,15 +215,13 @@ class TeamRepository(ITeamRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(team_id):
-            query = team_table \
-                .delete() \
-                .where(team_table.c.id == team_id)
-            await database.execute(query)
-
-            return True
+        query = (
+            team_table.delete()
+            .where(team_table.c.id == team_id)
+            .returning(team_table.c.id)
+        )
 
-        return False
+        return await database.fetch_one(query) is not None
 
     async def _get_by_id(self, team_id: int) -> Record | None:
         """A private method getting team from the DB based on its ID.
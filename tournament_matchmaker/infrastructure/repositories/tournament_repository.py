@@ -3,12 +3,15 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import exists, func, or_, select, join
 
 from tournament_matchmaker.core.repositories.i_tournament_repository import ITournamentRepository
 from tournament_matchmaker.core.domains.tournament import Tournament, TournamentIn
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.infrastructure.repositories.pagination import fetch_page
 from tournament_matchmaker.db import (
     tournament_table,
+    match_table,
     database,
 )
 
@@ -28,7 +31,41 @@ class TournamentRepository(ITournamentRepository):
         )
         tournaments = await database.fetch_all(query)
 
-        return [Tournament.from_record(tournament) for tournament in tournaments]
+        return Tournament.from_records(tournaments)
+
+    async def get_tournaments_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of tournaments ordered by name, then id.
+
+        Args:
+            limit (int): The maximal number of tournaments on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Tournaments on the page.
+        """
+
+        return await fetch_page(
+            query=select(tournament_table),
+            order_by=(tournament_table.c.name, tournament_table.c.id),
+            limit=limit,
+            after=after,
+            from_records=Tournament.from_records,
+        )
+
+    async def count_tournaments(self) -> int:
+        """The method counting all tournaments in the data storage.
+
+        Returns:
+            int: The number of tournaments in the data storage.
+        """
+
+        query = select(func.count()).select_from(tournament_table)
+
+        return await database.fetch_val(query)
 
     async def get_by_id(self, tournament_id: int) -> Any | None:
         """The method getting tournament by provided id.
@@ -57,11 +94,14 @@ class TournamentRepository(ITournamentRepository):
             Any | None: The newly added tournament.
         """
 
-        query = tournament_table.insert().values(**data.model_dump())
-        new_tournament_id = await database.execute(query)
-        new_tournament = await self._get_by_id(new_tournament_id)
+        query = (
+            tournament_table.insert()
+            .values(**data.model_dump())
+            .returning(tournament_table)
+        )
+        new_tournament = await database.fetch_one(query)
 
-        return Tournament(**dict(new_tournament)) if new_tournament else None
+        return Tournament.from_record(new_tournament) if new_tournament else None
 
     async def update_tournament(
             self,
@@ -70,27 +110,42 @@ class TournamentRepository(ITournamentRepository):
     ) -> Any | None:
         """The method updating tournament data in the data storage.
 
+        Only the fields sent are written, the others keep their values.
+        The format changes only while the tournament has no matches, the
+        row is locked first, so no round is generated in between.
+
         Args:
             tournament_id (int): The id of the tournament.
             data (TournamentIn): The details of the updated tournament.
 
         Returns:
-            Any | None: The updated tournament details.
+            Any | None: The updated tournament details, None if it does
+                not exist or its format would change after its matches.
         """
 
-        if self._get_by_id(tournament_id):
-            query = (
-                tournament_table.update()
+        values = data.model_dump(exclude_unset=True)
+        query = (
+            tournament_table.update()
+            .where(tournament_table.c.id == tournament_id)
+            .values(**values)
+            .returning(tournament_table)
+        )
+        if "format" not in values:
+            tournament = await database.fetch_one(query)
+            return Tournament.from_record(tournament) if tournament else None
+
+        async with database.transaction():
+            await database.execute(
+                select(tournament_table.c.id)
                 .where(tournament_table.c.id == tournament_id)
-                .values(**data.model_dump())
+                .with_for_update()
             )
-            await database.execute(query)
-
-            tournament = await self._get_by_id(tournament_id)
+            tournament = await database.fetch_one(query.where(or_(
+                tournament_table.c.format == values["format"],
+                ~exists().where(match_table.c.tournament_id == tournament_id),
+            )))
 
-            return Tournament(**dict(tournament)) if tournament else None
-
-        return None
+        return Tournament.from_record(tournament) if tournament else None
 
     async def delete_tournament(self, tournament_id: int) -> bool:
         """The method updating removing tournament from the data storage.
@@ -102,15 +157,13 @@ class TournamentRepository(ITournamentRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(tournament_id):
-            query = tournament_table \
-                .delete() \
-                .where(tournament_table.c.id == tournament_id)
-            await database.execute(query)
-
-            return True
+        query = (
+            tournament_table.delete()
+            .where(tournament_table.c.id == tournament_id)
+            .returning(tournament_table.c.id)
+        )
 
-        return False
+        return await database.fetch_one(query) is not None
 
     async def _get_by_id(self, tournament_id: int) -> Record | None:
         """A private method getting tournament from the DB based on its ID.
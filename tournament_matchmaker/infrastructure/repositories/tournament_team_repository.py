@@ -3,11 +3,16 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from asyncpg.exceptions import ForeignKeyViolationError, UniqueViolationError  # type: ignore
+from sqlalchemy import Integer, exists, literal, select, join
 
 from tournament_matchmaker.core.repositories.i_tournament_team_repository import ITournamentTeamRepository
 from tournament_matchmaker.core.domains.tournament_team import TournamentTeam, TournamentTeamIn
+from tournament_matchmaker.core.domains.page import Page
+from tournament_matchmaker.infrastructure.repositories.pagination import fetch_page
 from tournament_matchmaker.db import (
+    match_table,
+    tournament_table,
     tournament_team_table,
     database,
 )
@@ -28,7 +33,30 @@ class TournamentTeamRepository(ITournamentTeamRepository):
         )
         tournament_teams = await database.fetch_all(query)
 
-        return [TournamentTeam.from_record(tournament_team) for tournament_team in tournament_teams]
+        return TournamentTeam.from_records(tournament_teams)
+
+    async def get_tournament_teams_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of tournament_teams ordered by team_id, then tournament_id.
+
+        Args:
+            limit (int): The maximal number of tournament_teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: TournamentTeams on the page.
+        """
+
+        return await fetch_page(
+            query=select(tournament_team_table),
+            order_by=(tournament_team_table.c.team_id, tournament_team_table.c.tournament_id),
+            limit=limit,
+            after=after,
+            from_records=TournamentTeam.from_records,
+        )
 
     async def get_by_tournament_id_team_id(self, tournament_id: int, team_id: int) -> Any | None:
         """The method getting tournament_team by provided id.
@@ -68,18 +96,26 @@ class TournamentTeamRepository(ITournamentTeamRepository):
 
         tournament_teams = await database.fetch_all(query)
 
-        return [TournamentTeam.from_record(tournament_team) for tournament_team in tournament_teams]
+        return TournamentTeam.from_records(tournament_teams)
 
-    async def get_all_by_tournament_id(self, tournament_id: int) -> Iterable[Any]:
+    async def get_all_by_tournament_id(self, tournament_id: int, for_update: bool = False) -> Iterable[Any]:
         """The method getting tournament_team by provided tournament_id.
 
         Args:
             tournament_id (int): The tournament_id of the tournament_team.
+            for_update (bool, optional): Whether to lock the registrations of
+                the tournament until the end of the current transaction.
+                Defaults to False.
 
         Returns:
             Any | None: The tournament_team details.
         """
 
+        if for_update:
+            # Registrations lock the tournament row, the teams are read
+            # by the next statement, after the lock is taken.
+            await self._lock_open_tournaments(tournament_id)
+
         query = (
             tournament_team_table.select()
             .where(tournament_team_table.c.tournament_id == tournament_id)
@@ -88,55 +124,95 @@ class TournamentTeamRepository(ITournamentTeamRepository):
 
         tournament_teams = await database.fetch_all(query)
 
-        return [TournamentTeam.from_record(tournament_team) for tournament_team in tournament_teams]
+        return TournamentTeam.from_records(tournament_teams)
 
     async def add_tournament_team(self, data: TournamentTeamIn) -> Any | None:
-        """The method adding new tournament_team to the data storage.
+        """The method registering the team for the tournament if it has a free slot.
+
+        The capacity check and the insert are one statement: the row of
+        the tournament is locked while its `teams_count` is compared with
+        `max_teams_count`, so concurrent registrations are serialized per
+        tournament and can not overfill it. The counter itself is kept by
+        a trigger of the `tournament_team` table.
 
         Args:
             data (TournamentTeamIn): The details of the new tournament_team.
 
         Returns:
-            TournamentTeam: Full details of the newly added tournament_team.
-
-        Returns:
-            Any | None: The newly added tournament_team.
+            Any | None: The newly added tournament_team, None if the tournament
+                is full, unknown or started or the team is unknown or already
+                registered.
         """
 
-        query = tournament_team_table.insert().values(**data.model_dump())
-        await database.execute(query)
-        new_tournament_team = await self.get_by_tournament_id_team_id(data.tournament_id, data.team_id)
+        slot = (
+            select(tournament_table.c.id, literal(data.team_id, Integer))
+            .where(tournament_table.c.id == data.tournament_id)
+            .where(tournament_table.c.teams_count < tournament_table.c.max_teams_count)
+            .where(
+                ~exists()
+                .where(tournament_team_table.c.tournament_id == data.tournament_id)
+                .where(tournament_team_table.c.team_id == data.team_id)
+            )
+            .with_for_update(of=tournament_table)
+        )
+        query = (
+            tournament_team_table.insert()
+            .from_select(["tournament_id", "team_id"], slot)
+            .returning(tournament_team_table)
+        )
 
-        return TournamentTeam(**dict(new_tournament_team)) if new_tournament_team else None
+        try:
+            async with database.transaction():
+                if not await self._lock_open_tournaments(data.tournament_id):
+                    return None
+                new_tournament_team = await database.fetch_one(query)
+        except (UniqueViolationError, ForeignKeyViolationError):
+            return None
+
+        return TournamentTeam.from_record(new_tournament_team) if new_tournament_team else None
 
     async def update_tournament_team(self, tournament_id: int, team_id: int, data: TournamentTeamIn,
     ) -> Any | None:
         """
         Update an existing tournament_team in the data storage.
 
+        A registration moved to another tournament takes a slot of it, so
+        its capacity is checked while both tournaments are locked, as for
+        a new registration.
+
         Args:
             tournament_id (int): The tournament_id of the tournament_team.
             team_id (int): The team_id of the tournament_team.
             data (TeamTournamentIn): The details of the updated team_tournament.
 
         Returns:
-            Any | None: The updated tournament_team details.
+            Any | None: The updated tournament_team details, None if it does
+                not exist, one of the tournaments has started, the new one
+                is full or the team is already registered for it.
         """
 
-        if await self.get_by_tournament_id_team_id(tournament_id, team_id):
-            query = (
-                tournament_team_table.update()
-                .where(tournament_team_table.c.tournament_id == tournament_id)
-                .where(tournament_team_table.c.team_id == team_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            tournament_team = await self.get_by_tournament_id_team_id(tournament_id, team_id)
-
-            return TournamentTeam(**dict(tournament_team)) if tournament_team else None
+        slot = (
+            select(tournament_table.c.teams_count < tournament_table.c.max_teams_count)
+            .where(tournament_table.c.id == data.tournament_id)
+        )
+        query = (
+            tournament_team_table.update()
+            .where(tournament_team_table.c.tournament_id == tournament_id)
+            .where(tournament_team_table.c.team_id == team_id)
+            .values(**data.model_dump())
+            .returning(tournament_team_table)
+        )
+        try:
+            async with database.transaction():
+                if not await self._lock_open_tournaments(tournament_id, data.tournament_id):
+                    return None
+                if data.tournament_id != tournament_id and not await database.fetch_val(slot):
+                    return None
+                tournament_team = await database.fetch_one(query)
+        except (UniqueViolationError, ForeignKeyViolationError):
+            return None
 
-        return None
+        return TournamentTeam.from_record(tournament_team) if tournament_team else None
 
     async def delete_tournament_team(self, tournament_id: int, team_id: int) -> bool:
         """The method updating removing tournament_team from the data storage.
@@ -146,24 +222,42 @@ class TournamentTeamRepository(ITournamentTeamRepository):
             team_id (int): The id of the team.
 
         Returns:
-            bool: Success of the operation.
+            bool: Success of the operation, False if the tournament has started.
         """
-        query1 = (
-            tournament_team_table.select()
+        query = (
+            tournament_team_table.delete()
             .where(tournament_team_table.c.tournament_id == tournament_id)
             .where(tournament_team_table.c.team_id == team_id)
-            .order_by(tournament_team_table.c.tournament_id.asc())
+            .returning(tournament_team_table.c.team_id)
         )
-        tournament_team = await database.fetch_one(query1)
 
-        if tournament_team:
-            query2 = tournament_team_table \
-                .delete() \
-                .where(tournament_team_table.c.team_id == tournament_id)\
-                .where(tournament_team_table.c.team_id == team_id)
+        async with database.transaction():
+            if not await self._lock_open_tournaments(tournament_id):
+                return False
+            return await database.fetch_one(query) is not None
+
+    async def _lock_open_tournaments(self, *tournament_ids: int) -> bool:
+        """A private method locking the tournaments for the transaction, checking none has started.
 
-            await database.execute(query2)
+        The fixtures are generated from the registered teams while the
+        tournament is locked, so registrations can change only until the
+        first match exists. The matches are counted by a statement run
+        after the lock is taken, which sees the fixtures of a concurrent
+        start committed while waiting for it.
+
+        Args:
+            *tournament_ids (int): The ids of the tournaments.
 
-            return True
+        Returns:
+            bool: Whether none of the tournaments has matches.
+        """
+
+        await database.fetch_all(
+            select(tournament_table.c.id)
+            .where(tournament_table.c.id.in_(tournament_ids))
+            .order_by(tournament_table.c.id)
+            .with_for_update()
+        )
+        query = select(~exists().where(match_table.c.tournament_id.in_(tournament_ids)))
 
-        return False
+        return await database.fetch_val(query)
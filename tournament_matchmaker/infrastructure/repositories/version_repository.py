@@ -0,0 +1,69 @@
+"""Module containing table version repository implementation."""
+
+from typing import Iterable
+
+from sqlalchemy import select
+
+from tournament_matchmaker.core.repositories.i_version_repository import IVersionRepository
+from tournament_matchmaker.db import (
+    table_version_table,
+    database,
+)
+from tournament_matchmaker.infrastructure.cache import LRUCache
+
+
+class VersionRepository(IVersionRepository):
+    """A class representing table version DB repository.
+
+    The counters are bumped by statement triggers in the writing
+    transactions. With a cache, known counters are served from memory
+    until a change notification of the table evicts them.
+    """
+
+    _cache: LRUCache | None
+
+    def __init__(self, cache: LRUCache | None = None) -> None:
+        """The initializer of the `version repository`.
+
+        Args:
+            cache (LRUCache | None, optional): The cache of the counters by
+                table name. Defaults to None.
+        """
+        self._cache = cache
+
+    async def get_versions(self, tables: Iterable[str]) -> dict[str, int]:
+        """The method getting change counters of the tables.
+
+        Args:
+            tables (Iterable[str]): The names of the tables.
+
+        Returns:
+            dict[str, int]: The change counter of every table, 0 if unknown.
+        """
+
+        versions = {}
+        missing = []
+        for table in tables:
+            cached = self._cache.get(table) if self._cache else None
+            if cached is None:
+                missing.append(table)
+            else:
+                versions[table] = cached
+
+        if missing:
+            cache_version = self._cache.version if self._cache else None
+            query = (
+                select(table_version_table)
+                .where(table_version_table.c.table_name.in_(missing))
+            )
+            loaded = {
+                row["table_name"]: row["version"]
+                for row in await database.fetch_all(query)
+            }
+
+            for table in missing:
+                versions[table] = loaded.get(table, 0)
+                if self._cache:
+                    self._cache.set(table, versions[table], cache_version)
+
+        return versions
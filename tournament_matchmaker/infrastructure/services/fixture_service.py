@@ -0,0 +1,406 @@
+"""Module containing fixture service implementation."""
+
+import datetime
+from typing import List
+
+from tournament_matchmaker.core.domains.bracket import Bracket, BracketMatch, BracketView
+from tournament_matchmaker.core.domains.match import Match, MatchIn
+from tournament_matchmaker.core.domains.tournament import Tournament
+from tournament_matchmaker.core.formats.elimination import EliminationFormat, layout
+from tournament_matchmaker.core.formats.format import current_round, is_played
+from tournament_matchmaker.core.formats.registry import get_format
+from tournament_matchmaker.core.rating.elo import INITIAL_RATING
+from tournament_matchmaker.core.repositories.i_bracket_repository import IBracketRepository
+from tournament_matchmaker.core.repositories.i_match_repository import IMatchRepository
+from tournament_matchmaker.core.repositories.i_rating_repository import IRatingRepository
+from tournament_matchmaker.core.repositories.i_tournament_team_repository import ITournamentTeamRepository
+from tournament_matchmaker.core.services.i_fixture_service import IFixtureService
+from tournament_matchmaker.db import database
+
+
+class FixtureService(IFixtureService):
+    """A class implementing the fixture service."""
+
+    _match_repository: IMatchRepository
+    _tournament_team_repository: ITournamentTeamRepository
+    _bracket_repository: IBracketRepository
+    _rating_repository: IRatingRepository
+
+    def __init__(
+            self,
+            match_repository: IMatchRepository,
+            tournament_team_repository: ITournamentTeamRepository,
+            bracket_repository: IBracketRepository,
+            rating_repository: IRatingRepository,
+            round_interval_days: int = 7,
+    ) -> None:
+        """The initializer of the `fixture service`.
+
+        Args:
+            match_repository (IMatchRepository): The reference to the match repository.
+            tournament_team_repository (ITournamentTeamRepository): The reference
+                to the tournament_team repository.
+            bracket_repository (IBracketRepository): The reference to the bracket repository.
+            rating_repository (IRatingRepository): The reference to the rating repository.
+            round_interval_days (int, optional): The number of days between
+                two rounds. Defaults to 7.
+        """
+        self._match_repository = match_repository
+        self._tournament_team_repository = tournament_team_repository
+        self._bracket_repository = bracket_repository
+        self._rating_repository = rating_repository
+        self._round_interval = datetime.timedelta(days=round_interval_days)
+
+    async def start(self, tournament: Tournament) -> List[Match]:
+        """The method generating the first round of the tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Returns:
+            List[Match]: The new matches, empty if the tournament has started.
+        """
+
+        async with database.transaction():
+            team_ids = await self._get_team_ids(tournament)
+
+            tournament_format = get_format(tournament.format)
+            if isinstance(tournament_format, EliminationFormat):
+                return await self._add_bracket(tournament, tournament_format, team_ids)
+
+            return await self._add_round(tournament, team_ids, [])
+
+    async def next_round(self, tournament: Tournament) -> List[Match]:
+        """The method generating the round after the latest one, by the format of the tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Raises:
+            ValueError: If a match of the latest round was not played and
+                the format pairs from results.
+
+        Returns:
+            List[Match]: The new matches, empty if the tournament is complete.
+        """
+
+        async with database.transaction():
+            team_ids = await self._get_team_ids(tournament)
+            matches = await self._match_repository.get_by_tournament_id(tournament.id)
+            tournament_format = get_format(tournament.format)
+            if tournament_format.depends_on_results and not all(is_played(match) for match in matches):
+                raise ValueError(f"Round {current_round(matches)} of tournament {tournament.id} is not finished")
+
+            return await self._add_round(tournament, team_ids, matches)
+
+    async def schedule(self, tournament: Tournament, until: datetime.date) -> List[Match]:
+        """The method generating the missing rounds up to the date.
+
+        Args:
+            tournament (Tournament): The tournament.
+            until (datetime.date): The date of the last round to generate.
+
+        Raises:
+            ValueError: If the rounds of the format depend on results.
+
+        Returns:
+            List[Match]: The new matches, empty if all rounds up to the date exist.
+        """
+
+        if get_format(tournament.format).depends_on_results:
+            raise ValueError(f"Rounds of {tournament.format} cannot be scheduled ahead")
+
+        new_matches: List[Match] = []
+        async with database.transaction():
+            team_ids = await self._get_team_ids(tournament)
+            matches = await self._match_repository.get_by_tournament_id(tournament.id)
+
+            while self._round_date(tournament, current_round(matches) + 1) <= until:
+                round_matches = await self._add_round(tournament, team_ids, matches)
+                if not round_matches:
+                    break
+                matches.extend(round_matches)
+                new_matches.extend(round_matches)
+
+        return new_matches
+
+    async def update_match(self, match_id: int, data: MatchIn, tournament: Tournament) -> Match | None:
+        """The method updating the match, moving the teams of a decided bracket match on.
+
+        Only the matches of elimination tournaments are looked up in the
+        bracket. Their bracket is locked for the transaction of the update,
+        so the result and the advance are saved together, and the teams
+        and the score of a match which decided its node cannot change. A
+        draw does not decide a bracket match.
+
+        Args:
+            match_id (int): The id of the match.
+            data (MatchIn): The details of the updated match.
+            tournament (Tournament): The tournament of the updated match.
+
+        Raises:
+            ValueError: If the teams or the score of a decided bracket
+                match would change.
+
+        Returns:
+            Match | None: The updated match details.
+        """
+
+        if not isinstance(get_format(tournament.format), EliminationFormat):
+            return await self._match_repository.update_match(match_id=match_id, data=data)
+
+        async with database.transaction():
+            bracket = await self._bracket_repository.get_by_tournament_id(tournament.id, for_update=True)
+            if not bracket or match_id not in bracket.match_ids:
+                return await self._match_repository.update_match(match_id=match_id, data=data)
+
+            node = bracket.match_ids.index(match_id)
+            if bracket.winners[node] is not None:
+                match = await self._match_repository.get_by_id(match_id)
+                if match and _result(match) != _result(data):
+                    raise ValueError(f"Match {match_id} has decided its bracket node")
+
+            match = await self._match_repository.update_match(match_id=match_id, data=data)
+            if match and bracket.winners[node] is None:
+                await self._advance(bracket, node, match)
+
+            return match
+
+    async def get_bracket(self, tournament_id: int) -> BracketView | None:
+        """The method getting the bracket of the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            BracketView | None: The bracket, None if the tournament has none.
+        """
+
+        bracket = await self._bracket_repository.get_by_tournament_id(tournament_id)
+        if not bracket:
+            return None
+
+        return BracketView(
+            tournament_id=bracket.tournament_id,
+            double=bracket.double,
+            size=bracket.size,
+            champion_id=_bracket_format(bracket).champion(bracket),
+            matches=[
+                BracketMatch(
+                    node=node,
+                    bracket=place.bracket,
+                    round=place.round,
+                    team1_id=bracket.slots[2 * node] or None,
+                    team2_id=bracket.slots[2 * node + 1] or None,
+                    winner_id=bracket.winners[node] or None,
+                    match_id=bracket.match_ids[node],
+                )
+                for node, place in enumerate(layout(bracket.size, bracket.double))
+            ],
+        )
+
+    async def _add_bracket(
+            self,
+            tournament: Tournament,
+            tournament_format: EliminationFormat,
+            team_ids: List[int],
+    ) -> List[Match]:
+        """A private method seeding the teams by rating into a new bracket.
+
+        Args:
+            tournament (Tournament): The tournament.
+            tournament_format (EliminationFormat): The format of the tournament.
+            team_ids (List[int]): The ids of the teams in the tournament.
+
+        Returns:
+            List[Match]: The matches of the first round, empty if the
+                tournament already has a bracket.
+        """
+
+        ratings = {
+            rating.team_id: rating.rating
+            for rating in await self._rating_repository.get_by_team_ids(team_ids)
+        }
+        seeded = sorted(team_ids, key=lambda team_id: (-ratings.get(team_id, INITIAL_RATING), team_id))
+
+        bracket, ready = tournament_format.create(tournament.id, seeded)
+        new_matches = {node: _bracket_match(bracket, node, tournament.date) for node in ready}
+        if saved := await self._bracket_repository.add_bracket(bracket, new_matches):
+            return _saved_matches(saved, new_matches)
+
+        return []
+
+    async def _advance(self, bracket: Bracket, node: int, match: Match) -> List[Match]:
+        """A private method moving the teams of the match on, if it decided its node.
+
+        Args:
+            bracket (Bracket): The bracket, locked by the current transaction.
+            node (int): The node of the match.
+            match (Match): The updated match.
+
+        Returns:
+            List[Match]: The matches which got both teams, empty if the match
+                did not decide its node.
+        """
+
+        if not is_played(match) or match.team1_score == match.team2_score:
+            return []
+
+        if match.team1_score > match.team2_score:
+            winner, loser = match.team1_id, match.team2_id
+        else:
+            winner, loser = match.team2_id, match.team1_id
+
+        if {bracket.slots[2 * node], bracket.slots[2 * node + 1]} != {winner, loser}:
+            return []
+
+        ready = _bracket_format(bracket).advance(bracket, node, winner, loser)
+        new_matches = {
+            ready_node: _bracket_match(bracket, ready_node, match.match_date)
+            for ready_node in ready
+        }
+        if saved := await self._bracket_repository.update_bracket(bracket, new_matches):
+            return _saved_matches(saved, new_matches)
+
+        return []
+
+    async def _get_team_ids(self, tournament: Tournament) -> List[int]:
+        """A private method getting the ids of the teams in the tournament.
+
+        The registrations are locked for the current transaction, so the
+        teams can not change until its fixtures are saved, and once they
+        are, registrations are closed. Later rounds are paired from the
+        same teams as the first one.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Returns:
+            List[int]: The ids of the teams, ascending.
+        """
+
+        tournament_teams = await self._tournament_team_repository.get_all_by_tournament_id(
+            tournament.id,
+            for_update=True,
+        )
+
+        return sorted(tournament_team.team_id for tournament_team in tournament_teams)
+
+    def _round_date(self, tournament: Tournament, round_number: int) -> datetime.date:
+        """A private method getting the date of the round.
+
+        Rounds are spread evenly from the date of the tournament.
+
+        Args:
+            tournament (Tournament): The tournament.
+            round_number (int): The number of the round, counted from 1.
+
+        Returns:
+            datetime.date: The date of the matches of the round.
+        """
+
+        return tournament.date + (round_number - 1) * self._round_interval
+
+    async def _add_round(
+            self,
+            tournament: Tournament,
+            team_ids: List[int],
+            matches: List[Match],
+    ) -> List[Match]:
+        """A private method pairing and saving the round after the given matches.
+
+        Args:
+            tournament (Tournament): The tournament.
+            team_ids (List[int]): The ids of the teams in the tournament.
+            matches (List[Match]): The matches of the previous rounds.
+
+        Returns:
+            List[Match]: The new matches, empty if there are none or the
+                round was generated concurrently.
+        """
+
+        round_number = current_round(matches) + 1
+        pairings = get_format(tournament.format).next_round(team_ids, matches)
+        new_matches = [
+            MatchIn(
+                tournament_id=tournament.id,
+                team1_id=pairing.team1_id,
+                team2_id=pairing.team2_id,
+                team1_score=0,
+                team2_score=0,
+                match_date=self._round_date(tournament, round_number),
+                round=round_number,
+            )
+            for pairing in pairings
+        ]
+        if not new_matches:
+            return []
+
+        match_ids = await self._match_repository.add_round(tournament.id, round_number, new_matches)
+
+        return [
+            Match(id=match_id, **match.model_dump())
+            for match_id, match in zip(match_ids or (), new_matches)
+        ]
+
+
+def _bracket_format(bracket: Bracket) -> EliminationFormat:
+    """A private function getting the format of the bracket.
+
+    Args:
+        bracket (Bracket): The bracket.
+
+    Returns:
+        EliminationFormat: The single or double elimination.
+    """
+    return EliminationFormat(double=bracket.double)
+
+
+def _bracket_match(bracket: Bracket, node: int, match_date: datetime.date) -> MatchIn:
+    """A private function preparing the match of a bracket node with both teams.
+
+    Args:
+        bracket (Bracket): The bracket.
+        node (int): The node.
+        match_date (datetime.date): The date of the match.
+
+    Returns:
+        MatchIn: The scheduled match.
+    """
+    return MatchIn(
+        tournament_id=bracket.tournament_id,
+        team1_id=bracket.slots[2 * node],
+        team2_id=bracket.slots[2 * node + 1],
+        team1_score=0,
+        team2_score=0,
+        match_date=match_date,
+        round=layout(bracket.size, bracket.double)[node].round,
+    )
+
+
+def _result(match: MatchIn) -> tuple:
+    """A private function getting the teams and the score of the match.
+
+    Args:
+        match (MatchIn): The match.
+
+    Returns:
+        tuple: The ids of the teams and their scores.
+    """
+    return match.team1_id, match.team2_id, match.team1_score, match.team2_score
+
+
+def _saved_matches(bracket: Bracket, matches: dict[int, MatchIn]) -> List[Match]:
+    """A private function getting the saved matches of the bracket nodes.
+
+    Args:
+        bracket (Bracket): The saved bracket.
+        matches (dict[int, MatchIn]): The new matches by nodes.
+
+    Returns:
+        List[Match]: The matches with their ids.
+    """
+    return [
+        Match(id=bracket.match_ids[node], **match.model_dump())
+        for node, match in sorted(matches.items())
+    ]
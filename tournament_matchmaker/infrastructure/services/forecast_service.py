@@ -0,0 +1,242 @@
+"""Module containing forecast service implementation."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List
+
+import numpy as np
+
+from tournament_matchmaker.core.domains.forecast import Forecast, TeamForecast
+from tournament_matchmaker.core.domains.match import Match
+from tournament_matchmaker.core.domains.standing import Standing
+from tournament_matchmaker.core.domains.tournament import Tournament
+from tournament_matchmaker.core.forecast.monte_carlo import (
+    Outcomes,
+    TournamentState,
+    simulate,
+    simulate_parallel,
+)
+from tournament_matchmaker.core.formats.format import is_played
+from tournament_matchmaker.core.rating.elo import INITIAL_RATING
+from tournament_matchmaker.core.repositories.i_match_repository import IMatchRepository
+from tournament_matchmaker.core.repositories.i_rating_repository import IRatingRepository
+from tournament_matchmaker.core.repositories.i_standings_repository import IStandingsRepository
+from tournament_matchmaker.core.repositories.i_tournament_team_repository import ITournamentTeamRepository
+from tournament_matchmaker.core.services.i_forecast_service import IForecastService
+from tournament_matchmaker.infrastructure.cache import LRUCache
+
+
+class ForecastService(IForecastService):
+    """A class implementing the forecast service.
+
+    The tournament is loaded once per forecast and simulated in memory,
+    large runs are split between worker processes. Forecasts are cached
+    until a match of the tournament changes.
+    """
+
+    _match_repository: IMatchRepository
+    _tournament_team_repository: ITournamentTeamRepository
+    _standings_repository: IStandingsRepository
+    _rating_repository: IRatingRepository
+    _cache: LRUCache
+
+    def __init__(
+            self,
+            match_repository: IMatchRepository,
+            tournament_team_repository: ITournamentTeamRepository,
+            standings_repository: IStandingsRepository,
+            rating_repository: IRatingRepository,
+            cache: LRUCache,
+            simulations: int = 100_000,
+            workers: int = 4,
+            parallel_threshold: int = 10_000_000,
+    ) -> None:
+        """The initializer of the `forecast service`.
+
+        Args:
+            match_repository (IMatchRepository): The reference to the match repository.
+            tournament_team_repository (ITournamentTeamRepository): The reference
+                to the tournament_team repository.
+            standings_repository (IStandingsRepository): The reference to the standings repository.
+            rating_repository (IRatingRepository): The reference to the rating repository.
+            cache (LRUCache): The cache of forecasts by tournament id.
+            simulations (int, optional): The number of simulated tournaments.
+                Defaults to 100_000.
+            workers (int, optional): The number of worker processes.
+                Defaults to 4.
+            parallel_threshold (int, optional): The smallest number of
+                simulated matches run in the worker processes. Defaults to 10_000_000.
+        """
+        self._match_repository = match_repository
+        self._tournament_team_repository = tournament_team_repository
+        self._standings_repository = standings_repository
+        self._rating_repository = rating_repository
+        self._cache = cache
+        self._simulations = simulations
+        self._workers = workers
+        self._parallel_threshold = parallel_threshold
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def get_forecast(self, tournament: Tournament) -> Forecast:
+        """The method getting the chances of the teams to win the tournament.
+
+        Like in the standings, the team with the most wins is first and
+        the score difference breaks ties. Besides the scheduled matches,
+        the pairs of a round robin which were not generated yet are played.
+
+        Args:
+            tournament (Tournament): The tournament.
+
+        Returns:
+            Forecast: The chances of the teams, the most likely winner first.
+        """
+
+        if forecast := self._cache.get(tournament.id):
+            return forecast
+
+        version = self._cache.version
+        tournament_teams, matches, standings = await asyncio.gather(
+            self._tournament_team_repository.get_all_by_tournament_id(tournament.id),
+            self._match_repository.get_by_tournament_id(tournament.id),
+            self._standings_repository.get_by_tournament_id(tournament.id),
+        )
+        team_ids = sorted(
+            {tournament_team.team_id for tournament_team in tournament_teams}
+            | {match.team1_id for match in matches}
+            | {match.team2_id for match in matches}
+        )
+        ratings = {
+            rating.team_id: rating.rating
+            for rating in await self._rating_repository.get_by_team_ids(team_ids)
+        }
+
+        state = _tournament_state(
+            team_ids,
+            [ratings.get(team_id, INITIAL_RATING) for team_id in team_ids],
+            matches,
+            standings,
+            all_pairs=tournament.format == "round_robin",
+        )
+        outcomes = await self._simulate(state)
+
+        forecast = Forecast(
+            tournament_id=tournament.id,
+            simulations=outcomes.simulations,
+            remaining_matches=len(state.team1),
+            teams=sorted(
+                (
+                    TeamForecast(
+                        team_id=team_id,
+                        rating=float(state.rating[index]),
+                        wins=int(state.wins[index]),
+                        expected_wins=float(outcomes.wins[index] / outcomes.simulations),
+                        win_probability=float(outcomes.firsts[index] / outcomes.simulations),
+                    )
+                    for index, team_id in enumerate(team_ids)
+                ),
+                key=lambda team: (-team.win_probability, -team.expected_wins, team.team_id),
+            ),
+        )
+        self._cache.set(tournament.id, forecast, version)
+
+        return forecast
+
+    def evict(self, tournament_id: int | None = None) -> None:
+        """The method dropping the cached forecast after a match of the tournament changed.
+
+        Args:
+            tournament_id (int | None, optional): The id of the tournament,
+                None for all tournaments. Defaults to None.
+        """
+
+        self._cache.evict(tournament_id)
+
+    def close(self) -> None:
+        """The method stopping the simulation workers."""
+
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def _simulate(self, state: TournamentState) -> Outcomes:
+        """A private method running the simulations, in worker processes if they are many.
+
+        Args:
+            state (TournamentState): The tournament.
+
+        Returns:
+            Outcomes: The totals of the simulations.
+        """
+
+        if self._workers < 2 or self._simulations * len(state.team1) < self._parallel_threshold:
+            return await asyncio.to_thread(simulate, state, self._simulations)
+
+        if self._executor is None:
+            # Forked children would inherit the threads and the event loop.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return await simulate_parallel(self._executor, state, self._simulations, self._workers)
+
+
+def _tournament_state(
+        team_ids: List[int],
+        ratings: List[float],
+        matches: Iterable[Match],
+        standings: Iterable[Standing],
+        all_pairs: bool,
+) -> TournamentState:
+    """A private function preparing the arrays of the simulated tournament.
+
+    Args:
+        team_ids (List[int]): The ids of the teams, ascending.
+        ratings (List[float]): The ratings of the teams.
+        matches (Iterable[Match]): The matches of the tournament.
+        standings (Iterable[Standing]): The standings of the tournament.
+        all_pairs (bool): Whether every two teams meet, including the
+            pairs without a match yet.
+
+    Returns:
+        TournamentState: The tournament with teams referred to by positions.
+    """
+    teams = len(team_ids)
+    position = {team_id: index for index, team_id in enumerate(team_ids)}
+
+    wins = np.zeros(teams, dtype=np.int64)
+    difference = np.zeros(teams, dtype=np.int64)
+    for standing in standings:
+        if standing.team_id in position:
+            wins[position[standing.team_id]] = standing.wins
+            difference[position[standing.team_id]] = standing.score_for - standing.score_against
+
+    scheduled = np.zeros((teams, teams), dtype=bool)
+    remaining = []
+    for match in matches:
+        first, second = position[match.team1_id], position[match.team2_id]
+        scheduled[first, second] = scheduled[second, first] = True
+        if not is_played(match):
+            remaining.append((first, second))
+
+    team1 = np.array([first for first, _ in remaining], dtype=np.int64)
+    team2 = np.array([second for _, second in remaining], dtype=np.int64)
+    if all_pairs:
+        first, second = np.triu_indices(teams, 1)
+        missing = ~scheduled[first, second]
+        team1 = np.concatenate((team1, first[missing]))
+        team2 = np.concatenate((team2, second[missing]))
+
+    # The better score difference, then the lower id, ranks higher.
+    order = np.lexsort((np.arange(teams), -difference))
+    tiebreak = np.empty(teams, dtype=np.int64)
+    tiebreak[order] = np.arange(teams - 1, -1, -1)
+
+    return TournamentState(
+        wins=wins,
+        tiebreak=tiebreak,
+        rating=np.array(ratings, dtype=np.float64),
+        team1=team1,
+        team2=team2,
+    )
@@ -0,0 +1,397 @@
+"""Module containing job service implementation."""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable
+
+from tournament_matchmaker.core.domains.job import ImportIn, Job, JobIn
+from tournament_matchmaker.core.domains.player import PlayerIn
+from tournament_matchmaker.core.domains.team import TeamIn
+from tournament_matchmaker.core.repositories.i_job_repository import IJobRepository
+from tournament_matchmaker.core.repositories.i_player_repository import IPlayerRepository
+from tournament_matchmaker.core.repositories.i_team_repository import ITeamRepository
+from tournament_matchmaker.core.services.i_fixture_service import IFixtureService
+from tournament_matchmaker.core.services.i_job_service import IJobService
+from tournament_matchmaker.core.services.i_rating_service import IRatingService
+from tournament_matchmaker.core.services.i_tournament_service import ITournamentService
+
+logger = logging.getLogger(__name__)
+
+
+class JobProgress:
+    """A class representing the progress of a running job.
+
+    Handlers report every step, but it is saved at most once per
+    interval, or when the total changes, so fine-grained reports cost
+    no queries.
+    """
+
+    def __init__(
+            self,
+            job_id: int,
+            job_repository: IJobRepository,
+            interval: float,
+            clock: Callable[[], float],
+    ) -> None:
+        """The initializer of the `job progress`.
+
+        Args:
+            job_id (int): The id of the job.
+            job_repository (IJobRepository): The reference to the job repository.
+            interval (float): The minimal time between saves in seconds.
+            clock (Callable[[], float]): The source of the current time.
+        """
+        self.job_id = job_id
+        self._job_repository = job_repository
+        self._interval = interval
+        self._clock = clock
+        self._saved_at = clock()
+        self.progress = 0
+        self.total: int | None = None
+
+    async def update(self, progress: int, total: int | None = None) -> None:
+        """A method reporting the processed items of the job.
+
+        Args:
+            progress (int): The number of the processed items.
+            total (int | None, optional): The number of all items,
+                None if unchanged. Defaults to None.
+        """
+        changed = total is not None and total != self.total
+        self.progress = progress
+        if total is not None:
+            self.total = total
+
+        now = self._clock()
+        if changed or now - self._saved_at >= self._interval:
+            self._saved_at = now
+            await self.save()
+
+    async def save(self) -> None:
+        """A method saving the reported progress."""
+        await self._job_repository.update_progress(self.job_id, self.progress, self.total)
+
+
+Handler = Callable[[dict, JobProgress], Awaitable[dict]]
+
+
+class JobService(IJobService):
+    """A class implementing the job service.
+
+    Jobs are saved before they are queued in the memory of the worker
+    and run by a fixed number of tasks, so long operations are bounded
+    and do not hold HTTP requests. A job is claimed in the DB before it
+    runs, so jobs left queued by a stopped worker are resumed by the next
+    one to start exactly once. A running job is saved at least once per
+    heartbeat interval, even without progress, so only jobs of dead
+    workers stay unsaved long enough to be failed as stale. Run times are
+    recorded by job kind, apart from the latency of the requests
+    submitting them.
+    """
+
+    _job_repository: IJobRepository
+    _tournament_service: ITournamentService
+    _fixture_service: IFixtureService
+    _rating_service: IRatingService
+    _team_repository: ITeamRepository
+    _player_repository: IPlayerRepository
+
+    def __init__(
+            self,
+            job_repository: IJobRepository,
+            tournament_service: ITournamentService,
+            fixture_service: IFixtureService,
+            rating_service: IRatingService,
+            team_repository: ITeamRepository,
+            player_repository: IPlayerRepository,
+            workers: int = 2,
+            queue_max_size: int = 1_000,
+            progress_interval: float = 0.5,
+            heartbeat_interval: float = 60.0,
+            stale_after: float = 600.0,
+            import_chunk_size: int = 1_000,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """The initializer of the `job service`.
+
+        Args:
+            job_repository (IJobRepository): The reference to the job repository.
+            tournament_service (ITournamentService): The reference to the tournament service.
+            fixture_service (IFixtureService): The reference to the fixture service.
+            rating_service (IRatingService): The reference to the rating service.
+            team_repository (ITeamRepository): The reference to the team repository.
+            player_repository (IPlayerRepository): The reference to the player repository.
+            workers (int, optional): The number of jobs run at once. Defaults to 2.
+            queue_max_size (int, optional): The maximal number of jobs waiting
+                for a worker. Defaults to 1_000.
+            progress_interval (float, optional): The minimal time between saves
+                of the progress in seconds. Defaults to 0.5.
+            heartbeat_interval (float, optional): The time between saves of
+                a running job without progress in seconds. Defaults to 60.0.
+            stale_after (float, optional): The time without saves in seconds
+                after which a running job of a dead worker is failed, longer
+                than the heartbeat interval. Defaults to 600.0.
+            import_chunk_size (int, optional): The number of rows inserted
+                at once by imports. Defaults to 1_000.
+            clock (Callable[[], float], optional): The source of the current
+                time. Defaults to time.monotonic.
+        """
+        self._job_repository = job_repository
+        self._tournament_service = tournament_service
+        self._fixture_service = fixture_service
+        self._rating_service = rating_service
+        self._team_repository = team_repository
+        self._player_repository = player_repository
+        self._workers = workers
+        self._queue_max_size = queue_max_size
+        self._progress_interval = progress_interval
+        self._heartbeat_interval = heartbeat_interval
+        self._stale_after = stale_after
+        self._import_chunk_size = import_chunk_size
+        self._clock = clock
+        self._handlers: dict[str, Handler] = {
+            "end_recruiting": self._end_recruiting,
+            "import": self._import,
+            "recompute_ratings": self._recompute_ratings,
+        }
+        self._queue: asyncio.Queue[tuple[int, float]] = asyncio.Queue()
+        self._submitting = 0
+        self._busy = 0
+        self._tasks: list[asyncio.Task] = []
+        self._stats: dict[str, dict] = defaultdict(lambda: {
+            "succeeded": 0,
+            "failed": 0,
+            "items": 0,
+            "run_time_total": 0.0,
+            "run_time_max": 0.0,
+            "wait_time_total": 0.0,
+        })
+
+    async def submit(self, data: JobIn) -> Job:
+        """The method queuing new job for the workers.
+
+        Args:
+            data (JobIn): The work of the job.
+
+        Raises:
+            ValueError: If the queue of the jobs is full.
+
+        Returns:
+            Job: The queued job.
+        """
+
+        if self._queue.qsize() + self._submitting >= self._queue_max_size:
+            raise ValueError("Job queue is full")
+
+        self._submitting += 1
+        try:
+            job = await self._job_repository.add_job(data)
+        finally:
+            self._submitting -= 1
+
+        self._queue.put_nowait((job.id, self._clock()))
+
+        return job
+
+    async def get_by_id(self, job_id: int) -> Job | None:
+        """The method getting the state of the job.
+
+        Args:
+            job_id (int): The id of the job.
+
+        Returns:
+            Job | None: The job details.
+        """
+
+        return await self._job_repository.get_by_id(job_id)
+
+    def get_stats(self) -> dict:
+        """The method getting the throughput of the workers by job kind.
+
+        Returns:
+            dict: The number of workers, busy ones and queued jobs, with
+                the run and wait times and processed items by job kind.
+        """
+
+        kinds = {}
+        for kind, stats in self._stats.items():
+            finished = stats["succeeded"] + stats["failed"]
+            run_time = stats["run_time_total"]
+            kinds[kind] = {
+                **stats,
+                "run_time_avg": run_time / finished if finished else 0.0,
+                "wait_time_avg": stats["wait_time_total"] / finished if finished else 0.0,
+                "items_per_second": stats["items"] / run_time if run_time else 0.0,
+            }
+
+        return {
+            "workers": len(self._tasks),
+            "busy": self._busy,
+            "queued": self._queue.qsize(),
+            "kinds": kinds,
+        }
+
+    async def start(self) -> None:
+        """The method starting the workers, resuming jobs queued before."""
+
+        if self._tasks:
+            return
+
+        if failed := await self._job_repository.fail_stale_jobs(self._stale_after):
+            logger.warning("Failed %d interrupted jobs", failed)
+
+        for job_id in await self._job_repository.get_queued_ids():
+            self._queue.put_nowait((job_id, self._clock()))
+
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self._workers)]
+
+    async def stop(self) -> None:
+        """The method stopping the workers, failing the jobs they run."""
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self) -> None:
+        """A private method running the queued jobs one by one until cancelled."""
+        while True:
+            job_id, queued_at = await self._queue.get()
+            try:
+                await self._run(job_id, queued_at)
+            except Exception as e:
+                logger.warning("Job %d could not be saved: %s", job_id, e)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: int, queued_at: float) -> None:
+        """A private method running the job, unless another worker claimed it.
+
+        Args:
+            job_id (int): The id of the job.
+            queued_at (float): The time the job was queued at.
+        """
+        data = await self._job_repository.claim_job(job_id)
+        if data is None:
+            return
+
+        started_at = self._clock()
+        progress = JobProgress(job_id, self._job_repository, self._progress_interval, self._clock)
+        stats = self._stats[data.kind]
+        stats["wait_time_total"] += started_at - queued_at
+        self._busy += 1
+        heartbeat = asyncio.create_task(self._heartbeat(progress))
+
+        try:
+            result = await self._handlers[data.kind](data.params, progress)
+        except asyncio.CancelledError:
+            await self._job_repository.finish_job(job_id, error="Interrupted")
+            raise
+        except Exception as e:
+            logger.warning("Job %d (%s) failed: %s", job_id, data.kind, e)
+            stats["failed"] += 1
+            await progress.save()
+            await self._job_repository.finish_job(job_id, error=str(e) or type(e).__name__)
+        else:
+            stats["succeeded"] += 1
+            await progress.save()
+            await self._job_repository.finish_job(job_id, result=result)
+        finally:
+            heartbeat.cancel()
+            run_time = self._clock() - started_at
+            stats["items"] += progress.progress
+            stats["run_time_total"] += run_time
+            stats["run_time_max"] = max(stats["run_time_max"], run_time)
+            self._busy -= 1
+
+    async def _heartbeat(self, progress: JobProgress) -> None:
+        """A private method saving the progress of the running job periodically until cancelled.
+
+        Args:
+            progress (JobProgress): The progress of the job.
+        """
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            try:
+                await progress.save()
+            except Exception as e:
+                logger.warning("Heartbeat of job %d failed: %s", progress.job_id, e)
+
+    async def _end_recruiting(self, params: dict, progress: JobProgress) -> dict:
+        """A private method generating the first round of the tournament.
+
+        Args:
+            params (dict): The id of the tournament.
+            progress (JobProgress): The progress of the job.
+
+        Raises:
+            ValueError: If the tournament does not exist.
+
+        Returns:
+            dict: The number of the new matches.
+        """
+        tournament = await self._tournament_service.get_by_id(params["tournament_id"])
+        if not tournament:
+            raise ValueError("Tournament not found")
+
+        await progress.update(0, total=1)
+        matches = await self._fixture_service.start(tournament)
+        await progress.update(1)
+
+        return {"tournament_id": tournament.id, "matches": len(matches)}
+
+    async def _recompute_ratings(self, _params: dict, progress: JobProgress) -> dict:
+        """A private method recomputing ratings of all teams.
+
+        Args:
+            progress (JobProgress): The progress of the job.
+
+        Returns:
+            dict: The number of rated teams.
+        """
+        await progress.update(0, total=1)
+        rated_teams = await self._rating_service.recompute()
+        await progress.update(1)
+
+        return {"rated_teams": rated_teams}
+
+    async def _import(self, params: dict, progress: JobProgress) -> dict:
+        """A private method adding the teams with their players in chunks.
+
+        Every chunk is inserted with one statement, so a failed import
+        keeps the chunks saved before, as told by its progress.
+
+        Args:
+            params (dict): The teams with their players.
+            progress (JobProgress): The progress of the job.
+
+        Returns:
+            dict: The numbers of the added teams and players.
+        """
+        data = ImportIn.model_validate(params)
+        await progress.update(0, total=data.count())
+        done = teams_count = players_count = 0
+
+        for start in range(0, len(data.teams), self._import_chunk_size):
+            chunk = data.teams[start:start + self._import_chunk_size]
+            teams = await self._team_repository.add_teams([TeamIn(name=team.name) for team in chunk])
+            players = [
+                PlayerIn(name=player.name, rank=player.rank, team_id=team.id)
+                for imported, team in zip(chunk, teams)
+                for player in imported.players
+            ]
+            teams_count += len(teams)
+            done += len(teams)
+            await progress.update(done)
+
+            for offset in range(0, len(players), self._import_chunk_size):
+                added = await self._player_repository.add_players(
+                    players[offset:offset + self._import_chunk_size]
+                )
+                players_count += len(added)
+                done += len(added)
+                await progress.update(done)
+
+        return {"teams": teams_count, "players": players_count}
@@ -1,7 +1,9 @@
 """Module containing match service implementation."""
 
-from typing import Iterable, List
+import datetime
+from typing import AsyncIterator, Iterable, List
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.match import Match, MatchIn
 from tournament_matchmaker.core.domains.tournament import Tournament
 from tournament_matchmaker.core.repositories.i_match_repository import IMatchRepository
@@ -30,6 +32,41 @@ class MatchService(IMatchService):
 
         return await self._match_repository.get_all_matches()
 
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of matches from the repository.
+
+        Args:
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Matches on the page.
+        """
+
+        return await self._match_repository.get_matches_page(limit, after)
+
+    def iterate_all(self) -> AsyncIterator[Match]:
+        """The method iterating over all matches in the repository.
+
+        Returns:
+            AsyncIterator[Match]: All matches, fetched lazily.
+        """
+
+        return self._match_repository.iterate_matches()
+
+    async def count(self) -> int:
+        """The method counting all matches in the repository.
+
+        Returns:
+            int: The number of matches.
+        """
+
+        return await self._match_repository.count_matches()
+
     async def get_by_id(self, match_id: int) -> Match | None:
         """The method getting match by provided id.
 
@@ -53,6 +90,44 @@ class MatchService(IMatchService):
         """
         return await self._match_repository.get_by_tournament_id(tournament_id)
 
+    async def has_matches(self, tournament_ids: Iterable[int]) -> bool:
+        """The method checking whether any of the tournaments has matches.
+
+        Args:
+            tournament_ids (Iterable[int]): The ids of the tournaments.
+
+        Returns:
+            bool: Whether a match of the tournaments exists.
+        """
+
+        return await self._match_repository.has_matches(tournament_ids)
+
+
+    async def get_page_by_date(
+            self,
+            match_date: datetime.date,
+            limit: int,
+            after: str | None = None,
+            tournament_id: int | None = None,
+    ) -> Page:
+        """The method getting a page of matches played on the date.
+
+        Args:
+            match_date (datetime.date): The date of the matches.
+            limit (int): The maximal number of matches on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+            tournament_id (int | None, optional): The id of the tournament
+                to narrow the matches to. Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: The matches of the date on the page.
+        """
+
+        return await self._match_repository.get_matches_page_by_date(match_date, limit, after, tournament_id)
 
     async def add_match(self, data: MatchIn) -> Match | None:
         """The method adding new match to the data storage.
@@ -66,6 +141,18 @@ class MatchService(IMatchService):
 
         return await self._match_repository.add_match(data)
 
+    async def add_matches(self, data: List[MatchIn]) -> List[int]:
+        """The method adding many new matches to the data storage at once.
+
+        Args:
+            data (List[MatchIn]): The details of the new matches.
+
+        Returns:
+            List[int]: The ids of the newly added matches.
+        """
+
+        return await self._match_repository.add_matches(data)
+
     async def update_match(
             self,
             match_id: int,
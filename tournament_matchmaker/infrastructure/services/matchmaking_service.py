@@ -0,0 +1,157 @@
+"""Module containing matchmaking service implementation."""
+
+import asyncio
+import contextvars
+from typing import List
+
+from tournament_matchmaker.core.domains.matchmaking import QueueTicket
+from tournament_matchmaker.core.domains.player import Player
+from tournament_matchmaker.core.domains.team import TeamIn
+from tournament_matchmaker.core.matchmaking.queue import MatchmakingQueue
+from tournament_matchmaker.core.repositories.i_player_repository import IPlayerRepository
+from tournament_matchmaker.core.repositories.i_team_repository import ITeamRepository
+from tournament_matchmaker.core.services.i_matchmaking_service import IMatchmakingService
+from tournament_matchmaker.db import database
+
+
+class MatchmakingService(IMatchmakingService):
+    """A class implementing the matchmaking service.
+
+    The queue is kept in the memory of the worker, so the service is a
+    single instance per worker and the players of one queue must be sent
+    to the same worker. Teams formed while the previous ones are being
+    saved are saved together, with one insert of the teams and one update
+    of their players, in one transaction. If saving fails, the players
+    of the batch are queued again, but the one whose request formed a
+    team, which gets the error.
+    """
+
+    _queue: MatchmakingQueue
+    _team_repository: ITeamRepository
+    _player_repository: IPlayerRepository
+
+    def __init__(
+            self,
+            queue: MatchmakingQueue,
+            team_repository: ITeamRepository,
+            player_repository: IPlayerRepository,
+    ) -> None:
+        """The initializer of the `matchmaking service`.
+
+        Args:
+            queue (MatchmakingQueue): The queue of the players.
+            team_repository (ITeamRepository): The reference to the team repository.
+            player_repository (IPlayerRepository): The reference to the player repository.
+        """
+        self._queue = queue
+        self._team_repository = team_repository
+        self._player_repository = player_repository
+        self._pending: list[tuple[str, List[int], asyncio.Future]] = []
+        self._matching: set[int] = set()
+        self._flush_task: asyncio.Task | None = None
+
+    def is_queued(self, player_id: int) -> bool:
+        """The method checking whether the player waits for a team.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            bool: Whether the player is queued or its team is being created.
+        """
+
+        return player_id in self._queue or player_id in self._matching
+
+    async def enqueue(self, player: Player) -> QueueTicket:
+        """The method queuing the player, creating a team if enough players of its rank wait.
+
+        Args:
+            player (Player): The player without a team.
+
+        Raises:
+            ValueError: If the player is already queued.
+
+        Returns:
+            QueueTicket: The state of the player, with its team if it was matched.
+        """
+
+        if player.id in self._matching:
+            raise ValueError(f"Player {player.id} is already queued")
+
+        members = self._queue.enqueue(player.id, player.rank)
+        if members is None:
+            return QueueTicket(player_id=player.id, status="queued")
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((player.rank, members, future))
+        self._matching.update(members)
+        if self._flush_task is None:
+            # The task outlives the request starting it, so it does not
+            # inherit its context and the query stats of the request.
+            self._flush_task = asyncio.create_task(self._flush(), context=contextvars.Context())
+
+        team = await future
+
+        return QueueTicket(player_id=player.id, status="matched", team_id=team.id)
+
+    def leave(self, player_id: int) -> bool:
+        """The method removing the player from the queue.
+
+        Args:
+            player_id (int): The id of the player.
+
+        Returns:
+            bool: Whether the player was queued.
+        """
+
+        return self._queue.remove(player_id)
+
+    def get_stats(self) -> dict:
+        """The method getting the queue depth and the time-to-match statistics.
+
+        Returns:
+            dict: The statistics of the queue, with the teams being saved.
+        """
+
+        return {
+            **self._queue.stats(),
+            "pending_teams": len(self._pending),
+        }
+
+    async def _flush(self) -> None:
+        """A private method saving the formed teams until none is pending."""
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                taken: set[int] = set()
+                try:
+                    async with database.transaction():
+                        teams = await self._team_repository.add_teams([
+                            TeamIn(name=f"{rank.strip()} #{members[0]}") for rank, members, _ in batch
+                        ])
+                        team_ids = {
+                            player_id: team.id
+                            for (_, members, _), team in zip(batch, teams)
+                            for player_id in members
+                        }
+                        assigned = set(await self._player_repository.update_players_team(team_ids))
+                        if len(assigned) < len(team_ids):
+                            taken = team_ids.keys() - assigned
+                            raise ValueError(f"Players {sorted(taken)} already have a team")
+                except Exception as e:
+                    for rank, members, future in batch:
+                        # The last member is the player whose request formed the team.
+                        self._queue.requeue([
+                            player_id for player_id in members[:-1] if player_id not in taken
+                        ], rank)
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for (_, _, future), team in zip(batch, teams):
+                        if not future.done():
+                            future.set_result(team)
+                finally:
+                    for _, members, _ in batch:
+                        self._matching.difference_update(members)
+        finally:
+            self._flush_task = None
@@ -1,7 +1,8 @@
 """Module containing player service implementation."""
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.player import Player, PlayerIn
 from tournament_matchmaker.core.repositories.i_player_repository import IPlayerRepository
 from tournament_matchmaker.core.services.i_player_service import IPlayerService
@@ -29,6 +30,41 @@ class PlayerService(IPlayerService):
 
         return await self._player_repository.get_all_players()
 
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of players from the repository.
+
+        Args:
+            limit (int): The maximal number of players on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Players on the page.
+        """
+
+        return await self._player_repository.get_players_page(limit, after)
+
+    def iterate_all(self) -> AsyncIterator[Player]:
+        """The method iterating over all players in the repository.
+
+        Returns:
+            AsyncIterator[Player]: All players, fetched lazily.
+        """
+
+        return self._player_repository.iterate_players()
+
+    async def count(self) -> int:
+        """The method counting all players in the repository.
+
+        Returns:
+            int: The number of players.
+        """
+
+        return await self._player_repository.count_players()
+
     async def get_by_id(self, player_id: int) -> Player | None:
         """The method getting player by provided id.
 
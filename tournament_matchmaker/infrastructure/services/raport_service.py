@@ -0,0 +1,58 @@
+"""Module containing raport service implementation."""
+
+from tournament_matchmaker.core.repositories.i_raport_repository import IRaportRepository
+from tournament_matchmaker.core.services.i_raport_service import IRaportService
+from tournament_matchmaker.infrastructure.cache import LRUCache
+
+
+class RaportService(IRaportService):
+    """A class implementing the raport service."""
+
+    _raport_repository: IRaportRepository
+    _caches: dict[str, LRUCache]
+
+    def __init__(
+            self,
+            raport_repository: IRaportRepository,
+            caches: dict[str, LRUCache] | None = None,
+    ) -> None:
+        """The initializer of the `raport service`.
+
+        Args:
+            repository (IRaportRepository): The reference to the repository.
+            caches (dict[str, LRUCache] | None, optional): The entity caches
+                by entity type. Defaults to None.
+        """
+        self._raport_repository = raport_repository
+        self._caches = caches or {}
+
+    async def get_summary(self, approximate: bool = False) -> dict:
+        """The method getting numbers of all entities in the repository.
+
+        Args:
+            approximate (bool, optional): Whether to use the planner
+                estimates instead of exact counts. Defaults to False.
+
+        Returns:
+            dict: The numbers of tournaments, players, teams and matches.
+        """
+
+        return await self._raport_repository.get_summary(approximate)
+
+    def get_pool_stats(self) -> dict:
+        """The method getting statistics of the data storage connection pool.
+
+        Returns:
+            dict: The pool limits, usage and acquisition wait times.
+        """
+
+        return self._raport_repository.get_pool_stats()
+
+    def get_cache_stats(self) -> dict:
+        """The method getting statistics of the entity caches.
+
+        Returns:
+            dict: The size, hits and misses of every cache by entity type.
+        """
+
+        return {name: cache.stats() for name, cache in self._caches.items()}
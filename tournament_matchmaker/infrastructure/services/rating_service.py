@@ -0,0 +1,62 @@
+"""Module containing rating service implementation."""
+
+import asyncio
+from typing import Iterable
+
+from tournament_matchmaker.core.domains.rating import TeamRating
+from tournament_matchmaker.core.rating.elo import compute_elo
+from tournament_matchmaker.core.repositories.i_rating_repository import IRatingRepository
+from tournament_matchmaker.core.services.i_rating_service import IRatingService
+
+
+class RatingService(IRatingService):
+    """A class implementing the rating service."""
+
+    _rating_repository: IRatingRepository
+
+    def __init__(self, rating_repository: IRatingRepository) -> None:
+        """The initializer of the `rating service`.
+
+        Args:
+            rating_repository (IRatingRepository): The reference to the repository.
+        """
+        self._rating_repository = rating_repository
+
+    async def get_by_team_id(self, team_id: int) -> TeamRating | None:
+        """The method getting the rating of the team.
+
+        Args:
+            team_id (int): The id of the team.
+
+        Returns:
+            TeamRating | None: The rating of the team, None if it was not rated.
+        """
+
+        return await self._rating_repository.get_by_team_id(team_id)
+
+    async def get_leaderboard(self, limit: int) -> Iterable[TeamRating]:
+        """The method getting the best rated teams.
+
+        Args:
+            limit (int): The maximal number of teams.
+
+        Returns:
+            Iterable[TeamRating]: The ratings, the best first.
+        """
+
+        return await self._rating_repository.get_leaderboard(limit)
+
+    async def recompute(self) -> int:
+        """The method recomputing ratings of all teams from the match history.
+
+        The replay runs in a worker thread, NumPy releases the GIL for
+        most of it, so the event loop keeps serving requests.
+
+        Returns:
+            int: The number of rated teams.
+        """
+
+        history = await self._rating_repository.get_match_history()
+        ratings = await asyncio.to_thread(compute_elo, history)
+
+        return await self._rating_repository.replace_ratings(ratings)
@@ -0,0 +1,42 @@
+"""Module containing standings service implementation."""
+
+from typing import Iterable
+
+from tournament_matchmaker.core.domains.standing import Standing
+from tournament_matchmaker.core.repositories.i_standings_repository import IStandingsRepository
+from tournament_matchmaker.core.services.i_standings_service import IStandingsService
+
+
+class StandingsService(IStandingsService):
+    """A class implementing the standings service."""
+
+    _standings_repository: IStandingsRepository
+
+    def __init__(self, standings_repository: IStandingsRepository) -> None:
+        """The initializer of the `standings service`.
+
+        Args:
+            standings_repository (IStandingsRepository): The reference to the repository.
+        """
+        self._standings_repository = standings_repository
+
+    async def get_by_tournament_id(self, tournament_id: int) -> Iterable[Standing]:
+        """The method getting standings of the tournament, best team first.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Iterable[Standing]: The standings of teams which played in the tournament.
+        """
+
+        return await self._standings_repository.get_by_tournament_id(tournament_id)
+
+    async def rebuild(self) -> int:
+        """The method regenerating all standings from the match history.
+
+        Returns:
+            int: The number of standings rows.
+        """
+
+        return await self._standings_repository.rebuild()
@@ -2,6 +2,7 @@
 
 from typing import Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.team import Team, TeamIn
 from tournament_matchmaker.core.repositories.i_team_repository import ITeamRepository
 from tournament_matchmaker.core.services.i_team_service import ITeamService
@@ -29,6 +30,32 @@ class TeamService(ITeamService):
 
         return await self._team_repository.get_all_teams()
 
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of teams from the repository.
+
+        Args:
+            limit (int): The maximal number of teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Teams on the page.
+        """
+
+        return await self._team_repository.get_teams_page(limit, after)
+
+    async def count(self) -> int:
+        """The method counting all teams in the repository.
+
+        Returns:
+            int: The number of teams.
+        """
+
+        return await self._team_repository.count_teams()
+
     async def get_by_id(self, team_id: int) -> Team | None:
         """The method getting team by provided id.
 
@@ -41,6 +68,30 @@ class TeamService(ITeamService):
 
         return await self._team_repository.get_by_id(team_id)
 
+    async def get_by_ids(self, team_ids: Iterable[int]) -> Iterable[Team]:
+        """The method getting teams by provided ids with a single query.
+
+        Args:
+            team_ids (Iterable[int]): The ids of the teams.
+
+        Returns:
+            Iterable[Team]: The details of the found teams, unknown ids are skipped.
+        """
+
+        return await self._team_repository.get_by_ids(team_ids)
+
+    async def get_tournament_winner(self, tournament_id: int) -> Team | None:
+        """The method getting the team with the most wins in the tournament.
+
+        Args:
+            tournament_id (int): The id of the tournament.
+
+        Returns:
+            Team | None: The winner team details.
+        """
+
+        return await self._team_repository.get_tournament_winner(tournament_id)
+
     async def add_team(self, data: TeamIn) -> Team | None:
         """The method adding new team to the data storage.
 
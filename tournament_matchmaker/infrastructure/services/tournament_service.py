@@ -2,6 +2,7 @@
 
 from typing import Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.tournament import Tournament, TournamentIn
 from tournament_matchmaker.core.repositories.i_team_repository import ITeamRepository
 from tournament_matchmaker.core.repositories.i_tournament_repository import ITournamentRepository
@@ -36,6 +37,32 @@ class TournamentService(ITournamentService):
 
         return await self._tournament_repository.get_all_tournaments()
 
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of tournaments from the repository.
+
+        Args:
+            limit (int): The maximal number of tournaments on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: Tournaments on the page.
+        """
+
+        return await self._tournament_repository.get_tournaments_page(limit, after)
+
+    async def count(self) -> int:
+        """The method counting all tournaments in the repository.
+
+        Returns:
+            int: The number of tournaments.
+        """
+
+        return await self._tournament_repository.count_tournaments()
+
     async def get_by_id(self, tournament_id: int) -> Tournament | None:
         """The method getting tournament by provided id.
 
@@ -72,7 +99,8 @@ class TournamentService(ITournamentService):
             data (TournamentIn): The details of the updated tournament.
 
         Returns:
-            Tournament | None: The updated tournament details.
+            Tournament | None: The updated tournament details, None if it does
+                not exist or its format would change after its matches.
         """
 
         return await self._tournament_repository.update_tournament(
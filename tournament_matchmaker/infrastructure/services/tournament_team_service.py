@@ -2,6 +2,7 @@
 
 from typing import Iterable
 
+from tournament_matchmaker.core.domains.page import Page
 from tournament_matchmaker.core.domains.tournament_team import TournamentTeam, TournamentTeamIn
 from tournament_matchmaker.core.repositories.i_tournament_team_repository import ITournamentTeamRepository
 from tournament_matchmaker.core.services.i_tournament_team_service import ITournamentTeamService
@@ -29,6 +30,23 @@ class TournamentTeamService(ITournamentTeamService):
 
         return await self._tournament_team_repository.get_all_tournament_teams()
 
+    async def get_page(self, limit: int, after: str | None = None) -> Page:
+        """The method getting a page of tournament_teams from the repository.
+
+        Args:
+            limit (int): The maximal number of tournament_teams on the page.
+            after (str | None, optional): The cursor of the previous page.
+                Defaults to None.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            Page: TournamentTeams on the page.
+        """
+
+        return await self._tournament_team_repository.get_tournament_teams_page(limit, after)
+
     async def get_by_tournament_id_team_id(self, tournament_id: int, team_id: int) -> TournamentTeam | None:
         """The method getting tournament_team by provided tournament_id and team_id.
 
@@ -67,13 +85,15 @@ class TournamentTeamService(ITournamentTeamService):
         return await self._tournament_team_repository.get_all_by_team_id(team_id)
 
     async def add_tournament_team(self, data: TournamentTeamIn) -> TournamentTeam | None:
-        """The method adding new tournament_team to the data storage.
+        """The method registering the team for the tournament if it has a free slot.
 
         Args:
             data (TournamentTeamIn): The details of the new tournament_team.
 
         Returns:
-            TournamentTeam | None: Full details of the newly added tournament_team.
+            TournamentTeam | None: Full details of the newly added tournament_team,
+                None if the tournament is full, unknown or started or the team
+                is unknown or already registered.
         """
 
         return await self._tournament_team_repository.add_tournament_team(data)
@@ -89,7 +109,9 @@ class TournamentTeamService(ITournamentTeamService):
             data (TeamTournamentIn): The details of the updated team_tournament.
 
         Returns:
-            Any | None: The updated tournament_team details.
+            Any | None: The updated tournament_team details, None if it does
+                not exist, one of the tournaments has started, the new one
+                is full or the team is already registered for it.
         """
 
         return await self._tournament_team_repository.update_tournament_team(
@@ -106,7 +128,7 @@ class TournamentTeamService(ITournamentTeamService):
             team_id (int): The team_id of the tournament_team.
 
         Returns:
-            bool: Success of the operation.
+            bool: Success of the operation, False if the tournament has started.
         """
 
         return await self._tournament_team_repository.delete_tournament_team(tournament_id, team_id)
@@ -0,0 +1,43 @@
+"""Module containing table version service implementation."""
+
+from typing import Iterable
+
+from tournament_matchmaker.core.repositories.i_version_repository import IVersionRepository
+from tournament_matchmaker.core.services.i_version_service import IVersionService
+
+
+class VersionService(IVersionService):
+    """A class implementing the table version service."""
+
+    _version_repository: IVersionRepository
+
+    def __init__(self, version_repository: IVersionRepository) -> None:
+        """The initializer of the `version service`.
+
+        Args:
+            version_repository (IVersionRepository): The reference to the repository.
+        """
+        self._version_repository = version_repository
+
+    async def get_etag(self, tables: Iterable[str], resource: str | None = None) -> str:
+        """The method getting an entity tag of data read from the tables.
+
+        The tag is weak, it tells the data is the same, not its bytes. A
+        tag scoped to a resource is only sent with that resource, so a
+        client holding it got the resource while the version was current.
+
+        Args:
+            tables (Iterable[str]): The names of the tables the data is read from.
+            resource (str | None, optional): The name of the single resource
+                the tag is scoped to. Defaults to None.
+
+        Returns:
+            str: The weak entity tag, changed with any write to the tables.
+        """
+
+        tables = sorted(set(tables))
+        versions = await self._version_repository.get_versions(tables)
+
+        tag = "-".join(f"{table}.{versions[table]}" for table in tables)
+
+        return f'W/"{resource}-{tag}"' if resource else f'W/"{tag}"'
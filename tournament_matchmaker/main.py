@@ -10,10 +10,18 @@ from tournament_matchmaker.api.routers.tournament import router as tournament_ro
 from tournament_matchmaker.api.routers.match import router as match_router
 from tournament_matchmaker.api.routers.tournament_team import router as tournament_team_router
 from tournament_matchmaker.api.routers.raport import router as raport_router
+from tournament_matchmaker.api.routers.rating import router as rating_router
+from tournament_matchmaker.api.routers.matchmaking import router as matchmaking_router
+from tournament_matchmaker.api.routers.job import router as job_router
+from tournament_matchmaker.api.routers.metrics import router as metrics_router
+from tournament_matchmaker.api.metrics import MetricsMiddleware
+from tournament_matchmaker.api.query_stats import QueryStatsMiddleware
 
+from tournament_matchmaker.config import config
 from tournament_matchmaker.container import Container
 from tournament_matchmaker.db import database
 from tournament_matchmaker.db import init_db
+from tournament_matchmaker.migrations.versions.v0004_table_versions import VERSIONED_TABLES
 
 container = Container()
 container.wire(modules=[
@@ -23,6 +31,9 @@ container.wire(modules=[
     "tournament_matchmaker.api.routers.match",
     "tournament_matchmaker.api.routers.tournament_team",
     "tournament_matchmaker.api.routers.raport",
+    "tournament_matchmaker.api.routers.rating",
+    "tournament_matchmaker.api.routers.matchmaking",
+    "tournament_matchmaker.api.routers.job",
 ])
 
 
@@ -30,8 +41,30 @@ container.wire(modules=[
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
     await init_db()
-    await database.connect()
+
+    # Caches of every worker are evicted on writes made by any worker.
+    listener = container.change_listener()
+    if config.TEAM_CACHE_ENABLED:
+        listener.subscribe("team", container.team_cache().evict)
+    if config.TOURNAMENT_CACHE_ENABLED:
+        listener.subscribe("tournament", container.tournament_cache().evict)
+    if config.TABLE_VERSION_CACHE_ENABLED:
+        version_cache = container.version_cache()
+        for table in VERSIONED_TABLES:
+            listener.subscribe(table, lambda _, table=table: version_cache.invalidate(table))
+    # Forecasts are simulated from the matches, any change of them
+    # makes the forecast of the tournament stale.
+    forecast_service = container.forecast_service()
+    listener.subscribe("match", forecast_service.evict, key="tournament_id")
+    await listener.start()
+    job_service = container.job_service()
+    await job_service.start()
+
     yield
+
+    await job_service.stop()
+    await listener.stop()
+    forecast_service.close()
     await database.disconnect()
 
 
@@ -42,3 +75,19 @@ app.include_router(tournament_router, prefix="/tournament")
 app.include_router(match_router, prefix="/match")
 app.include_router(tournament_team_router, prefix="/tournament_team")
 app.include_router(raport_router, prefix="/raport")
+app.include_router(rating_router, prefix="/rating")
+app.include_router(matchmaking_router, prefix="/matchmaking")
+app.include_router(job_router, prefix="/jobs")
+
+if config.QUERY_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        budget=config.QUERY_BUDGET,
+        budgets=config.QUERY_BUDGETS,
+        mode=config.QUERY_BUDGET_MODE,
+        repeat_threshold=config.QUERY_REPEAT_THRESHOLD,
+    )
+
+if config.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router, prefix="/metrics")
@@ -0,0 +1,276 @@
+"""A module providing the in-process registry of metrics.
+
+The metrics are kept in plain Python objects updated without locks, as
+everything runs in the event loop of the worker, and rendered on demand
+in the Prometheus text format. Every worker process has its own registry,
+Prometheus scrapes and sums them.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Callable, Iterable, Sequence
+
+# Upper bounds of latency buckets in seconds, from a cache hit to a
+# request which should have been a background job.
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+ROW_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1_000, 5_000, 10_000, 50_000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+GaugeCallback = Callable[[], float | dict[tuple, float]]
+
+
+class Histogram:
+    """A class representing the distribution of observed values.
+
+    An observation is a binary search among the bounds and two additions,
+    the cumulative counts are computed only when rendered.
+    """
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """The initializer of the `histogram`.
+
+        Args:
+            bounds (Sequence[float]): The sorted upper bounds of the buckets.
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """A method counting the value in its bucket.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        """The number of observed values."""
+        return sum(self.counts)
+
+
+class HistogramFamily:
+    """A class representing histograms of one metric by label values."""
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            label_names: Sequence[str],
+            buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """The initializer of the `histogram family`.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The help text of the metric.
+            label_names (Sequence[str]): The names of the labels.
+            buckets (Sequence[float], optional): The sorted upper bounds of
+                the buckets. Defaults to LATENCY_BUCKETS.
+        """
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self.children: dict[tuple, Histogram] = {}
+
+    def labels(self, *values: str) -> Histogram:
+        """A method getting the histogram of the label values, creating it once.
+
+        Args:
+            *values (str): The values of the labels, in the order of their names.
+
+        Returns:
+            Histogram: The histogram of the label values.
+        """
+        histogram = self.children.get(values)
+        if histogram is None:
+            histogram = self.children[values] = Histogram(self.buckets)
+
+        return histogram
+
+    def render(self) -> Iterable[str]:
+        """A method rendering the histograms in the text format.
+
+        Yields:
+            str: The lines of the metric.
+        """
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} histogram"
+
+        for values, histogram in self.children.items():
+            labels = _labels(self.label_names, values)
+            separator = "," if labels else ""
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), histogram.counts):
+                cumulative += count
+                yield f'{self.name}_bucket{{{labels}{separator}le="{_number(bound)}"}} {cumulative}'
+            suffix = f"{{{labels}}}" if labels else ""
+            yield f"{self.name}_sum{suffix} {_number(histogram.sum)}"
+            yield f"{self.name}_count{suffix} {cumulative}"
+
+
+class Gauge:
+    """A class representing a value read from its source when rendered."""
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            callback: GaugeCallback,
+            label_names: Sequence[str] = (),
+            kind: str = "gauge",
+    ) -> None:
+        """The initializer of the `gauge`.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The help text of the metric.
+            callback (GaugeCallback): The function reading the value, or
+                the values by label values.
+            label_names (Sequence[str], optional): The names of the labels.
+                Defaults to no labels.
+            kind (str, optional): The type of the metric, "counter" for
+                totals. Defaults to "gauge".
+        """
+        self.name = name
+        self.description = description
+        self.callback = callback
+        self.label_names = tuple(label_names)
+        self.kind = kind
+
+    def render(self) -> Iterable[str]:
+        """A method rendering the current value in the text format.
+
+        Yields:
+            str: The lines of the metric.
+        """
+        yield f"# HELP {self.name} {self.description}"
+        yield f"# TYPE {self.name} {self.kind}"
+
+        value = self.callback()
+        if not isinstance(value, dict):
+            yield f"{self.name} {_number(value)}"
+            return
+
+        for values, sample in value.items():
+            yield f"{self.name}{{{_labels(self.label_names, values)}}} {_number(sample)}"
+
+
+class MetricsRegistry:
+    """A class representing all metrics of the worker."""
+
+    def __init__(self) -> None:
+        """The initializer of the `metrics registry`."""
+        self._metrics: dict[str, HistogramFamily | Gauge] = {}
+
+    def histogram(
+            self,
+            name: str,
+            description: str,
+            label_names: Sequence[str] = (),
+            buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> HistogramFamily:
+        """A method registering the histogram, or getting it if registered.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The help text of the metric.
+            label_names (Sequence[str], optional): The names of the labels.
+                Defaults to no labels.
+            buckets (Sequence[float], optional): The sorted upper bounds of
+                the buckets. Defaults to LATENCY_BUCKETS.
+
+        Returns:
+            HistogramFamily: The histograms of the metric.
+        """
+        if name not in self._metrics:
+            self._metrics[name] = HistogramFamily(name, description, label_names, buckets)
+
+        return self._metrics[name]  # type: ignore
+
+    def gauge(
+            self,
+            name: str,
+            description: str,
+            callback: GaugeCallback,
+            label_names: Sequence[str] = (),
+            kind: str = "gauge",
+    ) -> Gauge:
+        """A method registering the gauge read by the callback.
+
+        Args:
+            name (str): The name of the metric.
+            description (str): The help text of the metric.
+            callback (GaugeCallback): The function reading the value.
+            label_names (Sequence[str], optional): The names of the labels.
+                Defaults to no labels.
+            kind (str, optional): The type of the metric. Defaults to "gauge".
+
+        Returns:
+            Gauge: The registered gauge.
+        """
+        gauge = self._metrics[name] = Gauge(name, description, callback, label_names, kind)
+
+        return gauge
+
+    def render(self) -> str:
+        """A method rendering all metrics in the Prometheus text format.
+
+        Returns:
+            str: The exposition of the metrics.
+        """
+        lines = [line for metric in self._metrics.values() for line in metric.render()]
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(names: Sequence[str], values: Sequence[object]) -> str:
+    """A private function formatting the label pairs of a sample.
+
+    Args:
+        names (Sequence[str]): The names of the labels.
+        values (Sequence[object]): The values of the labels.
+
+    Returns:
+        str: The comma separated pairs with escaped values.
+    """
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _escape(value: object) -> str:
+    """A private function escaping the label value as the text format requires.
+
+    Args:
+        value (object): The label value.
+
+    Returns:
+        str: The value with backslashes, quotes and new lines escaped.
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    """A private function formatting the value of a sample.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        str: The value, with infinities spelled as in the text format.
+    """
+    if value == math.inf:
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,72 @@
+"""A module providing versioned schema migrations.
+
+Every migration is applied once, in the order of its version, inside
+the transaction of the upgrade. Applied versions are recorded in the
+`schema_migration` table, so an existing database is upgraded in place.
+A fresh database gets its tables from the metadata and then runs every
+migration too, as triggers and functions exist only in the migrations,
+so their statements must also succeed on the tables just created.
+"""
+
+from databases import Database
+from sqlalchemy import MetaData
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from tournament_matchmaker.migrations.versions import MIGRATIONS
+
+MIGRATIONS_LOCK_KEY = 7_311_520_471
+
+
+async def migrate(database: Database, metadata: MetaData) -> list[int]:
+    """Function creating missing tables and applying all pending migrations.
+
+    Everything runs in a single transaction on one pooled connection.
+    An advisory lock serializes concurrent upgrades started by several
+    workers, the lock is released with the end of the transaction.
+
+    Args:
+        database (Database): The connected database.
+        metadata (MetaData): The metadata describing the current schema.
+
+    Returns:
+        list[int]: The versions applied by this call.
+    """
+    dialect = postgresql.dialect()
+    applied_now = []
+
+    async with database.connection() as connection:
+        conn = connection.raw_connection
+
+        async with conn.transaction():
+            await conn.execute(f"SELECT pg_advisory_xact_lock({MIGRATIONS_LOCK_KEY})")
+
+            for table in metadata.sorted_tables:
+                await conn.execute(str(CreateTable(table, if_not_exists=True).compile(dialect=dialect)))
+
+                for index in table.indexes:
+                    await conn.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect)))
+
+            await conn.execute(
+                "CREATE TABLE IF NOT EXISTS schema_migration ("
+                "version INTEGER PRIMARY KEY, "
+                "description VARCHAR NOT NULL, "
+                "applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now())"
+            )
+            applied = {row["version"] for row in await conn.fetch("SELECT version FROM schema_migration")}
+
+            for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+                if migration.version in applied:
+                    continue
+
+                for statement in migration.statements:
+                    await conn.execute(statement)
+
+                await conn.execute(
+                    "INSERT INTO schema_migration (version, description) VALUES ($1, $2)",
+                    migration.version,
+                    migration.description,
+                )
+                applied_now.append(migration.version)
+
+    return applied_now
@@ -0,0 +1,10 @@
+"""A module containing the schema migration model."""
+
+from typing import NamedTuple, Sequence
+
+
+class Migration(NamedTuple):
+    """A class representing a single schema migration."""
+    version: int
+    description: str
+    statements: Sequence[str]
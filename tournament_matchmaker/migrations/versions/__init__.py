@@ -0,0 +1,29 @@
+"""A module registering all schema migrations in order."""
+
+from tournament_matchmaker.migrations.versions import (
+    v0001_keys_and_indexes,
+    v0002_tournament_teams_count,
+    v0003_entity_change_notifications,
+    v0004_table_versions,
+    v0005_standings,
+    v0006_team_rating,
+    v0007_tournament_format,
+    v0008_bracket,
+    v0009_match_date_index,
+    v0010_job,
+    v0011_standings_lock_order,
+)
+
+MIGRATIONS = [
+    v0001_keys_and_indexes.migration,
+    v0002_tournament_teams_count.migration,
+    v0003_entity_change_notifications.migration,
+    v0004_table_versions.migration,
+    v0005_standings.migration,
+    v0006_team_rating.migration,
+    v0007_tournament_format.migration,
+    v0008_bracket.migration,
+    v0009_match_date_index.migration,
+    v0010_job.migration,
+    v0011_standings_lock_order.migration,
+]
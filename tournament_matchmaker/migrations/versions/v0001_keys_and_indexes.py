@@ -0,0 +1,38 @@
+"""Migration adding the tournament_team primary key and lookup indexes."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=1,
+    description="tournament_team primary key, foreign key and name indexes",
+    statements=[
+        # Duplicated registrations would make the primary key fail.
+        """
+        DELETE FROM tournament_team a
+        USING tournament_team b
+        WHERE a.ctid < b.ctid
+          AND a.tournament_id = b.tournament_id
+          AND a.team_id = b.team_id
+        """,
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE conrelid = 'tournament_team'::regclass AND contype = 'p'
+            ) THEN
+                ALTER TABLE tournament_team ADD PRIMARY KEY (tournament_id, team_id);
+            END IF;
+        END
+        $$
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_tournament_team_team_id ON tournament_team (team_id)",
+        "CREATE INDEX IF NOT EXISTS ix_match_tournament_id ON match (tournament_id)",
+        "CREATE INDEX IF NOT EXISTS ix_match_team1_id ON match (team1_id)",
+        "CREATE INDEX IF NOT EXISTS ix_match_team2_id ON match (team2_id)",
+        "CREATE INDEX IF NOT EXISTS ix_player_team_id ON player (team_id)",
+        "CREATE INDEX IF NOT EXISTS ix_player_name_id ON player (name, id)",
+        "CREATE INDEX IF NOT EXISTS ix_team_name_id ON team (name, id)",
+        "CREATE INDEX IF NOT EXISTS ix_tournament_name_id ON tournament (name, id)",
+    ],
+)
@@ -0,0 +1,36 @@
+"""Migration adding the counter of teams registered for a tournament."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=2,
+    description="tournament.teams_count maintained by a tournament_team trigger",
+    statements=[
+        "ALTER TABLE tournament ADD COLUMN IF NOT EXISTS teams_count INTEGER NOT NULL DEFAULT 0",
+        """
+        UPDATE tournament t
+        SET teams_count = (
+            SELECT count(*) FROM tournament_team tt WHERE tt.tournament_id = t.id
+        )
+        """,
+        """
+        CREATE OR REPLACE FUNCTION tournament_team_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE tournament SET teams_count = teams_count - 1 WHERE id = OLD.tournament_id;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                UPDATE tournament SET teams_count = teams_count + 1 WHERE id = NEW.tournament_id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS tournament_team_count ON tournament_team",
+        """
+        CREATE TRIGGER tournament_team_count
+        AFTER INSERT OR DELETE OR UPDATE OF tournament_id ON tournament_team
+        FOR EACH ROW EXECUTE FUNCTION tournament_team_count()
+        """,
+    ],
+)
@@ -0,0 +1,60 @@
+"""Migration publishing entity changes with `pg_notify`."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=3,
+    description="entity_change notifications of team, tournament, match and tournament_team",
+    statements=[
+        # The payload carries only the key columns given as trigger
+        # arguments, a NOTIFY payload is limited to 8000 bytes.
+        """
+        CREATE OR REPLACE FUNCTION notify_entity_change() RETURNS trigger AS $$
+        DECLARE
+            old_keys jsonb;
+            new_keys jsonb;
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                SELECT jsonb_object_agg(key, value) INTO old_keys
+                FROM jsonb_each(to_jsonb(OLD)) WHERE key = ANY(TG_ARGV);
+                PERFORM pg_notify('entity_change', jsonb_build_object(
+                    'table', TG_TABLE_NAME, 'op', TG_OP, 'keys', old_keys)::text);
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                SELECT jsonb_object_agg(key, value) INTO new_keys
+                FROM jsonb_each(to_jsonb(NEW)) WHERE key = ANY(TG_ARGV);
+                IF old_keys IS DISTINCT FROM new_keys THEN
+                    PERFORM pg_notify('entity_change', jsonb_build_object(
+                        'table', TG_TABLE_NAME, 'op', TG_OP, 'keys', new_keys)::text);
+                END IF;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS team_notify_change ON team",
+        """
+        CREATE TRIGGER team_notify_change
+        AFTER INSERT OR UPDATE OR DELETE ON team
+        FOR EACH ROW EXECUTE FUNCTION notify_entity_change('id')
+        """,
+        "DROP TRIGGER IF EXISTS tournament_notify_change ON tournament",
+        """
+        CREATE TRIGGER tournament_notify_change
+        AFTER INSERT OR UPDATE OR DELETE ON tournament
+        FOR EACH ROW EXECUTE FUNCTION notify_entity_change('id')
+        """,
+        "DROP TRIGGER IF EXISTS match_notify_change ON match",
+        """
+        CREATE TRIGGER match_notify_change
+        AFTER INSERT OR UPDATE OR DELETE ON match
+        FOR EACH ROW EXECUTE FUNCTION notify_entity_change('id', 'tournament_id')
+        """,
+        "DROP TRIGGER IF EXISTS tournament_team_notify_change ON tournament_team",
+        """
+        CREATE TRIGGER tournament_team_notify_change
+        AFTER INSERT OR UPDATE OR DELETE ON tournament_team
+        FOR EACH ROW EXECUTE FUNCTION notify_entity_change('tournament_id', 'team_id')
+        """,
+    ],
+)
@@ -0,0 +1,46 @@
+"""Migration adding change counters of the entity tables."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+# The tables whose counters are bumped by triggers.
+VERSIONED_TABLES = ("team", "player", "tournament", "match", "tournament_team")
+
+migration = Migration(
+    version=4,
+    description="table_version counters bumped by statement triggers",
+    statements=[
+        """
+        CREATE TABLE IF NOT EXISTS table_version (
+            table_name VARCHAR PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        )
+        """,
+        f"""
+        INSERT INTO table_version (table_name)
+        VALUES {", ".join(f"('{table}')" for table in VERSIONED_TABLES)}
+        ON CONFLICT (table_name) DO NOTHING
+        """,
+        # The counter is bumped in the writing transaction, so a new
+        # version is never visible before the data it stands for.
+        """
+        CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_version SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        *(
+            statement
+            for table in VERSIONED_TABLES
+            for statement in (
+                f"DROP TRIGGER IF EXISTS {table}_bump_version ON {table}",
+                f"""
+                CREATE TRIGGER {table}_bump_version
+                AFTER INSERT OR UPDATE OR DELETE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+                """,
+            )
+        ),
+    ],
+)
@@ -0,0 +1,110 @@
+"""Migration adding standings maintained incrementally from matches."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+# A match with no score or scored 0:0 is a scheduled, not yet played one.
+PLAYED = (
+    "team1_score IS NOT NULL AND team2_score IS NOT NULL"
+    " AND (team1_score <> 0 OR team2_score <> 0)"
+)
+
+migration = Migration(
+    version=5,
+    description="standings of teams in tournaments kept by a match trigger",
+    statements=[
+        """
+        CREATE TABLE IF NOT EXISTS standings (
+            tournament_id INTEGER NOT NULL,
+            team_id INTEGER NOT NULL,
+            played INTEGER NOT NULL DEFAULT 0,
+            wins INTEGER NOT NULL DEFAULT 0,
+            draws INTEGER NOT NULL DEFAULT 0,
+            losses INTEGER NOT NULL DEFAULT 0,
+            score_for INTEGER NOT NULL DEFAULT 0,
+            score_against INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (tournament_id, team_id)
+        )
+        """,
+        """
+        CREATE OR REPLACE FUNCTION apply_match_to_standings(m match, sign INTEGER) RETURNS void AS $$
+        BEGIN
+            IF m.team1_score IS NULL OR m.team2_score IS NULL
+               OR (m.team1_score = 0 AND m.team2_score = 0) THEN
+                RETURN;
+            END IF;
+
+            INSERT INTO standings AS s (
+                tournament_id, team_id, played, wins, draws, losses, score_for, score_against
+            )
+            VALUES
+                (m.tournament_id, m.team1_id, sign,
+                 sign * (m.team1_score > m.team2_score)::int,
+                 sign * (m.team1_score = m.team2_score)::int,
+                 sign * (m.team1_score < m.team2_score)::int,
+                 sign * m.team1_score, sign * m.team2_score),
+                (m.tournament_id, m.team2_id, sign,
+                 sign * (m.team2_score > m.team1_score)::int,
+                 sign * (m.team2_score = m.team1_score)::int,
+                 sign * (m.team2_score < m.team1_score)::int,
+                 sign * m.team2_score, sign * m.team1_score)
+            ON CONFLICT (tournament_id, team_id) DO UPDATE SET
+                played = s.played + EXCLUDED.played,
+                wins = s.wins + EXCLUDED.wins,
+                draws = s.draws + EXCLUDED.draws,
+                losses = s.losses + EXCLUDED.losses,
+                score_for = s.score_for + EXCLUDED.score_for,
+                score_against = s.score_against + EXCLUDED.score_against;
+
+            DELETE FROM standings
+            WHERE tournament_id = m.tournament_id
+              AND team_id IN (m.team1_id, m.team2_id)
+              AND played = 0;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE OR REPLACE FUNCTION match_update_standings() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM apply_match_to_standings(OLD, -1);
+            END IF;
+            IF TG_OP IN ('UPDATE', 'INSERT') THEN
+                PERFORM apply_match_to_standings(NEW, 1);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS match_update_standings ON match",
+        """
+        CREATE TRIGGER match_update_standings
+        AFTER INSERT OR DELETE
+           OR UPDATE OF tournament_id, team1_id, team2_id, team1_score, team2_score
+        ON match
+        FOR EACH ROW EXECUTE FUNCTION match_update_standings()
+        """,
+        "DELETE FROM standings",
+        f"""
+        INSERT INTO standings (
+            tournament_id, team_id, played, wins, draws, losses, score_for, score_against
+        )
+        SELECT
+            tournament_id,
+            team_id,
+            count(*),
+            count(*) FILTER (WHERE scored > conceded),
+            count(*) FILTER (WHERE scored = conceded),
+            count(*) FILTER (WHERE scored < conceded),
+            sum(scored),
+            sum(conceded)
+        FROM (
+            SELECT tournament_id, team1_id AS team_id, team1_score AS scored, team2_score AS conceded
+            FROM match WHERE {PLAYED}
+            UNION ALL
+            SELECT tournament_id, team2_id, team2_score, team1_score
+            FROM match WHERE {PLAYED}
+        ) sides
+        GROUP BY tournament_id, team_id
+        """,
+    ],
+)
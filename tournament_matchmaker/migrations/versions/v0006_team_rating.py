@@ -0,0 +1,18 @@
+"""Migration adding Elo ratings of teams."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=6,
+    description="team_rating computed from the match history",
+    statements=[
+        """
+        CREATE TABLE IF NOT EXISTS team_rating (
+            team_id INTEGER PRIMARY KEY,
+            rating DOUBLE PRECISION NOT NULL,
+            matches INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_team_rating_rating ON team_rating (rating DESC, team_id)",
+    ],
+)
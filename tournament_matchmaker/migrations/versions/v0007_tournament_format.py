@@ -0,0 +1,15 @@
+"""Migration adding formats of tournaments and rounds of matches."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=7,
+    description="tournament.format and match.round for round by round formats",
+    statements=[
+        "ALTER TABLE tournament ADD COLUMN IF NOT EXISTS format VARCHAR NOT NULL DEFAULT 'round_robin'",
+        "ALTER TABLE match ADD COLUMN IF NOT EXISTS round INTEGER",
+        # Not declared in the metadata, as the tables are created before
+        # the migrations and the column may not exist yet.
+        "CREATE INDEX IF NOT EXISTS ix_match_tournament_id_round ON match (tournament_id, round)",
+    ],
+)
@@ -0,0 +1,21 @@
+"""Migration adding the state of elimination brackets."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=8,
+    description="bracket of elimination tournaments stored as one row of arrays",
+    statements=[
+        """
+        CREATE TABLE IF NOT EXISTS bracket (
+            tournament_id INTEGER PRIMARY KEY,
+            double BOOLEAN NOT NULL,
+            size INTEGER NOT NULL,
+            slots INTEGER[] NOT NULL,
+            winners INTEGER[] NOT NULL,
+            match_ids INTEGER[] NOT NULL,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+    ],
+)
@@ -0,0 +1,11 @@
+"""Migration adding the index of matches by date."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=9,
+    description="index of matches by date for the matches of a day",
+    statements=[
+        "CREATE INDEX IF NOT EXISTS ix_match_match_date ON match (match_date)",
+    ],
+)
@@ -0,0 +1,27 @@
+"""Migration adding the table of background jobs."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=10,
+    description="background jobs with their status, progress and result",
+    statements=[
+        """
+        CREATE TABLE IF NOT EXISTS job (
+            id SERIAL PRIMARY KEY,
+            kind VARCHAR NOT NULL,
+            status VARCHAR NOT NULL DEFAULT 'queued',
+            params JSONB NOT NULL DEFAULT '{}',
+            progress INTEGER NOT NULL DEFAULT 0,
+            total INTEGER,
+            result JSONB,
+            error VARCHAR,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            started_at TIMESTAMPTZ,
+            updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            finished_at TIMESTAMPTZ
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_job_status_id ON job (status, id)",
+    ],
+)
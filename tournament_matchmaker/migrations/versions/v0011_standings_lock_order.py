@@ -0,0 +1,50 @@
+"""Migration updating the standings of both teams of a match in the order of their ids."""
+
+from tournament_matchmaker.migrations.migration import Migration
+
+migration = Migration(
+    version=11,
+    description="standings rows of a match locked in the order of team ids",
+    statements=[
+        # Two matches of the same teams, written in opposite team1/team2
+        # order, would lock their standings rows in opposite order and
+        # deadlock. The rows are upserted sorted by team id instead.
+        """
+        CREATE OR REPLACE FUNCTION apply_match_to_standings(m match, sign INTEGER) RETURNS void AS $$
+        BEGIN
+            IF m.team1_score IS NULL OR m.team2_score IS NULL
+               OR (m.team1_score = 0 AND m.team2_score = 0) THEN
+                RETURN;
+            END IF;
+
+            INSERT INTO standings AS s (
+                tournament_id, team_id, played, wins, draws, losses, score_for, score_against
+            )
+            SELECT m.tournament_id, side.team_id, sign,
+                   sign * (side.scored > side.conceded)::int,
+                   sign * (side.scored = side.conceded)::int,
+                   sign * (side.scored < side.conceded)::int,
+                   sign * side.scored, sign * side.conceded
+            FROM (
+                VALUES
+                    (m.team1_id, m.team1_score, m.team2_score),
+                    (m.team2_id, m.team2_score, m.team1_score)
+            ) AS side (team_id, scored, conceded)
+            ORDER BY side.team_id
+            ON CONFLICT (tournament_id, team_id) DO UPDATE SET
+                played = s.played + EXCLUDED.played,
+                wins = s.wins + EXCLUDED.wins,
+                draws = s.draws + EXCLUDED.draws,
+                losses = s.losses + EXCLUDED.losses,
+                score_for = s.score_for + EXCLUDED.score_for,
+                score_against = s.score_against + EXCLUDED.score_against;
+
+            DELETE FROM standings
+            WHERE tournament_id = m.tournament_id
+              AND team_id IN (m.team1_id, m.team2_id)
+              AND played = 0;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+    ],
+)